@@ -13,7 +13,7 @@ from typing import List, Dict, Any, Optional
 
 from ..schema import (
     Document, Table, TableCell, TextBlock, ExtractionMethod,
-    BoundingBox, Provenance
+    BoundingBox
 )
 from ..provenance import create_provenance, create_bbox_from_dict, normalize_confidence
 from ..utils.timers import time_operation
@@ -326,7 +326,7 @@ class AdobeExtractAdapter:
                 if 'FontName' in attrs:
                     font_info['font_name'] = attrs['FontName']
 
-            provenance = Provenance(
+            provenance = create_provenance(
                 method=self.method,
                 page=page_num,
                 bbox=bbox,
@@ -389,7 +389,7 @@ class AdobeExtractAdapter:
                     row_idx=0,
                     col_idx=0,
                     is_header=False,
-                    provenance=Provenance(
+                    provenance=create_provenance(
                         method=self.method,
                         page=page_num,
                         bbox=bbox,
@@ -414,7 +414,7 @@ class AdobeExtractAdapter:
                 cols=max_col,
                 cells=table_cells,
                 page_number=page_num,
-                provenance=Provenance(
+                provenance=create_provenance(
                     method=self.method,
                     page=page_num,
                     bbox=bbox,
@@ -468,7 +468,7 @@ class AdobeExtractAdapter:
                 row_idx=row_idx,
                 col_idx=col_idx,
                 is_header=is_header,
-                provenance=Provenance(
+                provenance=create_provenance(
                     method=self.method,
                     page=page_num,
                     bbox=bbox,
@@ -7,11 +7,14 @@ import os
 import json
 import logging
 import io
+import time
+import uuid
 from pathlib import Path
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, ClassVar, Tuple, Iterator
 from dataclasses import dataclass
 
-from ..schema import Document, TextBlock, Table, TableCell, ExtractionMethod
+from ..schema import Document, TextBlock, Table, TableCell, ExtractionMethod, BoundingBox
+from ..provenance import create_provenance, create_bbox_from_coords
 from ..utils.logging import setup_logging
 
 logger = setup_logging(__name__)
@@ -32,6 +35,15 @@ except ImportError:
     logger.warning("PyMuPDF not available. Multi-page PDF handling will be limited. Install with: pip install PyMuPDF")
 
 
+# Synchronous APIs reject documents above ~10MB; switch to async well before that
+SYNC_SIZE_LIMIT = 5 * 1024 * 1024
+
+# Polling schedule for asynchronous Textract jobs (seconds)
+ASYNC_POLL_INITIAL_DELAY = 1.0
+ASYNC_POLL_MAX_DELAY = 10.0
+ASYNC_JOB_TIMEOUT = 900.0
+
+
 @dataclass
 class TextractMethod:
     """Enumeration of Textract methods."""
@@ -42,10 +54,15 @@ class TextractMethod:
 class AmazonTextractAdapter:
     """Adapter for Amazon Textract APIs."""
 
+    # boto3 clients are thread-safe; share them (and their HTTPS connection
+    # pools) across adapter instances using the same credentials and region
+    _clients: ClassVar[Dict[Tuple[str, str, str, str], Any]] = {}
+
     def __init__(self, method: str = TextractMethod.DETECT_TEXT, 
                  aws_access_key_id: Optional[str] = None,
                  aws_secret_access_key: Optional[str] = None,
-                 aws_region: Optional[str] = None):
+                 aws_region: Optional[str] = None,
+                 s3_bucket: Optional[str] = None):
         """
         Initialize Amazon Textract adapter.
 
@@ -54,6 +71,9 @@ class AmazonTextractAdapter:
             aws_access_key_id: AWS access key ID (overrides environment variable)
             aws_secret_access_key: AWS secret access key (overrides environment variable)
             aws_region: AWS region (overrides environment variable)
+            s3_bucket: S3 bucket for asynchronous multi-page jobs (overrides
+                AWS_TEXTRACT_S3_BUCKET); without one, only the first page of
+                multi-page PDFs is processed
         """
         if not TEXTRACT_AVAILABLE:
             raise RuntimeError("Amazon Textract dependencies not installed. Install with: pip install boto3")
@@ -62,6 +82,7 @@ class AmazonTextractAdapter:
         self.aws_access_key_id = aws_access_key_id
         self.aws_secret_access_key = aws_secret_access_key
         self.aws_region = aws_region
+        self.s3_bucket = s3_bucket or os.getenv('AWS_TEXTRACT_S3_BUCKET')
         
         # Set extraction method based on Textract method
         if method == TextractMethod.DETECT_TEXT:
@@ -84,26 +105,54 @@ class AmazonTextractAdapter:
             if not aws_access_key_id or not aws_secret_access_key:
                 raise ValueError("AWS credentials not found. Please provide AWS_ACCESS_KEY_ID and AWS_SECRET_ACCESS_KEY")
             
-            # Create Textract client
-            self.client = boto3.client(
-                'textract',
-                aws_access_key_id=aws_access_key_id,
-                aws_secret_access_key=aws_secret_access_key,
-                region_name=aws_region
+            # Create (or reuse) Textract client
+            self.client = self._get_client(
+                'textract', aws_access_key_id, aws_secret_access_key, aws_region
             )
             
+            # S3 client is only needed to stage documents for async jobs
+            self.s3_client = None
+            if self.s3_bucket:
+                self.s3_client = self._get_client(
+                    's3', aws_access_key_id, aws_secret_access_key, aws_region
+                )
+            
             logger.info(f"Amazon Textract client initialized for method: {self.method_type}")
             
         except Exception as e:
             logger.error(f"Failed to setup Amazon Textract client: {e}")
             raise
 
-    def extract(self, pdf_path: Path, pages: Optional[List[int]] = None, **kwargs) -> Document:
+    @classmethod
+    def _get_client(cls, service: str, aws_access_key_id: str,
+                    aws_secret_access_key: str, aws_region: str) -> Any:
+        """Return a cached boto3 client for a service, creating it on first use."""
+        key = (service, aws_access_key_id, aws_secret_access_key, aws_region)
+        client = cls._clients.get(key)
+        if client is None:
+            client = boto3.client(
+                service,
+                aws_access_key_id=aws_access_key_id,
+                aws_secret_access_key=aws_secret_access_key,
+                region_name=aws_region
+            )
+            cls._clients[key] = client
+        return client
+
+    def extract(
+        self,
+        pdf_path: Path,
+        pages: Optional[List[int]] = None,
+        min_confidence: float = 0.0,
+        **kwargs
+    ) -> Document:
         """
         Extract content from PDF using Amazon Textract.
 
         Args:
             pdf_path: Path to the PDF file
+            pages: List of page numbers (not supported by Textract)
+            min_confidence: Minimum confidence threshold (0-1)
 
         Returns:
             Document object with extracted content
@@ -111,6 +160,17 @@ class AmazonTextractAdapter:
         try:
             logger.info(f"Starting Amazon Textract extraction: {pdf_path}")
 
+            # Multi-page or large PDFs go through the asynchronous S3-based APIs
+            if self._should_use_async(pdf_path):
+                response = self._run_async_job(pdf_path)
+                document = self._parse_textract_response(
+                    response, pdf_path, min_confidence=min_confidence
+                )
+                document.extraction_metadata['textract_api'] = 'async'
+
+                logger.info(f"Amazon Textract extraction completed: {len(document.text_blocks)} text blocks, {len(document.tables)} tables")
+                return document
+
             # Check if PDF is multi-page and convert to single page if needed
             pdf_bytes, is_multipage, original_page_count = self._prepare_pdf_for_textract(pdf_path)
 
@@ -123,7 +183,9 @@ class AmazonTextractAdapter:
                 raise ValueError(f"Unknown method: {self.method_type}")
 
             # Parse response into Document
-            document = self._parse_textract_response(response, pdf_path, is_multipage, original_page_count)
+            document = self._parse_textract_response(
+                response, pdf_path, is_multipage, original_page_count, min_confidence
+            )
 
             logger.info(f"Amazon Textract extraction completed: {len(document.text_blocks)} text blocks, {len(document.tables)} tables")
             return document
@@ -153,44 +215,127 @@ class AmazonTextractAdapter:
         Returns:
             tuple: (pdf_bytes, is_multipage, original_page_count)
         """
+        # Read the file once; PyMuPDF parses the same buffer instead of the path
+        with open(pdf_path, 'rb') as file:
+            pdf_bytes = file.read()
+
+        if not PYMUPDF_AVAILABLE:
+            # PyMuPDF not available - send as-is and let Textract handle the error
+            logger.warning("PyMuPDF not available. Cannot detect multi-page PDFs. If this is a multi-page PDF, extraction may fail.")
+            return pdf_bytes, False, 1
+
         try:
-            # First, try to get page count using PyMuPDF if available
-            if PYMUPDF_AVAILABLE:
-                doc = fitz.open(pdf_path)
+            with fitz.open(stream=pdf_bytes, filetype='pdf') as doc:
                 page_count = len(doc)
 
                 if page_count == 1:
-                    # Single page - read normally
-                    doc.close()
-                    with open(pdf_path, 'rb') as file:
-                        return file.read(), False, 1
-                else:
-                    # Multi-page - extract first page only
-                    logger.warning(f"Multi-page PDF detected ({page_count} pages). Amazon Textract synchronous APIs only support single-page documents. Extracting first page only.")
+                    # Single page - send the original bytes
+                    return pdf_bytes, False, 1
 
-                    # Create new PDF with only first page
-                    new_doc = fitz.open()
+                # Multi-page - extract first page only
+                logger.warning(f"Multi-page PDF detected ({page_count} pages). Amazon Textract synchronous APIs only support single-page documents. Extracting first page only.")
+
+                # Create new PDF with only first page
+                with fitz.open() as new_doc:
                     new_doc.insert_pdf(doc, from_page=0, to_page=0)
+                    return new_doc.tobytes(), True, page_count
 
-                    # Convert to bytes
-                    pdf_bytes = new_doc.tobytes()
+        except Exception as e:
+            logger.warning(f"Error preparing PDF for Textract: {e}. Sending PDF as-is.")
+            return pdf_bytes, False, 1
 
-                    # Clean up
-                    doc.close()
-                    new_doc.close()
+    def _should_use_async(self, pdf_path: Path) -> bool:
+        """Use the asynchronous APIs for large or multi-page PDFs when an S3 bucket is configured."""
+        if not self.s3_bucket:
+            return False
 
-                    return pdf_bytes, True, page_count
-            else:
-                # PyMuPDF not available - read normally and let Textract handle the error
-                logger.warning("PyMuPDF not available. Cannot detect multi-page PDFs. If this is a multi-page PDF, extraction may fail.")
-                with open(pdf_path, 'rb') as file:
-                    return file.read(), False, 1
+        if os.path.getsize(pdf_path) > SYNC_SIZE_LIMIT:
+            return True
 
-        except Exception as e:
-            logger.warning(f"Error preparing PDF for Textract: {e}. Reading PDF normally.")
-            # Fallback to normal reading
-            with open(pdf_path, 'rb') as file:
-                return file.read(), False, 1
+        if PYMUPDF_AVAILABLE:
+            try:
+                with fitz.open(pdf_path) as doc:
+                    return len(doc) > 1
+            except Exception as e:
+                logger.warning(f"Could not determine page count for {pdf_path}: {e}")
+
+        return False
+
+    def _run_async_job(self, pdf_path: Path) -> Dict[str, Any]:
+        """
+        Process a PDF with StartDocumentAnalysis / StartDocumentTextDetection.
+
+        The PDF is streamed to S3 and the job is polled with exponential
+        backoff. Result pages are fetched lazily while the blocks are parsed,
+        so the raw pages are never all held at once.
+
+        Returns:
+            Response dict with 'DocumentMetadata' and a 'Blocks' iterator
+        """
+        s3_key = f"pdfx-bench/{uuid.uuid4().hex}/{pdf_path.name}"
+        with open(pdf_path, 'rb') as file:
+            self.s3_client.upload_fileobj(file, self.s3_bucket, s3_key)
+        logger.info(f"Uploaded {pdf_path.name} to s3://{self.s3_bucket}/{s3_key} for asynchronous Textract processing")
+
+        try:
+            location = {'S3Object': {'Bucket': self.s3_bucket, 'Name': s3_key}}
+            if self.method_type == TextractMethod.ANALYZE_DOCUMENT:
+                job = self.client.start_document_analysis(
+                    DocumentLocation=location,
+                    FeatureTypes=['TABLES', 'FORMS']
+                )
+                get_results = self.client.get_document_analysis
+            else:
+                job = self.client.start_document_text_detection(DocumentLocation=location)
+                get_results = self.client.get_document_text_detection
+
+            job_id = job['JobId']
+            response = self._wait_for_job(get_results, job_id)
+
+            # Results are served by Textract, so the S3 copy can go as soon
+            # as the job has finished
+            return {
+                'Blocks': self._iter_blocks(get_results, job_id, response),
+                'DocumentMetadata': response.get('DocumentMetadata', {})
+            }
+        finally:
+            try:
+                self.s3_client.delete_object(Bucket=self.s3_bucket, Key=s3_key)
+            except Exception as e:
+                logger.warning(f"Failed to delete s3://{self.s3_bucket}/{s3_key}: {e}")
+
+    def _iter_blocks(self, get_results: Any, job_id: str, first_page: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+        """Yield blocks across all result pages of a job, fetching each page on demand."""
+        page = first_page
+        while True:
+            yield from page.get('Blocks', ())
+            next_token = page.get('NextToken')
+            if not next_token:
+                return
+            page = get_results(JobId=job_id, NextToken=next_token)
+
+    def _wait_for_job(self, get_results: Any, job_id: str) -> Dict[str, Any]:
+        """Poll an asynchronous Textract job until it finishes; returns the first result page."""
+        delay = ASYNC_POLL_INITIAL_DELAY
+        deadline = time.monotonic() + ASYNC_JOB_TIMEOUT
+
+        while True:
+            response = get_results(JobId=job_id)
+            status = response.get('JobStatus')
+
+            if status == 'SUCCEEDED':
+                return response
+            if status == 'PARTIAL_SUCCESS':
+                logger.warning(f"Textract job {job_id} partially succeeded: {response.get('StatusMessage')}")
+                return response
+            if status == 'FAILED':
+                raise RuntimeError(f"Textract job {job_id} failed: {response.get('StatusMessage')}")
+
+            if time.monotonic() + delay > deadline:
+                raise TimeoutError(f"Textract job {job_id} did not finish within {ASYNC_JOB_TIMEOUT:.0f}s")
+
+            time.sleep(delay)
+            delay = min(delay * 2, ASYNC_POLL_MAX_DELAY)
 
     def _detect_document_text(self, pdf_bytes: bytes) -> Dict[str, Any]:
         """Call DetectDocumentText API."""
@@ -221,35 +366,35 @@ class AmazonTextractAdapter:
             logger.error(f"AnalyzeDocument failed: {e}")
             raise
 
-    def _parse_textract_response(self, response: Dict[str, Any], pdf_path: Path, is_multipage: bool = False, original_page_count: int = 1) -> Document:
+    def _parse_textract_response(self, response: Dict[str, Any], pdf_path: Path, is_multipage: bool = False, original_page_count: int = 1, min_confidence: float = 0.0) -> Document:
         """Parse Textract response into Document object."""
-        blocks = response.get('Blocks', [])
+        blocks = response.get('Blocks', [])  # List, or an iterator for async jobs
         document_metadata = response.get('DocumentMetadata', {})
         page_count = document_metadata.get('Pages', 1)
         
-        # Group blocks by type
+        # Index blocks by id and bucket them by type in a single pass
         blocks_by_type = {}
         blocks_by_id = {}
         
         for block in blocks:
+            blocks_by_id[block['Id']] = block
             block_type = block['BlockType']
-            block_id = block['Id']
-            
-            if block_type not in blocks_by_type:
-                blocks_by_type[block_type] = []
-            blocks_by_type[block_type].append(block)
-            blocks_by_id[block_id] = block
+            bucket = blocks_by_type.get(block_type)
+            if bucket is None:
+                blocks_by_type[block_type] = [block]
+            else:
+                bucket.append(block)
         
         # Extract text blocks (from LINE blocks)
-        text_blocks = self._extract_text_blocks(blocks_by_type.get('LINE', []))
+        text_blocks = self._extract_text_blocks(blocks_by_type.get('LINE', []), min_confidence)
         
         # Extract tables (from TABLE and CELL blocks)
-        tables = self._extract_tables(blocks_by_type, blocks_by_id)
+        tables = self._extract_tables(blocks_by_type, blocks_by_id, min_confidence)
         
         # Prepare extraction metadata
         metadata = {
             'method': self.method.value,
-            'total_blocks': len(blocks),
+            'total_blocks': len(blocks_by_id),
             'block_types': list(blocks_by_type.keys())
         }
 
@@ -269,11 +414,20 @@ class AmazonTextractAdapter:
             extraction_metadata=metadata
         )
 
-    def _extract_text_blocks(self, line_blocks: List[Dict[str, Any]]) -> List[TextBlock]:
+    def _extract_text_blocks(self, line_blocks: List[Dict[str, Any]], min_confidence: float = 0.0) -> List[TextBlock]:
         """Extract text blocks from LINE blocks."""
         text_blocks = []
+        filter_confidence = min_confidence > 0.0
         
         for line_block in line_blocks:
+            confidence = line_block.get('Confidence')
+            # Convert confidence from 0-100 to 0-1
+            if confidence is not None:
+                confidence = confidence / 100.0
+                # Filter by confidence before doing any other work on the block
+                if filter_confidence and confidence < min_confidence:
+                    continue
+            
             text = line_block.get('Text', '')
             if not text.strip():
                 continue
@@ -282,127 +436,161 @@ class AmazonTextractAdapter:
             geometry = line_block.get('Geometry', {})
             bbox = geometry.get('BoundingBox', {})
             page = line_block.get('Page', 1)
-            confidence = line_block.get('Confidence')
-            # Convert confidence from 0-100 to 0-1
-            if confidence is not None:
-                confidence = confidence / 100.0
             
             text_block = TextBlock(
                 text=text,
-                provenance={
-                    'method': self.method.value,
-                    'page': page,
-                    'bbox': {
-                        'x0': bbox.get('Left', 0),
-                        'y0': bbox.get('Top', 0),
-                        'x1': bbox.get('Left', 0) + bbox.get('Width', 0),
-                        'y1': bbox.get('Top', 0) + bbox.get('Height', 0)
-                    },
-                    'confidence': confidence,
-                    'raw_data': {
+                provenance=create_provenance(
+                    method=self.method,
+                    page=page,
+                    bbox=self._textract_bbox(bbox),
+                    confidence=confidence,
+                    raw_data={
                         'block_id': line_block['Id'],
                         'block_type': line_block['BlockType']
                     }
-                }
+                )
             )
             text_blocks.append(text_block)
         
         return text_blocks
 
-    def _extract_tables(self, blocks_by_type: Dict[str, List], blocks_by_id: Dict[str, Dict]) -> List[Table]:
+    def _extract_tables(self, blocks_by_type: Dict[str, List], blocks_by_id: Dict[str, Dict], min_confidence: float = 0.0) -> List[Table]:
         """Extract tables from TABLE and CELL blocks."""
         tables = []
-        table_blocks = blocks_by_type.get('TABLE', [])
         
-        for table_block in table_blocks:
-            # Get table cells through relationships
-            cell_ids = []
-            relationships = table_block.get('Relationships', [])
-            
-            for relationship in relationships:
-                if relationship['Type'] == 'CHILD':
-                    cell_ids.extend(relationship['Ids'])
-            
-            # Group cells by row
-            cells_by_row = {}
-            for cell_id in cell_ids:
-                cell_block = blocks_by_id.get(cell_id)
-                if cell_block and cell_block['BlockType'] == 'CELL':
-                    row_index = cell_block.get('RowIndex', 1)
-                    if row_index not in cells_by_row:
-                        cells_by_row[row_index] = []
-                    cells_by_row[row_index].append(cell_block)
-            
-            # Create table cells
-            all_cells = []
-            for row_index in sorted(cells_by_row.keys()):
-                row_cells = sorted(cells_by_row[row_index], key=lambda c: c.get('ColumnIndex', 1))
-
-                for col_idx, cell_block in enumerate(row_cells):
-                    cell_text = cell_block.get('Text', '')
-                    confidence = cell_block.get('Confidence')
-                    # Convert confidence from 0-100 to 0-1
-                    if confidence is not None:
-                        confidence = confidence / 100.0
-                    page = cell_block.get('Page', 1)
-
-                    # Get cell geometry
-                    geometry = cell_block.get('Geometry', {})
-                    bbox = geometry.get('BoundingBox', {})
-
-                    cell = TableCell(
-                        raw_text=cell_text,
-                        row_idx=row_index - 1,  # Convert to 0-based
-                        col_idx=col_idx,
-                        is_header=(row_index == 1),  # First row is header
-                        provenance={
-                            'method': self.method.value,
-                            'page': page,
-                            'bbox': {
-                                'x0': bbox.get('Left', 0),
-                                'y0': bbox.get('Top', 0),
-                                'x1': bbox.get('Left', 0) + bbox.get('Width', 0),
-                                'y1': bbox.get('Top', 0) + bbox.get('Height', 0)
-                            },
-                            'confidence': confidence,
-                            'raw_data': {
-                                'cell_id': cell_block['Id'],
-                                'row_span': cell_block.get('RowSpan', 1),
-                                'col_span': cell_block.get('ColumnSpan', 1)
-                            }
-                        }
-                    )
-                    all_cells.append(cell)
+        for table_block in blocks_by_type.get('TABLE', []):
+            table = self._convert_table_block(table_block, blocks_by_id, min_confidence)
+            if table is not None:
+                tables.append(table)
+        
+        return tables
+    
+    def _extract_text_from_block(self, block: Dict[str, Any], blocks_by_id: Dict[str, Dict]) -> str:
+        """Join the text of a block's CHILD WORD blocks (CELL blocks carry no Text)."""
+        get_block = blocks_by_id.get
+        parts = []
+        for child_id in self._child_ids(block):
+            child = get_block(child_id)
+            if child is not None and child['BlockType'] == 'WORD':
+                text = child.get('Text')
+                if text:
+                    parts.append(text)
+        return ' '.join(parts) if parts else block.get('Text', '')
+    
+    @staticmethod
+    def _textract_bbox(bbox: Dict[str, float]) -> BoundingBox:
+        """Convert a Textract BoundingBox (Left/Top/Width/Height ratios) to ours."""
+        left = bbox.get('Left', 0)
+        top = bbox.get('Top', 0)
+        return create_bbox_from_coords(
+            x0=left,
+            y0=top,
+            x1=left + bbox.get('Width', 0),
+            y1=top + bbox.get('Height', 0)
+        )
+    
+    @staticmethod
+    def _child_ids(block: Dict[str, Any]) -> List[str]:
+        """Flat list of the Ids in a block's CHILD relationships."""
+        return [
+            child_id
+            for relationship in block.get('Relationships', ())
+            if relationship['Type'] == 'CHILD'
+            for child_id in relationship['Ids']
+        ]
+    
+    def _convert_table_block(self, table_block: Dict, blocks_by_id: Dict[str, Dict], min_confidence: float = 0.0) -> Optional[Table]:
+        """
+        Convert one TABLE block and its CELL children into a Table.
+        
+        Args:
+            table_block: Textract TABLE block
+            blocks_by_id: All response blocks keyed by Id
+            min_confidence: Minimum cell confidence threshold (0-1)
             
-            if all_cells:  # Only add table if it has cells
-                # Get table geometry
-                geometry = table_block.get('Geometry', {})
-                bbox = geometry.get('BoundingBox', {})
-                page = table_block.get('Page', 1)
-                confidence = table_block.get('Confidence')
+        Returns:
+            Table, or None if the table has no cells
+        """
+        # Get table cells through relationships
+        cell_ids = self._child_ids(table_block)
+        get_block = blocks_by_id.get
+        
+        # Group cells by row
+        cells_by_row = {}
+        for cell_id in cell_ids:
+            cell_block = get_block(cell_id)
+            if cell_block and cell_block['BlockType'] == 'CELL':
+                row_index = cell_block.get('RowIndex', 1)
+                row = cells_by_row.get(row_index)
+                if row is None:
+                    cells_by_row[row_index] = [cell_block]
+                else:
+                    row.append(cell_block)
+        
+        # Create table cells
+        all_cells = []
+        filter_confidence = min_confidence > 0.0
+        for row_index in sorted(cells_by_row.keys()):
+            row_cells = sorted(cells_by_row[row_index], key=lambda c: c.get('ColumnIndex', 1))
+
+            for col_idx, cell_block in enumerate(row_cells):
+                confidence = cell_block.get('Confidence')
                 # Convert confidence from 0-100 to 0-1
                 if confidence is not None:
                     confidence = confidence / 100.0
+                    # Filter by confidence before reading the cell contents
+                    if filter_confidence and confidence < min_confidence:
+                        continue
 
-                table = Table(
-                    cells=all_cells,
-                    table_id=table_block['Id'],
-                    provenance={
-                        'method': self.method.value,
-                        'page': page,
-                        'bbox': {
-                            'x0': bbox.get('Left', 0),
-                            'y0': bbox.get('Top', 0),
-                            'x1': bbox.get('Left', 0) + bbox.get('Width', 0),
-                            'y1': bbox.get('Top', 0) + bbox.get('Height', 0)
-                        },
-                        'confidence': confidence,
-                        'raw_data': {
-                            'table_id': table_block['Id'],
-                            'cell_count': len(cell_ids)
+                cell_text = self._extract_text_from_block(cell_block, blocks_by_id)
+                page = cell_block.get('Page', 1)
+
+                # Get cell geometry
+                geometry = cell_block.get('Geometry', {})
+                bbox = geometry.get('BoundingBox', {})
+
+                cell = TableCell(
+                    raw_text=cell_text,
+                    row_idx=row_index - 1,  # Convert to 0-based
+                    col_idx=col_idx,
+                    is_header=(row_index == 1),  # First row is header
+                    provenance=create_provenance(
+                        method=self.method,
+                        page=page,
+                        bbox=self._textract_bbox(bbox),
+                        confidence=confidence,
+                        raw_data={
+                            'cell_id': cell_block['Id'],
+                            'row_span': cell_block.get('RowSpan', 1),
+                            'col_span': cell_block.get('ColumnSpan', 1)
                         }
-                    }
+                    )
                 )
-                tables.append(table)
+                all_cells.append(cell)
         
-        return tables
+        if not all_cells:  # Only add table if it has cells
+            return None
+        
+        # Get table geometry
+        geometry = table_block.get('Geometry', {})
+        bbox = geometry.get('BoundingBox', {})
+        page = table_block.get('Page', 1)
+        confidence = table_block.get('Confidence')
+        # Convert confidence from 0-100 to 0-1
+        if confidence is not None:
+            confidence = confidence / 100.0
+
+        return Table(
+            cells=all_cells,
+            table_id=table_block['Id'],
+            provenance=create_provenance(
+                method=self.method,
+                page=page,
+                bbox=self._textract_bbox(bbox),
+                confidence=confidence,
+                raw_data={
+                    'table_id': table_block['Id'],
+                    'cell_count': len(cell_ids)
+                }
+            )
+        )
@@ -16,6 +16,14 @@ from ..utils.timers import time_operation
 
 logger = logging.getLogger(__name__)
 
+# Keyword arguments forwarded to camelot.read_pdf
+CAMELOT_KWARGS = frozenset({
+    'table_areas', 'columns', 'split_text', 'flag_size', 'strip_text',
+    'row_tol', 'column_tol', 'line_scale', 'copy_text', 'shift_text',
+    'line_tol', 'joint_tol', 'threshold_blocksize', 'threshold_constant',
+    'iterations', 'resolution'
+})
+
 
 class CamelotAdapter:
     """Adapter for camelot table extraction."""
@@ -66,11 +74,7 @@ class CamelotAdapter:
                 # Extract tables using camelot
                 # Filter kwargs to only include camelot-specific parameters
                 camelot_kwargs = {k: v for k, v in kwargs.items()
-                                if k in ['table_areas', 'columns', 'split_text', 'flag_size',
-                                        'strip_text', 'row_tol', 'column_tol', 'line_scale',
-                                        'copy_text', 'shift_text', 'line_tol', 'joint_tol',
-                                        'threshold_blocksize', 'threshold_constant', 'iterations',
-                                        'resolution']}
+                                if k in CAMELOT_KWARGS}
 
                 if self.mode == "lattice":
                     tables_list = camelot.read_pdf(
@@ -171,7 +175,8 @@ class CamelotAdapter:
                         }
                     )
                     
-                    cell = TableCell(
+                    # Unvalidated build; DataNormalizer fills parsed_number
+                    cell = TableCell.fast(
                         raw_text=str(cell_value).strip() if cell_value is not None else "",
                         row_idx=row_idx,
                         col_idx=col_idx,
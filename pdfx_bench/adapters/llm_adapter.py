@@ -105,31 +105,19 @@ class LLMAdapter:
                 return self._create_error_document(pdf_path, str(e))
     
     def _pdf_to_images(self, pdf_path: Path, pages: Optional[List[int]]) -> List[bytes]:
-        """Convert PDF pages to images."""
+        """Convert PDF pages to PNG images."""
         try:
-            from pdf2image import convert_from_path
-            import io
-            
-            # Convert PDF to images
-            if pages:
-                images = convert_from_path(
-                    pdf_path,
-                    first_page=min(pages),
-                    last_page=max(pages),
-                    dpi=150  # Lower DPI for faster processing
-                )
-                # Filter to requested pages
-                page_indices = [p - min(pages) for p in pages]
-                images = [images[i] for i in page_indices if i < len(images)]
-            else:
-                images = convert_from_path(pdf_path, dpi=150)
+            import fitz  # PyMuPDF
             
-            # Convert to bytes
             image_bytes = []
-            for img in images:
-                img_byte_arr = io.BytesIO()
-                img.save(img_byte_arr, format='PNG')
-                image_bytes.append(img_byte_arr.getvalue())
+            with fitz.open(pdf_path) as doc:
+                page_numbers = pages or range(1, doc.page_count + 1)
+                for page_num in page_numbers:
+                    if not 1 <= page_num <= doc.page_count:
+                        continue
+                    # Lower DPI for faster processing
+                    pix = doc[page_num - 1].get_pixmap(dpi=150, alpha=False)
+                    image_bytes.append(pix.tobytes("png"))
             
             return image_bytes
         
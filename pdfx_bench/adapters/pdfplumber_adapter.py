@@ -58,13 +58,17 @@ class PDFPlumberAdapter:
                 for page_num in pages_to_process:
                     page = pdf.pages[page_num - 1]  # Convert to 0-based
                     
-                    # Extract text blocks
-                    page_text_blocks = self._extract_text_blocks(page, page_num)
-                    text_blocks.extend(page_text_blocks)
-                    
-                    # Extract tables
-                    page_tables = self._extract_tables(page, page_num)
-                    tables.extend(page_tables)
+                    try:
+                        # Extract text blocks
+                        page_text_blocks = self._extract_text_blocks(page, page_num)
+                        text_blocks.extend(page_text_blocks)
+                        
+                        # Extract tables
+                        page_tables = self._extract_tables(page, page_num)
+                        tables.extend(page_tables)
+                    finally:
+                        # Drop parsed page objects so long PDFs don't accumulate them
+                        page.flush_cache()
                 
                 document = Document(
                     id=pdf_path.stem,
@@ -171,7 +175,8 @@ class PDFPlumberAdapter:
                             }
                         )
                         
-                        cell = TableCell(
+                        # Unvalidated build; DataNormalizer fills parsed_number
+                        cell = TableCell.fast(
                             raw_text=str(cell_text).strip(),
                             row_idx=row_idx,
                             col_idx=col_idx,
@@ -3,8 +3,10 @@ Poppler adapter for PDFX-Bench.
 Uses Poppler utilities for PDF processing and basic text extraction.
 """
 
+import functools
 import logging
 import os
+import re
 import tempfile
 import subprocess
 from pathlib import Path
@@ -18,6 +20,37 @@ from ..utils.timers import time_operation
 
 logger = logging.getLogger(__name__)
 
+# One "Key: value" pair per line of pdfinfo output
+_PDFINFO_RE = re.compile(r'^([^:\n]+):[ \t]*(.*?)[ \t\r]*$', re.MULTILINE)
+
+
+@functools.lru_cache(maxsize=32)
+def _pdf_has_fonts(pdf_path: str, mtime_ns: int) -> bool:
+    """
+    Check whether a PDF references any fonts using pdffonts.
+
+    Image-only (scanned) PDFs have no fonts, so pdftotext cannot recover any
+    text from them. Results are cached per (path, mtime) so repeated runs over
+    the same file only probe once. If pdffonts is unavailable or fails, the
+    PDF is assumed to contain text.
+    """
+    try:
+        result = subprocess.run(
+            ['pdffonts', pdf_path],
+            capture_output=True, text=True, timeout=30
+        )
+    except (subprocess.TimeoutExpired, subprocess.SubprocessError, FileNotFoundError) as e:
+        logger.debug(f"pdffonts probe failed: {e}")
+        return True
+
+    if result.returncode != 0:
+        logger.debug(f"pdffonts failed: {result.stderr}")
+        return True
+
+    # Output is a two-line header followed by one line per font
+    font_lines = [line for line in result.stdout.splitlines()[2:] if line.strip()]
+    return bool(font_lines)
+
 
 class PopplerAdapter:
     """Adapter for Poppler utilities."""
@@ -36,8 +69,6 @@ class PopplerAdapter:
     def _check_dependencies(self):
         """Check if required dependencies are available."""
         try:
-            from pdf2image import convert_from_path
-            
             # Check if poppler utilities are available
             result = subprocess.run(['pdftoppm', '-h'], 
                                   capture_output=True, text=True, timeout=10)
@@ -52,12 +83,6 @@ class PopplerAdapter:
                 
             logger.debug("Poppler dependencies available")
             
-        except ImportError as e:
-            logger.error(f"Missing dependency: {e}")
-            raise RuntimeError(
-                "Poppler dependencies not installed. "
-                "Install with: pip install pdf2image"
-            )
         except (subprocess.TimeoutExpired, subprocess.SubprocessError, FileNotFoundError) as e:
             logger.error(f"Poppler utilities not found: {e}")
             raise RuntimeError(
@@ -90,6 +115,26 @@ class PopplerAdapter:
                 else:
                     pages_to_process = [p for p in pages if 1 <= p <= total_pages]
 
+                # Skip pdftotext entirely when it cannot produce any text
+                skipped_reason = self._get_skip_reason(pdf_path, pdf_info)
+                if skipped_reason:
+                    logger.info(f"Skipping pdftotext for {pdf_path.name}: {skipped_reason}")
+                    return Document(
+                        id=pdf_path.stem,
+                        file_name=pdf_path.name,
+                        page_count=total_pages,
+                        text_blocks=[],
+                        tables=[],
+                        key_values=[],
+                        extraction_metadata={
+                            'method': self.method.value,
+                            'dpi': self.dpi,
+                            'pages_processed': [],
+                            'skipped_reason': skipped_reason,
+                            'poppler_version': self._get_poppler_version()
+                        }
+                    )
+
                 text_blocks = []
 
                 # Extract text using pdftotext
@@ -134,6 +179,23 @@ class PopplerAdapter:
                 logger.error(f"Poppler extraction failed: {e}")
                 raise
     
+    def _get_skip_reason(self, pdf_path: Path, pdf_info: Dict[str, Any]) -> Optional[str]:
+        """Return why pdftotext would yield no text, or None if it should run."""
+        # pdftotext refuses to extract from encrypted PDFs without copy permission
+        encrypted = pdf_info.get('encrypted', '').lower()
+        if encrypted.startswith('yes') and 'copy:no' in encrypted:
+            return 'text_extraction_not_permitted'
+        
+        try:
+            mtime_ns = pdf_path.stat().st_mtime_ns
+        except OSError:
+            return None
+        
+        if not _pdf_has_fonts(str(pdf_path), mtime_ns):
+            return 'image_only'
+        
+        return None
+    
     def _get_pdf_info(self, pdf_path: Path) -> Dict[str, Any]:
         """Get PDF information using pdfinfo."""
         try:
@@ -146,20 +208,15 @@ class PopplerAdapter:
                 logger.warning(f"pdfinfo failed: {result.stderr}")
                 return {'pages': 1}
             
-            info = {}
-            for line in result.stdout.split('\n'):
-                if ':' in line:
-                    key, value = line.split(':', 1)
-                    key = key.strip().lower().replace(' ', '_')
-                    value = value.strip()
-                    
-                    if key == 'pages':
-                        try:
-                            info['pages'] = int(value)
-                        except ValueError:
-                            info['pages'] = 1
-                    else:
-                        info[key] = value
+            info = {
+                match.group(1).strip().lower().replace(' ', '_'): match.group(2)
+                for match in _PDFINFO_RE.finditer(result.stdout)
+            }
+            
+            try:
+                info['pages'] = int(info.get('pages', 1))
+            except ValueError:
+                info['pages'] = 1
             
             return info
             
@@ -207,7 +264,7 @@ class PopplerAdapter:
     
     def convert_to_images(self, pdf_path: Path, pages: Optional[List[int]] = None) -> List[Path]:
         """
-        Convert PDF pages to images using pdf2image.
+        Convert PDF pages to images using pdftoppm.
         
         Args:
             pdf_path: Path to PDF file
@@ -216,35 +273,27 @@ class PopplerAdapter:
         Returns:
             List of paths to generated image files
         """
+        output_dir = Path(tempfile.mkdtemp(prefix='pdfx_poppler_'))
+        cmd = ['pdftoppm', '-png', '-r', str(self.dpi)]
+        if pages:
+            cmd += ['-f', str(min(pages)), '-l', str(max(pages))]
+        cmd += [str(pdf_path), str(output_dir / 'page')]
+        
         try:
-            from pdf2image import convert_from_path
-            
-            # Convert PDF to images
-            if pages:
-                # pdf2image uses 1-based page numbers
-                images = convert_from_path(
-                    pdf_path, 
-                    dpi=self.dpi,
-                    first_page=min(pages),
-                    last_page=max(pages)
-                )
-            else:
-                images = convert_from_path(pdf_path, dpi=self.dpi)
-            
-            # Save images to temporary files
-            image_paths = []
-            with tempfile.TemporaryDirectory() as temp_dir:
-                for i, image in enumerate(images):
-                    page_num = pages[i] if pages else i + 1
-                    image_path = Path(temp_dir) / f"page_{page_num}.png"
-                    image.save(image_path, 'PNG')
-                    image_paths.append(image_path)
-            
-            return image_paths
-            
-        except ImportError:
-            logger.error("pdf2image not available for image conversion")
-            raise RuntimeError("pdf2image not installed")
-        except Exception as e:
+            subprocess.run(cmd, capture_output=True, text=True, timeout=300, check=True)
+        except (subprocess.TimeoutExpired, subprocess.SubprocessError, FileNotFoundError) as e:
             logger.error(f"Image conversion failed: {e}")
             raise
+        
+        # pdftoppm names files page-<n>.png, zero-padding <n> to the page count
+        image_paths = sorted(
+            output_dir.glob('page-*.png'),
+            key=lambda path: int(path.stem.rsplit('-', 1)[1])
+        )
+        if pages:
+            wanted = set(pages)
+            image_paths = [
+                path for path in image_paths
+                if int(path.stem.rsplit('-', 1)[1]) in wanted
+            ]
+        return image_paths
@@ -91,6 +91,7 @@ class TabulaAdapter:
                     pandas_options=pandas_options,
                     **tabula_kwargs
                 )
+                total_tables_found = len(tables_list)
                 
                 # Convert tabula tables to our schema
                 tables = []
@@ -101,6 +102,8 @@ class TabulaAdapter:
                         table = self._convert_tabula_table(df, table_idx, page_num)
                         if table:
                             tables.append(table)
+                    # Release each DataFrame once converted
+                    tables_list[table_idx] = None
                 
                 # Get page count
                 page_count = self._get_page_count(pdf_path)
@@ -114,7 +117,7 @@ class TabulaAdapter:
                         'method': self.method.value,
                         'pages_processed': pages_spec,
                         'tabula_version': tabula.__version__,
-                        'total_tables_found': len(tables_list)
+                        'total_tables_found': total_tables_found
                     }
                 )
                 
@@ -151,8 +154,12 @@ class TabulaAdapter:
             table_id = f"page_{page_num}_table_{table_idx}"
             cells = []
             
+            # Original values are kept once per table (see table provenance)
+            # rather than copied into every cell's raw_data
+            values = df.to_numpy(dtype=object).tolist()
+            
             # Convert DataFrame to cells
-            for row_idx, (_, row) in enumerate(df.iterrows()):
+            for row_idx, row in enumerate(values):
                 for col_idx, cell_value in enumerate(row):
                     # Handle NaN values
                     if pd.isna(cell_value):
@@ -172,12 +179,12 @@ class TabulaAdapter:
                         raw_data={
                             'table_index': table_idx,
                             'row_index': row_idx,
-                            'col_index': col_idx,
-                            'original_value': cell_value
+                            'col_index': col_idx
                         }
                     )
                     
-                    cell = TableCell(
+                    # Unvalidated build; DataNormalizer fills parsed_number
+                    cell = TableCell.fast(
                         raw_text=cell_text,
                         row_idx=row_idx,
                         col_idx=col_idx,
@@ -195,7 +202,8 @@ class TabulaAdapter:
                     'table_index': table_idx,
                     'rows': len(df),
                     'cols': len(df.columns),
-                    'column_names': list(df.columns)
+                    'column_names': list(df.columns),
+                    'data': values  # Original values, indexed as data[row_idx][col_idx]
                 }
             )
             
@@ -1,13 +1,20 @@
 """
 Tesseract OCR adapter for PDFX-Bench.
-Rasterizes PDFs and performs OCR using Tesseract (no generation/guessing).
+Rasterizes PDFs with PyMuPDF and performs OCR using Tesseract (no generation/guessing).
 """
 
+import atexit
 import logging
 import os
+import shutil
 import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Iterator, Tuple, ClassVar
+import fitz  # PyMuPDF
+import numpy as np
+from PIL import Image
 from ..schema import (
     Document, TextBlock, ExtractionMethod,
     BoundingBox, Provenance
@@ -17,39 +24,154 @@ from ..utils.timers import time_operation
 
 logger = logging.getLogger(__name__)
 
+try:
+    import pytesseract
+    PYTESSERACT_AVAILABLE = True
+except ImportError:
+    PYTESSERACT_AVAILABLE = False
+
+# Adaptive DPI aims for text lines about this many pixels tall (roughly a
+# 20px x-height, which Tesseract handles well)
+TARGET_LINE_HEIGHT_PX = 40
+
+# Rasterized pages are upright and tables are handled by other adapters, so
+# skip Tesseract's auto-invert and table-finding passes
+TESSERACT_CONFIG_FLAGS = "-c tessedit_do_invert=0 -c textord_tabfind_find_tables=0"
+
+# Rasterized page passed to OCR workers:
+# (page_num, grayscale samples, (width, height), lang, config)
+OCRTask = Tuple[int, bytes, Tuple[int, int], str, str]
+
+# OCR worker pool kept alive across extract() calls so a batch of PDFs does
+# not pay process startup for every document
+_OCR_POOL: Optional[ProcessPoolExecutor] = None
+_OCR_POOL_WORKERS = 0
+
+
+def _get_ocr_pool(max_workers: int) -> ProcessPoolExecutor:
+    """Return the shared OCR process pool, (re)creating it for max_workers."""
+    global _OCR_POOL, _OCR_POOL_WORKERS
+    
+    if _OCR_POOL is None or _OCR_POOL_WORKERS != max_workers:
+        _shutdown_ocr_pool()
+        _OCR_POOL = ProcessPoolExecutor(max_workers=max_workers)
+        _OCR_POOL_WORKERS = max_workers
+        logger.debug(f"Started OCR process pool with {max_workers} workers")
+    
+    return _OCR_POOL
+
+
+@atexit.register
+def _shutdown_ocr_pool() -> None:
+    """Shut down the shared OCR process pool, if one was started."""
+    global _OCR_POOL, _OCR_POOL_WORKERS
+    
+    if _OCR_POOL is not None:
+        _OCR_POOL.shutdown(wait=True, cancel_futures=True)
+        _OCR_POOL = None
+        _OCR_POOL_WORKERS = 0
+
+
+def _ocr_page(task: OCRTask) -> Tuple[int, Dict[str, List], Tuple[int, int]]:
+    """
+    Run Tesseract on one rasterized page.
+    
+    Module-level so it can be pickled into worker processes; pages travel as
+    raw 8-bit grayscale samples rather than PIL images to keep pickling cheap.
+    
+    Args:
+        task: Page number, grayscale samples, image size, Tesseract language
+            and config string
+        
+    Returns:
+        (page_num, ocr_data, image_size)
+    """
+    page_num, samples, size, lang, config = task
+    image = Image.frombytes("L", size, samples)
+    try:
+        ocr_data = pytesseract.image_to_data(
+            image,
+            lang=lang,
+            config=config,
+            output_type=pytesseract.Output.DICT
+        )
+    finally:
+        image.close()
+    
+    return page_num, ocr_data, size
+
 
 class TesseractOCRAdapter:
     """Adapter for Tesseract OCR."""
     
-    def __init__(self, dpi: int = 300, lang: str = 'eng'):
+    # Resolved once per process instead of on every construction
+    _tesseract_version: ClassVar[Optional[str]] = None
+    
+    # Lines whose average word confidence falls below this are dropped
+    LINE_CONFIDENCE_THRESHOLD: ClassVar[float] = 0.3
+    
+    def __init__(
+        self,
+        dpi: int = 300,
+        lang: str = 'eng',
+        parallel: bool = False,
+        max_workers: Optional[int] = None,
+        chunk_size: int = 10,
+        adaptive_dpi: bool = False,
+        min_dpi: int = 150,
+        psm: int = 6
+    ):
         """
         Initialize Tesseract OCR adapter.
         
         Args:
             dpi: DPI for PDF rasterization
             lang: Tesseract language code
+            parallel: OCR multi-page PDFs in a process pool (off by default so
+                per-method processing times are not skewed and batch workers do
+                not each start their own pool)
+            max_workers: Worker processes (default: min(cpu_count, 4))
+            chunk_size: Pages rasterized ahead of OCR at a time (bounds peak memory)
+            adaptive_dpi: Pick a per-page DPI between min_dpi and dpi from the
+                page's text size, so large-text pages render fewer pixels
+            min_dpi: Lowest DPI used when adaptive_dpi is enabled
+            psm: Tesseract page segmentation mode (6 = single uniform block,
+                skips orientation/script detection; 3 = fully automatic)
         """
         self.method = ExtractionMethod.TESSERACT_OCR
         self.dpi = dpi
         self.lang = lang
+        self.parallel = parallel
+        self.max_workers = max_workers or min(os.cpu_count() or 1, 4)
+        self.chunk_size = max(chunk_size, 1)
+        self.adaptive_dpi = adaptive_dpi
+        self.min_dpi = min(min_dpi, dpi)
+        self.psm = psm
+        self.tesseract_config = f"--psm {psm} {TESSERACT_CONFIG_FLAGS}"
         self._check_dependencies()
     
     def _check_dependencies(self):
         """Check if required dependencies are available."""
+        if not PYTESSERACT_AVAILABLE:
+            logger.error("Missing dependency: pytesseract")
+            raise RuntimeError(
+                "Tesseract OCR dependencies not installed. "
+                "Install with: pip install pytesseract"
+            )
+        
+        if TesseractOCRAdapter._tesseract_version is not None:
+            return
+        
         try:
-            import pytesseract
-            from pdf2image import convert_from_path
+            # Resolve the binary once so later OCR calls skip the PATH lookup
+            tesseract_cmd = shutil.which(pytesseract.pytesseract.tesseract_cmd)
+            if tesseract_cmd:
+                pytesseract.pytesseract.tesseract_cmd = tesseract_cmd
             
             # Check if tesseract is available
-            pytesseract.get_tesseract_version()
+            TesseractOCRAdapter._tesseract_version = str(pytesseract.get_tesseract_version())
             logger.debug("Tesseract OCR dependencies available")
             
-        except ImportError as e:
-            logger.error(f"Missing dependency: {e}")
-            raise RuntimeError(
-                "Tesseract OCR dependencies not installed. "
-                "Install with: pip install pytesseract pdf2image"
-            )
         except Exception as e:
             logger.error(f"Tesseract not found: {e}")
             raise RuntimeError(
@@ -69,7 +191,8 @@ class TesseractOCRAdapter:
         Args:
             pdf_path: Path to PDF file
             pages: List of page numbers to process (1-based), None for all
-            **kwargs: Additional parameters
+            **kwargs: Additional parameters (tesseract_config replaces the
+                Tesseract config string, e.g. '--psm 3' for full auto)
             
         Returns:
             Document with extracted text
@@ -78,54 +201,46 @@ class TesseractOCRAdapter:
         
         with time_operation("tesseract_ocr_extraction"):
             try:
-                import pytesseract
-                from pdf2image import convert_from_path
-                
-                # Convert PDF to images
-                if pages:
-                    # Convert specific pages (pdf2image uses 1-based indexing)
-                    images = convert_from_path(
-                        pdf_path,
-                        dpi=self.dpi,
-                        first_page=min(pages),
-                        last_page=max(pages)
-                    )
-                    # Filter to requested pages
-                    page_indices = [p - min(pages) for p in pages]
-                    images = [images[i] for i in page_indices if i < len(images)]
-                else:
-                    images = convert_from_path(pdf_path, dpi=self.dpi)
-                
                 text_blocks = []
+                pages_processed = []
+                page_dpi = {}
+                config = kwargs.get('tesseract_config') or self.tesseract_config
                 
-                # Process each page image
-                for page_idx, image in enumerate(images):
-                    actual_page = pages[page_idx] if pages else page_idx + 1
+                with fitz.open(pdf_path) as doc:
+                    page_count = len(doc)
+                    num_pages = len(pages) if pages else page_count
                     
-                    # Perform OCR with bounding box data
-                    ocr_data = pytesseract.image_to_data(
-                        image,
-                        lang=self.lang,
-                        output_type=pytesseract.Output.DICT
+                    tasks = (
+                        (page_num, samples, size, self.lang, config)
+                        for page_num, samples, size in self._rasterize(doc, pages, page_dpi)
                     )
                     
-                    # Extract text blocks from OCR data
-                    page_text_blocks = self._extract_text_blocks_from_ocr(
-                        ocr_data, actual_page, image.size
-                    )
-                    text_blocks.extend(page_text_blocks)
+                    for page_num, ocr_data, size in self._ocr_pages(tasks, num_pages):
+                        # Extract text blocks from OCR data
+                        page_text_blocks = self._extract_text_blocks_from_ocr(
+                            ocr_data, page_num, size
+                        )
+                        text_blocks.extend(page_text_blocks)
+                        pages_processed.append(page_num)
+                
+                metadata = {
+                    'method': self.method.value,
+                    'dpi': self.dpi,
+                    'language': self.lang,
+                    'tesseract_config': config,
+                    'pages_processed': pages_processed,
+                    'tesseract_version': self._tesseract_version
+                }
+                if self.adaptive_dpi:
+                    # Bounding boxes are in pixels of each page's own render
+                    metadata['page_dpi'] = page_dpi
                 
                 document = Document(
                     id=pdf_path.stem,
                     file_name=pdf_path.name,
-                    page_count=len(images),
+                    page_count=max(page_count, 1),
                     text_blocks=text_blocks,
-                    extraction_metadata={
-                        'method': self.method.value,
-                        'dpi': self.dpi,
-                        'language': self.lang,
-                        'pages_processed': pages or list(range(1, len(images) + 1))
-                    }
+                    extraction_metadata=metadata
                 )
                 
                 logger.info(
@@ -146,6 +261,104 @@ class TesseractOCRAdapter:
                     }
                 )
     
+    def _rasterize(
+        self,
+        doc: fitz.Document,
+        pages: Optional[List[int]] = None,
+        page_dpi: Optional[Dict[int, int]] = None
+    ) -> Iterator[Tuple[int, bytes, Tuple[int, int]]]:
+        """
+        Render PDF pages to grayscale samples with PyMuPDF, one page at a time.
+        
+        Tesseract binarizes grayscale input anyway, so rendering without
+        color cuts image memory and the bytes handed to Tesseract by 3x.
+        
+        Args:
+            doc: Open PyMuPDF document
+            pages: List of page numbers to render (1-based), None for all
+            page_dpi: Optional dict filled with the DPI used for each page
+            
+        Yields:
+            (page_num, samples, (width, height)) tuples in the requested order
+        """
+        page_numbers = pages if pages else range(1, len(doc) + 1)
+        
+        for page_num in page_numbers:
+            if not 1 <= page_num <= len(doc):
+                logger.warning(f"Skipping page {page_num}: out of range")
+                continue
+            
+            page = doc.load_page(page_num - 1)
+            dpi = self._estimate_page_dpi(page) if self.adaptive_dpi else self.dpi
+            if page_dpi is not None:
+                page_dpi[page_num] = dpi
+            
+            zoom = dpi / 72
+            pix = page.get_pixmap(
+                matrix=fitz.Matrix(zoom, zoom), colorspace=fitz.csGRAY, alpha=False
+            )
+            yield page_num, pix.samples, (pix.width, pix.height)
+    
+    def _estimate_page_dpi(self, page: fitz.Page) -> int:
+        """
+        Pick a render DPI from the page's typical text line height.
+        
+        Renders a cheap 72 DPI grayscale preview (1px = 1pt) and measures runs
+        of consecutive rows containing ink; their median approximates the line
+        height. Pages with small text keep the full DPI, large-text pages drop
+        towards min_dpi.
+        """
+        pix = page.get_pixmap(colorspace=fitz.csGRAY, alpha=False)
+        if pix.width == 0 or pix.height == 0:
+            return self.dpi
+        
+        gray = np.frombuffer(pix.samples, dtype=np.uint8).reshape(pix.height, pix.stride)
+        inked = (gray[:, :pix.width] < 128).any(axis=1)
+        
+        # Start/end rows of each run of inked rows
+        edges = np.flatnonzero(np.diff(np.concatenate(([0], inked.view(np.int8), [0]))))
+        run_heights = edges[1::2] - edges[::2]
+        run_heights = run_heights[run_heights >= 2]  # Ignore rules and specks
+        if run_heights.size == 0:
+            return self.dpi
+        
+        line_height = float(np.median(run_heights))
+        dpi = round(TARGET_LINE_HEIGHT_PX * 72 / line_height)
+        return int(min(max(dpi, self.min_dpi), self.dpi))
+    
+    def _ocr_pages(
+        self,
+        tasks: Iterator[OCRTask],
+        num_pages: int
+    ) -> Iterator[Tuple[int, Dict[str, List], Tuple[int, int]]]:
+        """
+        OCR rasterized pages, in a process pool when there is more than one.
+        
+        Tesseract holds engine locks, so pages are spread across processes
+        rather than threads; the pool persists between documents. Pages are
+        rasterized chunk_size at a time so only two chunks of images are alive
+        at once, and the next chunk renders while the pool OCRs the current
+        one. Results are yielded in page order.
+        """
+        if not self.parallel or num_pages < 2 or self.max_workers < 2:
+            # Sequential OCR already rasterizes one page at a time
+            yield from map(_ocr_page, tasks)
+            return
+        
+        tasks = iter(tasks)
+        executor = _get_ocr_pool(self.max_workers)
+        pending = None
+        while True:
+            # Submit the next chunk before draining the previous one
+            chunk = list(islice(tasks, self.chunk_size))
+            results = executor.map(_ocr_page, chunk, chunksize=1) if chunk else None
+            del chunk
+            if pending is not None:
+                yield from pending
+            if results is None:
+                break
+            pending = results
+    
     def _extract_text_blocks_from_ocr(
         self,
         ocr_data: Dict[str, List],
@@ -154,75 +367,71 @@ class TesseractOCRAdapter:
     ) -> List[TextBlock]:
         """Extract text blocks from Tesseract OCR data."""
         text_blocks = []
+        method = self.method
+        min_confidence = self.LINE_CONFIDENCE_THRESHOLD
+        
+        words = np.char.strip(np.asarray(ocr_data['text'], dtype=str))
+        conf = np.asarray(ocr_data['conf'], dtype=float)
+        level = np.asarray(ocr_data['level'], dtype=int)
+        
+        # Keep word-level entries with text and a valid confidence
+        word_idx = np.flatnonzero((level == 5) & (conf >= 0) & (np.char.str_len(words) > 0))
+        if word_idx.size == 0:
+            return text_blocks
+        
+        left = np.asarray(ocr_data['left'], dtype=float)[word_idx]
+        top = np.asarray(ocr_data['top'], dtype=float)[word_idx]
+        right = left + np.asarray(ocr_data['width'], dtype=float)[word_idx]
+        bottom = top + np.asarray(ocr_data['height'], dtype=float)[word_idx]
+        word_conf = conf[word_idx] / 100.0  # Convert to 0-1 range
+        words = words[word_idx]
+        
+        # Group words into text blocks by line; Tesseract emits each line's
+        # words contiguously, so a line starts wherever its key changes
+        line_keys = np.stack([
+            np.asarray(ocr_data[key], dtype=int)[word_idx]
+            for key in ('block_num', 'par_num', 'line_num')
+        ])
+        line_starts = np.flatnonzero(
+            np.concatenate(([True], (np.diff(line_keys, axis=1) != 0).any(axis=0)))
+        )
+        line_ends = np.append(line_starts[1:], word_idx.size)
         
-        # Group words into text blocks (simple approach: by line)
-        current_line_text = []
-        current_line_bbox = None
-        current_line_conf = []
+        x0 = np.minimum.reduceat(left, line_starts).tolist()
+        y0 = np.minimum.reduceat(top, line_starts).tolist()
+        x1 = np.maximum.reduceat(right, line_starts).tolist()
+        y1 = np.maximum.reduceat(bottom, line_starts).tolist()
+        word_counts = (line_ends - line_starts).tolist()
+        avg_confidences = (np.add.reduceat(word_conf, line_starts) / (line_ends - line_starts)).tolist()
         
-        for i in range(len(ocr_data['text'])):
-            text = ocr_data['text'][i].strip()
-            conf = int(ocr_data['conf'][i])
+        for line, (start, end) in enumerate(zip(line_starts.tolist(), line_ends.tolist())):
+            avg_confidence = avg_confidences[line]
             
-            # Skip empty text or very low confidence
-            if not text or conf < 0:
+            # Only include text blocks with reasonable confidence
+            if avg_confidence < min_confidence:
                 continue
             
-            # Get word bounding box
-            x = ocr_data['left'][i]
-            y = ocr_data['top'][i]
-            w = ocr_data['width'][i]
-            h = ocr_data['height'][i]
+            # Degenerate (zero-area) boxes fail BoundingBox validation
+            line_bbox = None
+            if x1[line] > x0[line] and y1[line] > y0[line]:
+                line_bbox = create_bbox_from_coords(x0[line], y0[line], x1[line], y1[line])
             
-            word_bbox = create_bbox_from_coords(x, y, x + w, y + h)
-            
-            # Check if this word is on a new line
-            level = ocr_data['level'][i]
+            provenance = create_provenance(
+                method=method,
+                page=page_num,
+                bbox=line_bbox,
+                confidence=avg_confidence,
+                raw_data={
+                    'word_count': word_counts[line],
+                    'avg_word_confidence': avg_confidence
+                }
+            )
             
-            if level == 5:  # Word level
-                current_line_text.append(text)
-                current_line_conf.append(conf / 100.0)  # Convert to 0-1 range
-                
-                # Expand line bounding box
-                if current_line_bbox is None:
-                    current_line_bbox = word_bbox
-                else:
-                    current_line_bbox = create_bbox_from_coords(
-                        min(current_line_bbox.x0, word_bbox.x0),
-                        min(current_line_bbox.y0, word_bbox.y0),
-                        max(current_line_bbox.x1, word_bbox.x1),
-                        max(current_line_bbox.y1, word_bbox.y1)
-                    )
+            text_block = TextBlock(
+                text=' '.join(words[start:end].tolist()),
+                provenance=provenance
+            )
             
-            # End of line or block - create text block
-            if (level <= 4 and current_line_text) or i == len(ocr_data['text']) - 1:
-                if current_line_text:
-                    line_text = ' '.join(current_line_text)
-                    avg_confidence = sum(current_line_conf) / len(current_line_conf)
-                    
-                    # Only include text blocks with reasonable confidence
-                    if avg_confidence >= 0.3:  # 30% minimum confidence
-                        provenance = create_provenance(
-                            method=self.method,
-                            page=page_num,
-                            bbox=current_line_bbox,
-                            confidence=avg_confidence,
-                            raw_data={
-                                'word_count': len(current_line_text),
-                                'avg_word_confidence': avg_confidence
-                            }
-                        )
-                        
-                        text_block = TextBlock(
-                            text=line_text,
-                            provenance=provenance
-                        )
-                        
-                        text_blocks.append(text_block)
-                
-                # Reset for next line
-                current_line_text = []
-                current_line_bbox = None
-                current_line_conf = []
+            text_blocks.append(text_block)
         
         return text_blocks
@@ -3,11 +3,15 @@ Command-line interface for PDFX-Bench.
 """
 
 import argparse
+import functools
 import logging
 import os
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from time import perf_counter
+from typing import List, Optional, Dict, Any, Tuple
 import json
 from datetime import datetime
 
@@ -20,8 +24,16 @@ try:
 except ImportError:
     pass  # dotenv not installed, skip
 
-from .detectors import detect_pdf_type, should_use_ocr, get_recommended_extractors, parse_page_range
+# Optional fast JSON encoder for summary output
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+from .detectors import PDFInfo, detect_pdf_type, should_use_ocr, get_recommended_extractors, parse_page_range
 from .normalize import DataNormalizer
+from .provenance import set_keep_raw_data
 from .scoring import QualityScorer, compare_extraction_results
 from .exporters import ResultExporter
 from .schema import ExtractionMethod, ExtractionResult
@@ -29,38 +41,27 @@ from .utils.logging import setup_logging
 from .utils.io import find_pdf_files, ensure_dir
 from .utils.timers import time_operation, performance_tracker
 
-# Import adapters (with graceful handling of optional dependencies)
-from .adapters.pdfplumber_adapter import PDFPlumberAdapter
-from .adapters.camelot_adapter import CamelotAdapter
-from .adapters.tabula_adapter import TabulaAdapter
-
-# Optional OCR adapters
-try:
-    from .adapters.tesseract_ocr import TesseractOCRAdapter
-    TESSERACT_AVAILABLE = True
-except ImportError:
-    TESSERACT_AVAILABLE = False
-
-try:
-    from .adapters.poppler_adapter import PopplerAdapter
-    POPPLER_AVAILABLE = True
-except ImportError:
-    POPPLER_AVAILABLE = False
-
-# Optional cloud adapters
-try:
-    from .adapters.adobe_extract_adapter import AdobeExtractAdapter
-    ADOBE_AVAILABLE = True
-except ImportError:
-    ADOBE_AVAILABLE = False
-
-# TEXTRACT_AVAILABLE removed - using new Amazon Textract adapters instead
-
-# Set availability flags - imports will be done dynamically
-DOCAI_AVAILABLE = True
-AZURE_READ_AVAILABLE = True
-AZURE_LAYOUT_AVAILABLE = True
-LLM_AVAILABLE = True
+# Methods accepted by --method (besides 'auto')
+VALID_METHODS = frozenset({
+    'pdfplumber', 'camelot-lattice', 'camelot-stream', 'tabula', 'poppler', 'tesseract',
+    'adobe', 'amazon-detect-text', 'amazon-analyze-document',
+    'google-ocr', 'google-form', 'google-layout', 'azure-read', 'azure-layout',
+    'llm-openai', 'llm-anthropic', 'llm-google'
+})
+
+# Adapters are imported inside create_adapter so a run only pays for the
+# libraries (camelot, tabula, cloud SDKs, ...) of the methods it uses
+
+# Keyword arguments that configure adapter construction (credentials etc.)
+ADAPTER_KWARGS = frozenset({
+    'adobe_cred_file', 'adobe_client_id', 'adobe_client_secret',
+    'aws_access_key_id', 'aws_secret_access_key', 'aws_region', 'aws_s3_bucket',
+    'gcp_project_id', 'gcp_location',
+    'gcp_processor_id_ocr', 'gcp_processor_id_form', 'gcp_processor_id_layout',
+    'azure_endpoint', 'azure_key',
+    'openai_api_key', 'anthropic_api_key', 'google_api_key',
+    'ocr_parallel'
+})
 
 logger = logging.getLogger(__name__)
 
@@ -129,6 +130,28 @@ Examples:
         help='Minimum confidence threshold for cloud APIs (default: 0.9)'
     )
     
+    # Concurrency
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=1,
+        help='Number of PDFs to process in parallel worker processes (default: 1)'
+    )
+    
+    parser.add_argument(
+        '--parallel-ocr',
+        action='store_true',
+        help='OCR the pages of a PDF in a pool of worker processes (tesseract only; '
+             'ignored with --workers > 1 to avoid oversubscribing the CPUs)'
+    )
+    
+    parser.add_argument(
+        '--parallel-methods',
+        action='store_true',
+        help='Run extraction methods concurrently (lower wall time, but per-method '
+             'timings include contention between methods)'
+    )
+    
     # Schema validation
     parser.add_argument(
         '--schema',
@@ -210,6 +233,20 @@ Examples:
         help='Report format (default: md)'
     )
     
+    parser.add_argument(
+        '--table-format',
+        choices=['csv', 'parquet'],
+        default='csv',
+        help='Output format for extracted table cells (default: csv; parquet needs pyarrow)'
+    )
+    
+    parser.add_argument(
+        '--drop-raw-data',
+        action='store_true',
+        help='Do not keep extractor-specific raw data in provenance records '
+             '(smaller results and lower memory use)'
+    )
+    
     # Logging
     parser.add_argument(
         '--log-level',
@@ -248,40 +285,70 @@ def parse_methods(method_str: str) -> List[str]:
     methods = [m.strip() for m in method_str.split(',')]
     
     # Validate methods
-    valid_methods = {
-        'pdfplumber', 'camelot-lattice', 'camelot-stream', 'tabula', 'poppler', 'tesseract',
-        'adobe', 'amazon-detect-text', 'amazon-analyze-document',
-        'google-ocr', 'google-form', 'google-layout', 'azure-read', 'azure-layout',
-        'llm-openai', 'llm-anthropic', 'llm-google'
-    }
-    
-    for method in methods:
-        if method not in valid_methods:
-            raise ValueError(f"Invalid method: {method}")
+    unknown = set(methods) - VALID_METHODS
+    if unknown:
+        raise ValueError(f"Invalid method: {', '.join(sorted(unknown))}")
     
     return methods
 
 
 def create_adapter(method: str, **kwargs) -> Any:
+    """
+    Get an adapter instance for the given method.
+    
+    Adapters keep no per-document state, so one instance per method and
+    configuration is reused for every PDF in the process instead of
+    re-initializing SDK clients, sessions and credentials each time.
+    """
+    adapter_config = tuple(sorted(
+        (key, value) for key, value in kwargs.items()
+        if key in ADAPTER_KWARGS and value is not None
+    ))
+    return _cached_adapter(method, adapter_config)
+
+
+@functools.lru_cache(maxsize=None)
+def _cached_adapter(method: str, adapter_config: tuple) -> Any:
+    """Build an adapter once per (method, adapter configuration)."""
+    return _build_adapter(method, **dict(adapter_config))
+
+
+def _build_adapter(method: str, **kwargs) -> Any:
     """Create adapter instance for the given method."""
     if method == 'pdfplumber':
+        try:
+            from .adapters.pdfplumber_adapter import PDFPlumberAdapter
+        except ImportError:
+            raise RuntimeError("pdfplumber not installed. Install with: pip install pdfplumber")
         return PDFPlumberAdapter()
-    elif method == 'camelot-lattice':
-        return CamelotAdapter(mode='lattice')
-    elif method == 'camelot-stream':
-        return CamelotAdapter(mode='stream')
+    elif method in ('camelot-lattice', 'camelot-stream'):
+        try:
+            from .adapters.camelot_adapter import CamelotAdapter
+        except ImportError:
+            raise RuntimeError("Camelot not installed. Install with: pip install camelot-py[cv]")
+        return CamelotAdapter(mode=method.split('-')[1])
     elif method == 'tabula':
+        try:
+            from .adapters.tabula_adapter import TabulaAdapter
+        except ImportError:
+            raise RuntimeError("Tabula not installed. Install with: pip install tabula-py")
         return TabulaAdapter()
     elif method == 'poppler':
-        if not POPPLER_AVAILABLE:
-            raise RuntimeError("Poppler dependencies not installed. Install with: pip install pdf2image and ensure Poppler utilities are in PATH")
+        try:
+            from .adapters.poppler_adapter import PopplerAdapter
+        except ImportError:
+            raise RuntimeError("Poppler dependencies not installed. Ensure Poppler utilities are in PATH")
         return PopplerAdapter()
     elif method == 'tesseract':
-        if not TESSERACT_AVAILABLE:
-            raise RuntimeError("Tesseract OCR dependencies not installed. Install with: pip install pytesseract pdf2image")
-        return TesseractOCRAdapter()
+        try:
+            from .adapters.tesseract_ocr import TesseractOCRAdapter
+        except ImportError:
+            raise RuntimeError("Tesseract OCR dependencies not installed. Install with: pip install pytesseract")
+        return TesseractOCRAdapter(parallel=kwargs.get('ocr_parallel', False))
     elif method == 'adobe':
-        if not ADOBE_AVAILABLE:
+        try:
+            from .adapters.adobe_extract_adapter import AdobeExtractAdapter
+        except ImportError:
             raise RuntimeError("Adobe PDF Services SDK not installed. Install with: pip install pdfservices-sdk")
 
         # Pass Adobe credentials directly to adapter
@@ -301,7 +368,8 @@ def create_adapter(method: str, **kwargs) -> Any:
                 method=TextractMethod.DETECT_TEXT,
                 aws_access_key_id=kwargs.get('aws_access_key_id'),
                 aws_secret_access_key=kwargs.get('aws_secret_access_key'),
-                aws_region=kwargs.get('aws_region')
+                aws_region=kwargs.get('aws_region'),
+                s3_bucket=kwargs.get('aws_s3_bucket')
             )
         except ImportError:
             raise RuntimeError("AWS boto3 not installed. Install with: pip install boto3")
@@ -312,7 +380,8 @@ def create_adapter(method: str, **kwargs) -> Any:
                 method=TextractMethod.ANALYZE_DOCUMENT,
                 aws_access_key_id=kwargs.get('aws_access_key_id'),
                 aws_secret_access_key=kwargs.get('aws_secret_access_key'),
-                aws_region=kwargs.get('aws_region')
+                aws_region=kwargs.get('aws_region'),
+                s3_bucket=kwargs.get('aws_s3_bucket')
             )
         except ImportError:
             raise RuntimeError("AWS boto3 not installed. Install with: pip install boto3")
@@ -387,6 +456,24 @@ def create_adapter(method: str, **kwargs) -> Any:
         raise ValueError(f"Unknown method: {method}")
 
 
+_thread_state = threading.local()
+
+
+def _get_normalizer() -> DataNormalizer:
+    """
+    Per-thread DataNormalizer, reused across extractions.
+    
+    The CLI never exports the normalizer's quarantine entries, so they are
+    cleared on reuse instead of accumulating for the whole run.
+    """
+    normalizer = getattr(_thread_state, 'normalizer', None)
+    if normalizer is None:
+        normalizer = _thread_state.normalizer = DataNormalizer()
+    else:
+        normalizer.clear_quarantine()
+    return normalizer
+
+
 def extract_with_method(
     adapter: Any,
     pdf_path: Path,
@@ -398,8 +485,7 @@ def extract_with_method(
     method = adapter.method
 
     try:
-        import time
-        start_time = time.time()
+        start_time = perf_counter()
 
         # Perform extraction
         document = adapter.extract(
@@ -410,7 +496,8 @@ def extract_with_method(
         )
 
         # Calculate processing time
-        processing_time = time.time() - start_time
+        processing_time = perf_counter() - start_time
+        performance_tracker.record(f"extract_{method.value}", processing_time)
 
         # Check if extraction was actually successful
         has_error = (
@@ -422,8 +509,7 @@ def extract_with_method(
         error_message = document.extraction_metadata.get('error') if has_error else None
 
         # Normalize result
-        normalizer = DataNormalizer()
-        result = normalizer.normalize_extraction_result(
+        result = _get_normalizer().normalize_extraction_result(
             raw_result=document,
             method=method,
             processing_time=processing_time,
@@ -437,8 +523,7 @@ def extract_with_method(
         logger.error(f"Extraction failed with {method.value}: {e}")
 
         # Create failed result
-        normalizer = DataNormalizer()
-        result = normalizer.normalize_extraction_result(
+        result = _get_normalizer().normalize_extraction_result(
             raw_result=None,
             method=method,
             processing_time=0,
@@ -449,6 +534,35 @@ def extract_with_method(
         return result
 
 
+def run_method(
+    method: str,
+    pdf_path: Path,
+    pages: Optional[List[int]],
+    min_confidence: float,
+    **kwargs
+) -> Optional[ExtractionResult]:
+    """Create the adapter for a method and extract; None if it cannot run."""
+    try:
+        adapter = create_adapter(method, **kwargs)
+        result = extract_with_method(
+            adapter=adapter,
+            pdf_path=pdf_path,
+            pages=pages,
+            min_confidence=min_confidence,
+            **kwargs
+        )
+        
+        logger.info(f"Completed {method}: {result.success}")
+        return result
+        
+    except NotImplementedError as e:
+        logger.warning(f"Skipping {method}: {e}")
+    except Exception as e:
+        logger.error(f"Failed to create adapter for {method}: {e}")
+    
+    return None
+
+
 def process_pdf_file(
     pdf_path: Path,
     methods: List[str],
@@ -456,13 +570,15 @@ def process_pdf_file(
     ocr_mode: str,
     min_confidence: float,
     output_dir: Path,
+    pdf_info: Optional[PDFInfo] = None,
     **kwargs
 ) -> Dict[str, Any]:
-    """Process a single PDF file with specified methods."""
+    """Process a single PDF file with specified methods (pdf_info is detected if not given)."""
     logger.info(f"Processing PDF: {pdf_path}")
     
     # Detect PDF characteristics
-    pdf_info = detect_pdf_type(pdf_path)
+    if pdf_info is None:
+        pdf_info = detect_pdf_type(pdf_path)
     
     # Determine methods to use
     if 'auto' in methods:
@@ -479,39 +595,32 @@ def process_pdf_file(
     
     logger.info(f"Using extraction methods: {methods_to_use}")
     
-    # Extract with each method
-    results = []
-    for method in methods_to_use:
-        try:
-            adapter = create_adapter(method, **kwargs)
-            result = extract_with_method(
-                adapter=adapter,
-                pdf_path=pdf_path,
-                pages=pages,
-                min_confidence=min_confidence,
-                **kwargs
-            )
-            results.append(result)
-            
-            logger.info(f"Completed {method}: {result.success}")
-            
-        except NotImplementedError as e:
-            logger.warning(f"Skipping {method}: {e}")
-        except Exception as e:
-            logger.error(f"Failed to create adapter for {method}: {e}")
+    # Extract with each method; methods are independent and mostly wait on
+    # subprocesses, C extensions or HTTP, so threads overlap them well
+    def run(method: str) -> Optional[ExtractionResult]:
+        return run_method(method, pdf_path, pages, min_confidence, **kwargs)
     
-    # Export results
-    exporter = ResultExporter(output_dir)
+    if kwargs.get('parallel_methods') and len(methods_to_use) > 1:
+        with ThreadPoolExecutor(max_workers=len(methods_to_use)) as executor:
+            method_results = list(executor.map(run, methods_to_use))
+    else:
+        method_results = [run(method) for method in methods_to_use]
     
-    # Save individual results
-    for result in results:
-        exporter.export_extraction_result(result, pdf_path.stem)
+    results = [result for result in method_results if result is not None]
     
-    # Create comparison report
-    comparison = compare_extraction_results(results)
-    report_path = exporter.export_comparison_report(
-        comparison, pdf_path.stem, kwargs.get('report', 'md')
-    )
+    # Export results
+    with ResultExporter(output_dir) as exporter:
+        # Save individual results
+        for result in results:
+            exporter.export_extraction_result(
+                result, pdf_path.stem, kwargs.get('table_format', 'csv')
+            )
+        
+        # Create comparison report
+        comparison = compare_extraction_results(results)
+        report_path = exporter.export_comparison_report(
+            comparison, pdf_path.stem, kwargs.get('report', 'md')
+        )
     
     logger.info(f"Results exported to: {output_dir}")
     logger.info(f"Comparison report: {report_path}")
@@ -526,6 +635,72 @@ def process_pdf_file(
     }
 
 
+def summarize_pdf_result(pdf_result: Dict[str, Any]) -> Dict[str, Any]:
+    """Small JSON-serializable summary of a process_pdf_file result."""
+    pdf_info = pdf_result['pdf_info']
+    return {
+        'pdf_path': pdf_result['pdf_path'],
+        'page_count': pdf_info.page_count,
+        'is_scanned': pdf_info.is_scanned,
+        'methods_used': pdf_result['methods_used'],
+        'results': [
+            {
+                'method': result.method.value,
+                'success': result.success,
+                'error_message': result.error_message,
+                'processing_time': result.processing_time,
+                'total_text_blocks': result.total_text_blocks,
+                'total_tables': result.total_tables,
+                'avg_confidence': result.avg_confidence
+            }
+            for result in pdf_result['results']
+        ]
+    }
+
+
+def process_pdf_task(
+    pdf_path: Path,
+    page_spec: Optional[str],
+    options: Dict[str, Any]
+) -> Dict[str, Any]:
+    """
+    Resolve the page range for one PDF, process it and summarize the result.
+    
+    Picklable for worker processes; only the summary travels back, the full
+    results have already been exported to the output directory.
+    """
+    pdf_info = detect_pdf_type(pdf_path)
+    pdf_pages = None
+    if page_spec:
+        pdf_pages = parse_page_range(page_spec, pdf_info.page_count)
+    
+    pdf_result = process_pdf_file(pdf_path=pdf_path, pages=pdf_pages, pdf_info=pdf_info, **options)
+    return summarize_pdf_result(pdf_result)
+
+
+def process_pdf_worker_task(
+    pdf_path: Path,
+    page_spec: Optional[str],
+    options: Dict[str, Any]
+) -> Tuple[Dict[str, Any], Dict[str, List[float]]]:
+    """
+    process_pdf_task for worker processes.
+    
+    Also returns the timings recorded while processing this PDF, since the
+    worker's performance_tracker is never seen by the parent; the parent
+    merges them into its own tracker for summary.json.
+    """
+    performance_tracker.clear()
+    pdf_summary = process_pdf_task(pdf_path, page_spec, options)
+    return pdf_summary, dict(performance_tracker.metrics)
+
+
+def init_pdf_worker(log_level: str, log_file: Optional[Path], keep_raw_data: bool) -> None:
+    """Set up logging and process-wide settings in a PDF worker process."""
+    setup_logging(log_level, log_file, True, True)
+    set_keep_raw_data(keep_raw_data)
+
+
 def main():
     """Main CLI entry point."""
     parser = create_parser()
@@ -553,56 +728,89 @@ def main():
         # Parse methods
         methods = parse_methods(args.method)
         
-        # Parse pages
-        pages = None
-        if args.pages:
-            # We'll parse pages per PDF since page counts may differ
-            pass
+        # raw_data is a process-wide setting: set it once here and in each
+        # worker process rather than per PDF
+        keep_raw_data = not args.drop_raw_data
+        set_keep_raw_data(keep_raw_data)
+        
+        # Each PDF worker would start its own OCR pool, so only one level of
+        # process parallelism is allowed
+        ocr_parallel = args.parallel_ocr
+        if ocr_parallel and args.workers > 1:
+            logger.warning("--parallel-ocr is ignored when --workers > 1")
+            ocr_parallel = False
         
-        # Process each PDF
-        all_results = []
-        for pdf_path in pdf_files:
-            try:
-                # Parse pages for this specific PDF
-                pdf_pages = None
-                if args.pages:
-                    pdf_info = detect_pdf_type(pdf_path)
-                    pdf_pages = parse_page_range(args.pages, pdf_info.page_count)
-                
-                result = process_pdf_file(
-                    pdf_path=pdf_path,
-                    methods=methods,
-                    pages=pdf_pages,
-                    ocr_mode=args.ocr,
-                    min_confidence=args.min_confidence,
-                    output_dir=output_dir,
-                    adobe_cred_file=args.adobe_cred_file,
-                    aws_profile=args.aws_profile,
-                    gcp_processor_id=args.gcp_processor_id,
-                    gcp_location=args.gcp_location,
-                    azure_endpoint=args.azure_endpoint,
-                    azure_key=args.azure_key,
-                    report=args.report
-                )
-                
-                all_results.append(result)
-                
-            except Exception as e:
-                logger.error(f"Failed to process {pdf_path}: {e}")
-                continue
+        options = dict(
+            methods=methods,
+            ocr_mode=args.ocr,
+            min_confidence=args.min_confidence,
+            output_dir=output_dir,
+            adobe_cred_file=args.adobe_cred_file,
+            aws_profile=args.aws_profile,
+            gcp_processor_id=args.gcp_processor_id,
+            gcp_location=args.gcp_location,
+            azure_endpoint=args.azure_endpoint,
+            azure_key=args.azure_key,
+            report=args.report,
+            table_format=args.table_format,
+            parallel_methods=args.parallel_methods,
+            ocr_parallel=ocr_parallel
+        )
+        
+        # Process each PDF (pages are parsed per PDF since page counts may differ);
+        # per-PDF summaries are appended as JSON lines as soon as each finishes
+        # so memory does not grow with the number of PDFs
+        successful_pdfs = 0
+        pdf_summary_path = output_dir / 'pdf_summaries.jsonl'
+        with open(pdf_summary_path, 'w') as pdf_summary_file:
+            def record(pdf_summary: Dict[str, Any]) -> None:
+                nonlocal successful_pdfs
+                pdf_summary_file.write(json.dumps(pdf_summary, default=str) + '\n')
+                pdf_summary_file.flush()
+                successful_pdfs += 1
+            
+            if args.workers > 1 and len(pdf_files) > 1:
+                with ProcessPoolExecutor(
+                    max_workers=min(args.workers, len(pdf_files)),
+                    initializer=init_pdf_worker,
+                    initargs=(args.log_level, log_file, keep_raw_data)
+                ) as executor:
+                    futures = {
+                        executor.submit(process_pdf_worker_task, pdf_path, args.pages, options): pdf_path
+                        for pdf_path in pdf_files
+                    }
+                    for future in as_completed(futures):
+                        try:
+                            pdf_summary, timings = future.result()
+                            performance_tracker.merge(timings)
+                            record(pdf_summary)
+                        except Exception as e:
+                            logger.error(f"Failed to process {futures[future]}: {e}")
+            else:
+                for pdf_path in pdf_files:
+                    try:
+                        record(process_pdf_task(pdf_path, args.pages, options))
+                    except Exception as e:
+                        logger.error(f"Failed to process {pdf_path}: {e}")
+                        continue
         
         # Save summary
         summary = {
             'total_pdfs': len(pdf_files),
-            'successful_pdfs': len(all_results),
+            'successful_pdfs': successful_pdfs,
             'methods_used': methods,
             'output_directory': str(output_dir),
+            'pdf_summaries': str(pdf_summary_path),
             'processing_time': performance_tracker.get_all_stats()
         }
         
         summary_path = output_dir / 'summary.json'
-        with open(summary_path, 'w') as f:
-            json.dump(summary, f, indent=2, default=str)
+        if ORJSON_AVAILABLE:
+            with open(summary_path, 'wb') as f:
+                f.write(orjson.dumps(summary, option=orjson.OPT_INDENT_2, default=str))
+        else:
+            with open(summary_path, 'w') as f:
+                json.dump(summary, f, indent=2, default=str)
         
         logger.info(f"Processing complete. Summary saved to: {summary_path}")
         
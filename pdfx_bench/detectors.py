@@ -4,13 +4,36 @@ Detect whether PDFs are digital or scanned, page count, etc.
 """
 
 import logging
+import os
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 import fitz  # PyMuPDF
 from dataclasses import dataclass
 
 logger = logging.getLogger(__name__)
 
+# Pages averaging fewer text characters than this (with images) look scanned
+SCANNED_TEXT_THRESHOLD = 100
+
+# Stop analyzing once this many pages already prove the PDF is digital
+MIN_PAGES_BEFORE_EARLY_EXIT = 10
+
+# PDFs longer than this are classified from an evenly spread page sample
+SAMPLE_PAGE_THRESHOLD = 20
+SAMPLE_SIZE = 9
+
+# Bytes read from each end of a file by validate_pdf
+PDF_PROBE_SIZE = 1024
+
+# Extractor recommendations by PDF type; cloud extractors handle both types
+DIGITAL_EXTRACTORS = ("pdfplumber", "camelot-lattice", "camelot-stream", "tabula")
+SCANNED_EXTRACTORS = ("tesseract",)
+CLOUD_EXTRACTORS = ("adobe", "amazon-detect-text", "amazon-analyze-document", "docai", "azure")
+
+# Older PyMuPDF releases had Document.pdf_version(); current ones only report
+# the version through metadata['format'] ("PDF 1.7"). Resolved once at import.
+_HAS_PDF_VERSION = callable(getattr(fitz.Document, 'pdf_version', None))
+
 
 @dataclass
 class PDFInfo:
@@ -24,14 +47,20 @@ class PDFInfo:
     pdf_version: str
     is_encrypted: bool
     metadata: Dict[str, Any]
-    text_density_per_page: List[float]  # Characters per page
-    image_density_per_page: List[int]   # Number of images per page
+    text_density_per_page: List[Optional[float]]  # Characters per page (None if not analyzed)
+    image_density_per_page: List[Optional[int]]   # Images per page (None if not analyzed)
 
 
 def detect_pdf_type(pdf_path: Path) -> PDFInfo:
     """
     Detect PDF characteristics to determine extraction strategy.
     
+    Long PDFs are first classified from an evenly spread sample of pages;
+    only if the sampled pages disagree are all pages analyzed, in order and
+    only until the text seen so far rules out a scanned document. Densities
+    are None for pages that were never analyzed, and has_images only
+    reflects analyzed pages.
+    
     Args:
         pdf_path: Path to PDF file
         
@@ -41,47 +70,63 @@ def detect_pdf_type(pdf_path: Path) -> PDFInfo:
     logger.debug(f"Analyzing PDF: {pdf_path}")
     
     try:
-        doc = fitz.open(pdf_path)
-        
-        # Basic info
-        page_count = len(doc)
-        file_size = pdf_path.stat().st_size
-        pdf_version = getattr(doc, 'pdf_version', lambda: '1.4')()  # Default to 1.4 if not available
-        is_encrypted = getattr(doc, 'is_encrypted', False)
-        metadata = getattr(doc, 'metadata', {})
-        
-        # Analyze each page
-        text_density_per_page = []
-        image_density_per_page = []
-        total_text_chars = 0
-        total_images = 0
-        
-        for page_num in range(page_count):
-            page = doc[page_num]
+        with fitz.open(pdf_path) as doc:
+            # Basic info
+            page_count = len(doc)
+            file_size = pdf_path.stat().st_size
+            metadata = doc.metadata or {}
+            pdf_version = _pdf_version(doc, metadata)
+            is_encrypted = doc.is_encrypted
             
-            # Text analysis
-            text = page.get_text()
-            text_chars = len(text.strip())
-            text_density_per_page.append(text_chars)
-            total_text_chars += text_chars
+            text_density_per_page = [None] * page_count
+            image_density_per_page = [None] * page_count
+            total_text_chars = 0
+            total_images = 0
+            pages_analyzed = 0
             
-            # Image analysis
-            image_list = page.get_images()
-            image_count = len(image_list)
-            image_density_per_page.append(image_count)
-            total_images += image_count
-        
-        doc.close()
+            def analyze(page_num: int) -> None:
+                nonlocal total_text_chars, total_images, pages_analyzed
+                text_chars, image_count = _page_stats(doc, page_num)
+                text_density_per_page[page_num] = text_chars
+                image_density_per_page[page_num] = image_count
+                total_text_chars += text_chars
+                total_images += image_count
+                pages_analyzed += 1
+            
+            sample_is_conclusive = False
+            if page_count > SAMPLE_PAGE_THRESHOLD:
+                sample = _sample_pages(page_count)
+                for page_num in sample:
+                    analyze(page_num)
+                
+                # Trust the sample when every sampled page agrees
+                sample_is_conclusive = len({
+                    _page_looks_scanned(text_density_per_page[n], image_density_per_page[n])
+                    for n in sample
+                }) == 1
+            
+            if not sample_is_conclusive:
+                digital_text_chars = SCANNED_TEXT_THRESHOLD * page_count
+                for page_num in range(page_count):
+                    if text_density_per_page[page_num] is None:
+                        analyze(page_num)
+                    
+                    # Enough text for the whole document to average above the
+                    # scanned threshold: remaining pages cannot change the verdict
+                    if (total_text_chars >= digital_text_chars
+                            and page_num + 1 >= MIN_PAGES_BEFORE_EARLY_EXIT):
+                        logger.debug(f"Digital PDF confirmed after {page_num + 1} of {page_count} pages")
+                        break
         
         # Determine if scanned
-        avg_text_per_page = total_text_chars / page_count if page_count > 0 else 0
-        avg_images_per_page = total_images / page_count if page_count > 0 else 0
+        avg_text_per_page = total_text_chars / pages_analyzed if pages_analyzed > 0 else 0
+        avg_images_per_page = total_images / pages_analyzed if pages_analyzed > 0 else 0
         
         # Heuristics for scanned detection
         # If very little text but many images, likely scanned
         # If no text at all, definitely scanned
         is_scanned = (
-            avg_text_per_page < 100 and avg_images_per_page > 0.5
+            avg_text_per_page < SCANNED_TEXT_THRESHOLD and avg_images_per_page > 0.5
         ) or total_text_chars == 0
         
         has_text = total_text_chars > 0
@@ -104,7 +149,8 @@ def detect_pdf_type(pdf_path: Path) -> PDFInfo:
         logger.info(
             f"PDF analysis complete: {pdf_path.name} - "
             f"Pages: {page_count}, Scanned: {is_scanned}, "
-            f"Text chars: {total_text_chars}, Images: {total_images}"
+            f"Text chars: {total_text_chars}, Images: {total_images} "
+            f"({pages_analyzed} pages analyzed)"
         )
         
         return pdf_info
@@ -112,6 +158,51 @@ def detect_pdf_type(pdf_path: Path) -> PDFInfo:
     except Exception as e:
         logger.error(f"Failed to analyze PDF {pdf_path}: {e}")
         raise
+    finally:
+        # Drop MuPDF's cached fonts/glyphs so batch runs over many PDFs with
+        # disjoint font sets do not keep growing
+        fitz.TOOLS.store_shrink(100)
+
+
+def _pdf_version(doc: fitz.Document, metadata: Dict[str, Any]) -> str:
+    """PDF version string such as '1.7' (defaults to '1.4' if unknown)."""
+    if _HAS_PDF_VERSION:
+        return doc.pdf_version()
+    
+    pdf_format = metadata.get('format') or ''
+    if pdf_format.startswith('PDF '):
+        return pdf_format[4:]
+    return '1.4'
+
+
+def _page_stats(doc: fitz.Document, page_num: int) -> Tuple[int, int]:
+    """Text character count and image count for one page (0-based)."""
+    # Default flags, so counts match page.get_text() (ligatures and
+    # whitespace preserved)
+    text_chars = _stripped_length(doc[page_num].get_text())
+    image_count = len(doc.get_page_images(page_num))
+    return text_chars, image_count
+
+
+def _stripped_length(text: str) -> int:
+    """len(text.strip()) without allocating the stripped copy."""
+    start, end = 0, len(text)
+    while start < end and text[start].isspace():
+        start += 1
+    while end > start and text[end - 1].isspace():
+        end -= 1
+    return end - start
+
+
+def _page_looks_scanned(text_chars: int, image_count: int) -> bool:
+    """Per-page version of the scanned heuristic used by detect_pdf_type."""
+    return text_chars == 0 or (text_chars < SCANNED_TEXT_THRESHOLD and image_count > 0)
+
+
+def _sample_pages(page_count: int) -> List[int]:
+    """Evenly spread 0-based page sample including the first and last page."""
+    last = page_count - 1
+    return sorted({round(i * last / (SAMPLE_SIZE - 1)) for i in range(SAMPLE_SIZE)})
 
 
 def should_use_ocr(pdf_info: PDFInfo, ocr_mode: str = "auto") -> bool:
@@ -146,48 +237,44 @@ def get_recommended_extractors(pdf_info: PDFInfo) -> List[str]:
     Returns:
         List of recommended extractor names
     """
-    extractors = []
-    
     if pdf_info.has_text and not pdf_info.is_scanned:
         # Digital PDF with text - use text-based extractors
-        extractors.extend([
-            "pdfplumber",
-            "camelot-lattice",
-            "camelot-stream",
-            "tabula"
-        ])
-    
-    if pdf_info.is_scanned or not pdf_info.has_text:
-        # Scanned PDF - OCR will be needed
-        extractors.append("tesseract")
+        return [*DIGITAL_EXTRACTORS, *CLOUD_EXTRACTORS]
     
-    # Cloud extractors can handle both types
-    extractors.extend([
-        "adobe",
-        "amazon-detect-text",
-        "amazon-analyze-document",
-        "docai",
-        "azure"
-    ])
-    
-    return extractors
+    # Scanned PDF - OCR will be needed
+    return [*SCANNED_EXTRACTORS, *CLOUD_EXTRACTORS]
 
 
-def validate_pdf(pdf_path: Path) -> bool:
+def validate_pdf(pdf_path: Path, strict: bool = False) -> bool:
     """
     Validate that the file is a readable PDF.
     
+    By default only the PDF header and the %%EOF trailer marker are checked,
+    which costs two small reads regardless of file size.
+    
     Args:
         pdf_path: Path to PDF file
+        strict: Also open the document and require at least one page
         
     Returns:
         Whether the PDF is valid and readable
     """
     try:
-        doc = fitz.open(pdf_path)
-        page_count = len(doc)
-        doc.close()
-        return page_count > 0
+        with open(pdf_path, 'rb') as f:
+            # Readers accept the header anywhere in the first 1 KB
+            if b'%PDF-' not in f.read(PDF_PROBE_SIZE):
+                return False
+            
+            f.seek(0, os.SEEK_END)
+            f.seek(max(f.tell() - PDF_PROBE_SIZE, 0))
+            if b'%%EOF' not in f.read():
+                return False
+        
+        if not strict:
+            return True
+        
+        with fitz.open(pdf_path) as doc:
+            return len(doc) > 0
     except Exception as e:
         logger.error(f"PDF validation failed for {pdf_path}: {e}")
         return False
@@ -207,7 +294,9 @@ def parse_page_range(page_range: Optional[str], total_pages: int) -> List[int]:
     if not page_range:
         return list(range(1, total_pages + 1))
     
-    pages = set()
+    # One flag byte per page; ranges are filled with slice assignment and the
+    # result comes out already sorted and de-duplicated
+    selected = bytearray(total_pages + 1)
     
     for part in page_range.split(','):
         part = part.strip()
@@ -221,12 +310,12 @@ def parse_page_range(page_range: Optional[str], total_pages: int) -> List[int]:
             if start < 1 or end > total_pages or start > end:
                 raise ValueError(f"Invalid page range: {part}")
             
-            pages.update(range(start, end + 1))
+            selected[start:end + 1] = b'\x01' * (end - start + 1)
         else:
             # Single page
             page = int(part)
             if page < 1 or page > total_pages:
                 raise ValueError(f"Invalid page number: {page}")
-            pages.add(page)
+            selected[page] = 1
     
-    return sorted(list(pages))
+    return [page for page, flag in enumerate(selected) if flag]
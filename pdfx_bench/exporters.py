@@ -8,14 +8,53 @@ from pathlib import Path
 from typing import Dict, Any, List, Optional
 import json
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, wait
 from .schema import ExtractionResult, ExtractionMethod
 from .utils.io import save_json, save_jsonl, save_csv, ensure_dir
 
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Writer threads shared by every export_extraction_result call (one per
+# output format)
+EXPORT_WORKERS = 4
+
+# Markdown report markers: medals for the top ranks, colour by quality score
+RANK_EMOJI = ("🥇", "🥈", "🥉")
+QUALITY_EMOJI = ((0.8, "🟢"), (0.6, "🟡"))
+
+# Table cell column -> Arrow type for Parquet export (also the CSV column
+# order); explicit so all-empty columns still get a type
+TABLE_CSV_SCHEMA = {
+    'table_id': 'string',
+    'row': 'int64',
+    'col': 'int64',
+    'text': 'string',
+    'is_header': 'bool',
+    'parsed_number': 'float64',
+    'parsed_date': 'string',
+    'page': 'int64',
+    'confidence': 'float64',
+    'bbox_x0': 'float64',
+    'bbox_y0': 'float64',
+    'bbox_x1': 'float64',
+    'bbox_y1': 'float64'
+}
+
 
 class ResultExporter:
-    """Export extraction results in various formats."""
+    """
+    Export extraction results in various formats.
+    
+    The exporter owns a small writer thread pool; call close() (or use it as
+    a context manager) when done.
+    """
     
     def __init__(self, output_dir: Path):
         """
@@ -35,11 +74,26 @@ class ResultExporter:
         ensure_dir(self.results_dir)
         ensure_dir(self.reports_dir)
         ensure_dir(self.quarantine_dir)
+        
+        self._pool = ThreadPoolExecutor(
+            max_workers=EXPORT_WORKERS, thread_name_prefix='pdfx-export'
+        )
+    
+    def close(self) -> None:
+        """Shut down the writer threads, waiting for pending writes."""
+        self._pool.shutdown(wait=True)
+    
+    def __enter__(self) -> 'ResultExporter':
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
     
     def export_extraction_result(
         self,
         result: ExtractionResult,
-        document_id: str
+        document_id: str,
+        table_format: str = 'csv'
     ) -> Dict[str, Path]:
         """
         Export a single extraction result in multiple formats.
@@ -47,6 +101,7 @@ class ResultExporter:
         Args:
             result: ExtractionResult to export
             document_id: Document identifier for file naming
+            table_format: Table cell output format ('csv' or 'parquet')
             
         Returns:
             Dictionary of format -> file path
@@ -60,48 +115,70 @@ class ResultExporter:
         method_dir = self.results_dir / method_name
         ensure_dir(method_dir)
         
-        # Export as JSON
-        json_path = method_dir / f"{base_name}.json"
-        save_json(result.dict(), json_path)
-        exported_files['json'] = json_path
-        
-        # Export tables as CSV
-        if result.document.tables:
-            csv_data = self._tables_to_csv_data(result.document.tables)
-            csv_path = method_dir / f"{base_name}_tables.csv"
-            save_csv(csv_data, csv_path)
-            exported_files['tables_csv'] = csv_path
+        # Dump the whole result once; the per-format exports read plain dicts
+        dumped = result.model_dump()
+        document = dumped['document']
         
-        # Export text blocks as JSONL
-        if result.document.text_blocks:
-            text_data = [
-                {
-                    'text': block.text,
-                    'page': block.provenance.page,
-                    'bbox': block.provenance.bbox.dict() if block.provenance.bbox else None,
-                    'confidence': block.provenance.confidence
-                }
-                for block in result.document.text_blocks
-            ]
-            jsonl_path = method_dir / f"{base_name}_text.jsonl"
-            save_jsonl(text_data, jsonl_path)
-            exported_files['text_jsonl'] = jsonl_path
+        # The format sinks are independent, so write them concurrently; the
+        # table columns are built here while the JSON file is being written,
+        # and the JSONL records are generated lazily by their writer threads
+        pool = self._pool
+        writes = []
+        try:
+            # Export as JSON
+            json_path = method_dir / f"{base_name}.json"
+            writes.append(pool.submit(save_json, dumped, json_path))
+            exported_files['json'] = json_path
+            
+            # Export tables as CSV or Parquet
+            if document['tables']:
+                table_columns = self._tables_to_csv_columns(document['tables'])
+                if table_format == 'parquet':
+                    parquet_path = method_dir / f"{base_name}_tables.parquet"
+                    writes.append(pool.submit(self._save_tables_parquet, table_columns, parquet_path))
+                    exported_files['tables_parquet'] = parquet_path
+                else:
+                    csv_path = method_dir / f"{base_name}_tables.csv"
+                    writes.append(pool.submit(self._save_tables_csv, table_columns, csv_path))
+                    exported_files['tables_csv'] = csv_path
+            
+            # Export text blocks as JSONL
+            if document['text_blocks']:
+                text_data = (
+                    {
+                        'text': block['text'],
+                        'page': block['provenance']['page'],
+                        'bbox': block['provenance']['bbox'],
+                        'confidence': block['provenance']['confidence']
+                    }
+                    for block in document['text_blocks']
+                )
+                jsonl_path = method_dir / f"{base_name}_text.jsonl"
+                writes.append(pool.submit(save_jsonl, text_data, jsonl_path))
+                exported_files['text_jsonl'] = jsonl_path
+            
+            # Export key-value pairs
+            if document['key_values']:
+                kv_data = (
+                    {
+                        'key': kv['key'],
+                        'value': kv['value'],
+                        'page': kv['provenance']['page'],
+                        'bbox': kv['provenance']['bbox'],
+                        'confidence': kv['provenance']['confidence']
+                    }
+                    for kv in document['key_values']
+                )
+                kv_path = method_dir / f"{base_name}_keyvalues.jsonl"
+                writes.append(pool.submit(save_jsonl, kv_data, kv_path))
+                exported_files['keyvalues_jsonl'] = kv_path
+        finally:
+            # Never return (or raise) with writes still running
+            wait(writes)
         
-        # Export key-value pairs
-        if result.document.key_values:
-            kv_data = [
-                {
-                    'key': kv.key,
-                    'value': kv.value,
-                    'page': kv.provenance.page,
-                    'bbox': kv.provenance.bbox.dict() if kv.provenance.bbox else None,
-                    'confidence': kv.provenance.confidence
-                }
-                for kv in result.document.key_values
-            ]
-            kv_path = method_dir / f"{base_name}_keyvalues.jsonl"
-            save_jsonl(kv_data, kv_path)
-            exported_files['keyvalues_jsonl'] = kv_path
+        # Re-raise the first write error, as the sequential version did
+        for write in writes:
+            write.result()
         
         logger.debug(f"Exported {method_name} results to {len(exported_files)} files")
         return exported_files
@@ -151,29 +228,89 @@ class ResultExporter:
         logger.info(f"Exported {len(quarantine_entries)} quarantine entries to {quarantine_path}")
         return quarantine_path
     
-    def _tables_to_csv_data(self, tables: List[Any]) -> List[Dict[str, Any]]:
-        """Convert tables to CSV-friendly data."""
-        csv_data = []
+    def _tables_to_csv_columns(self, tables: List[Dict[str, Any]]) -> Dict[str, List[Any]]:
+        """Convert dumped tables (``model_dump`` dicts) to CSV columns, one cell per row."""
+        columns = {name: [] for name in TABLE_CSV_SCHEMA}
+        no_bbox = {'x0': None, 'y0': None, 'x1': None, 'y1': None}
+        
+        table_ids = columns['table_id']
+        rows = columns['row']
+        cols = columns['col']
+        texts = columns['text']
+        headers = columns['is_header']
+        numbers = columns['parsed_number']
+        dates = columns['parsed_date']
+        pages = columns['page']
+        confidences = columns['confidence']
+        x0s = columns['bbox_x0']
+        y0s = columns['bbox_y0']
+        x1s = columns['bbox_x1']
+        y1s = columns['bbox_y1']
         
         for table in tables:
-            for cell in table.cells:
-                csv_data.append({
-                    'table_id': table.table_id,
-                    'row': cell.row_idx,
-                    'col': cell.col_idx,
-                    'text': cell.raw_text,
-                    'is_header': cell.is_header,
-                    'parsed_number': cell.parsed_number,
-                    'parsed_date': cell.parsed_date,
-                    'page': cell.provenance.page,
-                    'confidence': cell.provenance.confidence,
-                    'bbox_x0': cell.provenance.bbox.x0 if cell.provenance.bbox else None,
-                    'bbox_y0': cell.provenance.bbox.y0 if cell.provenance.bbox else None,
-                    'bbox_x1': cell.provenance.bbox.x1 if cell.provenance.bbox else None,
-                    'bbox_y1': cell.provenance.bbox.y1 if cell.provenance.bbox else None
-                })
+            table_id = table['table_id']
+            for cell in table['cells']:
+                provenance = cell['provenance']
+                bbox = provenance['bbox'] or no_bbox
+                table_ids.append(table_id)
+                rows.append(cell['row_idx'])
+                cols.append(cell['col_idx'])
+                texts.append(cell['raw_text'])
+                headers.append(cell['is_header'])
+                numbers.append(cell['parsed_number'])
+                dates.append(cell['parsed_date'])
+                pages.append(provenance['page'])
+                confidences.append(provenance['confidence'])
+                x0s.append(bbox['x0'])
+                y0s.append(bbox['y0'])
+                x1s.append(bbox['x1'])
+                y1s.append(bbox['y1'])
+        
+        return columns
+    
+    def _save_tables_csv(self, columns: Dict[str, List[Any]], csv_path: Path) -> None:
+        """
+        Write table CSV columns through save_csv, one row per cell.
+        
+        Arrow's CSV writer is not used: it quotes every string, lowercases
+        booleans and drops the trailing .0 from whole floats, so its output
+        would differ from every other CSV this package writes.
         
-        return csv_data
+        Args:
+            columns: Column name -> values, as built by _tables_to_csv_columns
+            csv_path: Output CSV file
+        """
+        save_csv([dict(zip(columns, values)) for values in zip(*columns.values())], csv_path)
+    
+    def _save_tables_parquet(self, columns: Dict[str, List[Any]], parquet_path: Path) -> None:
+        """
+        Write table columns as a zstd-compressed Parquet file.
+        
+        Args:
+            columns: Column name -> values, as built by _tables_to_csv_columns
+            parquet_path: Output Parquet file
+        """
+        if not PYARROW_AVAILABLE:
+            raise RuntimeError(
+                "pyarrow is required for Parquet export. "
+                "Install with: pip install pyarrow"
+            )
+        
+        pq.write_table(
+            self._columns_to_arrow(columns),
+            str(parquet_path),
+            compression='zstd',
+            use_dictionary=True
+        )
+        logger.debug(f"Saved Parquet to {parquet_path}")
+    
+    @staticmethod
+    def _columns_to_arrow(columns: Dict[str, List[Any]]) -> "pa.Table":
+        """Build an Arrow table from table cell columns using TABLE_CSV_SCHEMA types."""
+        return pa.table({
+            name: pa.array(values, type=pa.type_for_alias(TABLE_CSV_SCHEMA[name]))
+            for name, values in columns.items()
+        })
     
     def _export_markdown_report(
         self,
@@ -183,103 +320,110 @@ class ResultExporter:
         """Export comparison report as Markdown."""
         report_path = self.reports_dir / f"{document_id}_comparison.md"
 
-        with open(report_path, 'w', encoding='utf-8') as f:
-            f.write(f"# PDFX-Bench Extraction Comparison Report\n\n")
-            f.write(f"     **Document:** `{document_id}.pdf`\n")
-            f.write(f"     **Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
+        # Collect the report and write it in one call
+        parts: List[str] = []
+        write = parts.append
+        write(f"# PDFX-Bench Extraction Comparison Report\n\n")
+        write(f"     **Document:** `{document_id}.pdf`\n")
+        write(f"     **Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
 
-            # Executive Summary
-            f.write("## 🎯 Executive Summary\n\n")
-            f.write("This report compares multiple PDF extraction methods using deterministic, ")
-            f.write("no-hallucination algorithms. Each method is scored on accuracy, completeness, ")
-            f.write("and data quality.\n\n")
+        # Executive Summary
+        write("## 🎯 Executive Summary\n\n")
+        write("This report compares multiple PDF extraction methods using deterministic, ")
+        write("no-hallucination algorithms. Each method is scored on accuracy, completeness, ")
+        write("and data quality.\n\n")
 
-            f.write(f"- **Methods Tested:** {comparison.get('total_methods', 0)}\n")
-            best_overall = comparison.get('best_overall', 'N/A')
-            if hasattr(best_overall, 'value'):
-                best_overall = best_overall.value
-            f.write(f"- **Best Overall:** {best_overall}\n")
+        write(f"- **Methods Tested:** {comparison.get('total_methods', 0)}\n")
+        best_overall = comparison.get('best_overall', 'N/A')
+        if hasattr(best_overall, 'value'):
+            best_overall = best_overall.value
+        write(f"- **Best Overall:** {best_overall}\n")
 
-            best_tables = comparison.get('best_tables', 'N/A')
-            if hasattr(best_tables, 'value'):
-                best_tables = best_tables.value
-            f.write(f"- **Best for Tables:** {best_tables}\n")
+        best_tables = comparison.get('best_tables', 'N/A')
+        if hasattr(best_tables, 'value'):
+            best_tables = best_tables.value
+        write(f"- **Best for Tables:** {best_tables}\n")
 
-            best_text = comparison.get('best_text', 'N/A')
-            if hasattr(best_text, 'value'):
-                best_text = best_text.value
-            f.write(f"- **Best for Text:** {best_text}\n\n")
-            
-            # Method Rankings
-            f.write("##  Method Rankings\n\n")
-            f.write("Methods ranked by overall extraction quality:\n\n")
-            rankings = comparison.get('method_rankings', [])
-            for i, method in enumerate(rankings, 1):
-                method_name = method.value if hasattr(method, 'value') else method
-                emoji = "🥇" if i == 1 else "🥈" if i == 2 else "🥉" if i == 3 else "📊"
-                f.write(f"{emoji} **{i}. {method_name}**\n")
-            f.write("\n")
+        best_text = comparison.get('best_text', 'N/A')
+        if hasattr(best_text, 'value'):
+            best_text = best_text.value
+        write(f"- **Best for Text:** {best_text}\n\n")
+        
+        # Method Rankings
+        write("##  Method Rankings\n\n")
+        write("Methods ranked by overall extraction quality:\n\n")
+        rankings = comparison.get('method_rankings', [])
+        for i, method in enumerate(rankings, 1):
+            method_name = method.value if hasattr(method, 'value') else method
+            emoji = RANK_EMOJI[i - 1] if i <= len(RANK_EMOJI) else "📊"
+            write(f"{emoji} **{i}. {method_name}**\n")
+        write("\n")
 
-            # Detailed Scores
-            f.write("##  Performance Metrics\n\n")
-            detailed_scores = comparison.get('detailed_scores', {})
+        # Detailed Scores
+        write("##  Performance Metrics\n\n")
+        detailed_scores = comparison.get('detailed_scores', {})
 
-            if detailed_scores:
-                # Create table header
-                f.write("| Method | Quality Score | Tables Found | Text Blocks | Confidence | Time (sec) |\n")
-                f.write("|--------|---------------|--------------|-------------|------------|------------|\n")
+        if detailed_scores:
+            # Create table header
+            write("| Method | Quality Score | Tables Found | Text Blocks | Confidence | Time (sec) |\n")
+            write("|--------|---------------|--------------|-------------|------------|------------|\n")
 
-                for method, scores in detailed_scores.items():
-                    overall = scores.get('overall_score', 0)
-                    tables = scores.get('basic_metrics', {}).get('total_tables', 0)
-                    text_blocks = scores.get('basic_metrics', {}).get('total_text_blocks', 0)
-                    confidence = scores.get('basic_metrics', {}).get('avg_confidence')
-                    proc_time = scores.get('processing_time', 0)
+            for method, scores in detailed_scores.items():
+                overall = scores.get('overall_score', 0)
+                basic = scores.get('basic_metrics', {})
+                tables = basic.get('total_tables', 0)
+                text_blocks = basic.get('total_text_blocks', 0)
+                confidence = basic.get('avg_confidence')
+                proc_time = scores.get('processing_time', 0)
 
-                    # Format confidence
-                    if confidence is None:
-                        conf_str = "N/A*"
-                    else:
-                        conf_str = f"{confidence:.3f}"
+                # Format confidence
+                if confidence is None:
+                    conf_str = "N/A*"
+                else:
+                    conf_str = f"{confidence:.3f}"
 
-                    # Add quality indicator
-                    quality_emoji = "🟢" if overall >= 0.8 else "🟡" if overall >= 0.6 else "🔴"
+                # Add quality indicator
+                quality_emoji = next(
+                    (emoji for threshold, emoji in QUALITY_EMOJI if overall >= threshold), "🔴"
+                )
 
-                    f.write(f"| {quality_emoji} {method} | {overall:.3f} | {tables} | {text_blocks} | {conf_str} | {proc_time:.3f} |\n")
+                write(f"| {quality_emoji} {method} | {overall:.3f} | {tables} | {text_blocks} | {conf_str} | {proc_time:.3f} |\n")
+        
+        write("\n")
+        write("**Notes:**\n")
+        write("- *Quality Score: 0-1 scale (higher is better)\n")
+        write("- *N/A: Local extractors don't provide confidence scores (cloud APIs do)\n")
+        write("- *Time: Processing time in seconds\n\n")
+
+        # Quality Metrics
+        write("## 🔍 Detailed Quality Analysis\n\n")
+        for method, scores in detailed_scores.items():
+            write(f"### {method}\n\n")
+            
+            basic = scores.get('basic_metrics', {})
+            table_metrics = scores.get('table_metrics', {})
+            text_metrics = scores.get('text_metrics', {})
+            
+            write("**Basic Metrics:**\n")
+            write(f"- Success: {basic.get('success', False)}\n")
+            write(f"- Empty Cell Rate: {basic.get('empty_cell_rate', 0):.3f}\n")
+            write(f"- Average Confidence: {basic.get('avg_confidence', 'N/A')}\n\n")
+            
+            if table_metrics.get('table_count', 0) > 0:
+                write("**Table Metrics:**\n")
+                write(f"- Table Count: {table_metrics.get('table_count', 0)}\n")
+                write(f"- Avg Rows per Table: {table_metrics.get('avg_rows_per_table', 0):.1f}\n")
+                write(f"- Avg Cols per Table: {table_metrics.get('avg_cols_per_table', 0):.1f}\n")
+                write(f"- Numeric Parse Rate: {table_metrics.get('numeric_cell_parse_rate', 0):.3f}\n")
+                write(f"- Completeness Score: {table_metrics.get('table_completeness_score', 0):.3f}\n\n")
             
-            f.write("\n")
-            f.write("**Notes:**\n")
-            f.write("- *Quality Score: 0-1 scale (higher is better)\n")
-            f.write("- *N/A: Local extractors don't provide confidence scores (cloud APIs do)\n")
-            f.write("- *Time: Processing time in seconds\n\n")
+            if text_metrics.get('text_block_count', 0) > 0:
+                write("**Text Metrics:**\n")
+                write(f"- Text Block Count: {text_metrics.get('text_block_count', 0)}\n")
+                write(f"- Total Characters: {text_metrics.get('total_characters', 0)}\n")
+                write(f"- Readable Text Rate: {text_metrics.get('readable_text_rate', 0):.3f}\n\n")
 
-            # Quality Metrics
-            f.write("## 🔍 Detailed Quality Analysis\n\n")
-            for method, scores in detailed_scores.items():
-                f.write(f"### {method}\n\n")
-                
-                basic = scores.get('basic_metrics', {})
-                table_metrics = scores.get('table_metrics', {})
-                text_metrics = scores.get('text_metrics', {})
-                
-                f.write("**Basic Metrics:**\n")
-                f.write(f"- Success: {basic.get('success', False)}\n")
-                f.write(f"- Empty Cell Rate: {basic.get('empty_cell_rate', 0):.3f}\n")
-                f.write(f"- Average Confidence: {basic.get('avg_confidence', 'N/A')}\n\n")
-                
-                if table_metrics.get('table_count', 0) > 0:
-                    f.write("**Table Metrics:**\n")
-                    f.write(f"- Table Count: {table_metrics.get('table_count', 0)}\n")
-                    f.write(f"- Avg Rows per Table: {table_metrics.get('avg_rows_per_table', 0):.1f}\n")
-                    f.write(f"- Avg Cols per Table: {table_metrics.get('avg_cols_per_table', 0):.1f}\n")
-                    f.write(f"- Numeric Parse Rate: {table_metrics.get('numeric_cell_parse_rate', 0):.3f}\n")
-                    f.write(f"- Completeness Score: {table_metrics.get('table_completeness_score', 0):.3f}\n\n")
-                
-                if text_metrics.get('text_block_count', 0) > 0:
-                    f.write("**Text Metrics:**\n")
-                    f.write(f"- Text Block Count: {text_metrics.get('text_block_count', 0)}\n")
-                    f.write(f"- Total Characters: {text_metrics.get('total_characters', 0)}\n")
-                    f.write(f"- Readable Text Rate: {text_metrics.get('readable_text_rate', 0):.3f}\n\n")
+        report_path.write_text("".join(parts), encoding='utf-8')
         
         logger.info(f"Markdown report exported to {report_path}")
         return report_path
@@ -326,11 +470,13 @@ class ResultExporter:
 """
         
         rankings = comparison.get('method_rankings', [])
-        for method in rankings:
-            method_name = method.value if hasattr(method, 'value') else method
-            html_content += f"        <li>{method_name}</li>\n"
+        parts = [html_content]
+        parts.extend(
+            f"        <li>{method.value if hasattr(method, 'value') else method}</li>\n"
+            for method in rankings
+        )
         
-        html_content += """    </ol>
+        parts.append("""    </ol>
     
     <h2>Detailed Scores</h2>
     <table>
@@ -342,19 +488,20 @@ class ResultExporter:
             <th>Avg Confidence</th>
             <th>Processing Time</th>
         </tr>
-"""
+""")
         
         detailed_scores = comparison.get('detailed_scores', {})
         for method, scores in detailed_scores.items():
             overall = scores.get('overall_score', 0)
-            tables = scores.get('basic_metrics', {}).get('total_tables', 0)
-            text_blocks = scores.get('basic_metrics', {}).get('total_text_blocks', 0)
-            confidence = scores.get('basic_metrics', {}).get('avg_confidence', 'N/A')
+            basic = scores.get('basic_metrics', {})
+            tables = basic.get('total_tables', 0)
+            text_blocks = basic.get('total_text_blocks', 0)
+            confidence = basic.get('avg_confidence', 'N/A')
             proc_time = scores.get('processing_time', 0)
             
             conf_str = f"{confidence:.3f}" if isinstance(confidence, (int, float)) else str(confidence)
             
-            html_content += f"""        <tr>
+            parts.append(f"""        <tr>
             <td>{method}</td>
             <td class="score">{overall:.3f}</td>
             <td>{tables}</td>
@@ -362,14 +509,13 @@ class ResultExporter:
             <td>{conf_str}</td>
             <td>{proc_time:.2f}s</td>
         </tr>
-"""
+""")
         
-        html_content += """    </table>
+        parts.append("""    </table>
 </body>
-</html>"""
+</html>""")
         
-        with open(report_path, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+        report_path.write_text("".join(parts), encoding='utf-8')
         
         logger.info(f"HTML report exported to {report_path}")
         return report_path
@@ -3,22 +3,54 @@ Normalization utilities for PDFX-Bench.
 Convert extractor-specific outputs to canonical schema.
 """
 
+import functools
 import logging
-from typing import Dict, Any, List, Optional
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Union
 from .schema import (
     Document, Table, TableCell, TextBlock, KeyValue,
-    ExtractionMethod, ExtractionResult
+    ExtractionMethod, ExtractionResult, parse_numbers_batch
 )
 from .utils.timers import time_operation
+from .utils.io import ensure_dir, encode_jsonl_line
 
 logger = logging.getLogger(__name__)
 
+# Control characters dropped by _clean_text (newlines and tabs are kept)
+_CONTROL_CHAR_TABLE = dict.fromkeys(c for c in range(32) if chr(c) not in '\n\t')
+
+
+def _utc_timestamp() -> str:
+    """Current UTC time as an ISO 8601 string with a 'Z' suffix."""
+    return datetime.now(timezone.utc).replace(tzinfo=None).isoformat() + 'Z'
+
+
+@functools.lru_cache(maxsize=8192)
+def _clean_text_cached(text: str) -> str:
+    """Collapse whitespace and drop control characters; cached since cell text repeats a lot."""
+    return " ".join(text.split()).translate(_CONTROL_CHAR_TABLE).strip()
+
 
 class DataNormalizer:
     """Normalizes data from different extractors to canonical schema."""
     
-    def __init__(self):
+    def __init__(self, quarantine_path: Optional[Union[str, Path]] = None):
+        """
+        Initialize normalizer.
+        
+        Args:
+            quarantine_path: JSONL file to append quarantine entries to as they
+                occur; if None, entries are kept in memory
+        """
         self.quarantine_entries = []
+        self._quarantine_timestamp: Optional[str] = None
+        self._quarantine_file = None
+        
+        if quarantine_path is not None:
+            quarantine_path = Path(quarantine_path)
+            ensure_dir(quarantine_path.parent)
+            self._quarantine_file = open(quarantine_path, 'ab', buffering=1 << 16)
     
     def normalize_extraction_result(
         self,
@@ -41,6 +73,9 @@ class DataNormalizer:
         Returns:
             Normalized ExtractionResult
         """
+        # Quarantine entries from one result share a timestamp
+        self._quarantine_timestamp = None
+        
         with time_operation("normalize_extraction_result"):
             if not success or not isinstance(raw_result, Document):
                 # Create empty document for failed extractions
@@ -54,34 +89,35 @@ class DataNormalizer:
                 # Apply normalization rules
                 document = self._apply_normalization_rules(document, method)
             
-            # Calculate quality metrics
+            # Calculate quality metrics and average confidence in one sweep
             total_text_blocks = len(document.text_blocks)
             total_tables = len(document.tables)
-            total_cells = sum(len(table.cells) for table in document.tables)
-            empty_cells = sum(
-                1 for table in document.tables
-                for cell in table.cells
-                if not cell.raw_text.strip()
-            )
+            total_cells = 0
+            empty_cells = 0
+            conf_sum = 0.0
+            conf_count = 0
             
-            # Calculate average confidence
-            confidences = []
             for table in document.tables:
-                if table.provenance.confidence is not None:
-                    confidences.append(table.provenance.confidence)
+                confidence = table.provenance.confidence
+                if confidence is not None:
+                    conf_sum += confidence
+                    conf_count += 1
+                total_cells += len(table.cells)
                 for cell in table.cells:
-                    if cell.provenance.confidence is not None:
-                        confidences.append(cell.provenance.confidence)
-            
-            for text_block in document.text_blocks:
-                if text_block.provenance.confidence is not None:
-                    confidences.append(text_block.provenance.confidence)
+                    if not cell.raw_text.strip():
+                        empty_cells += 1
+                    confidence = cell.provenance.confidence
+                    if confidence is not None:
+                        conf_sum += confidence
+                        conf_count += 1
             
-            for kv in document.key_values:
-                if kv.provenance.confidence is not None:
-                    confidences.append(kv.provenance.confidence)
+            for item in (*document.text_blocks, *document.key_values):
+                confidence = item.provenance.confidence
+                if confidence is not None:
+                    conf_sum += confidence
+                    conf_count += 1
             
-            avg_confidence = sum(confidences) / len(confidences) if confidences else None
+            avg_confidence = conf_sum / conf_count if conf_count else None
             
             result = ExtractionResult(
                 document=document,
@@ -126,16 +162,13 @@ class DataNormalizer:
             if normalized_kv:
                 normalized_key_values.append(normalized_kv)
         
-        # Create normalized document
-        normalized_document = Document(
-            id=document.id,
-            file_name=document.file_name,
-            page_count=document.page_count,
-            text_blocks=normalized_text_blocks,
-            tables=normalized_tables,
-            key_values=normalized_key_values,
-            extraction_metadata=document.extraction_metadata
-        )
+        # Create normalized document (model_copy skips re-validating the
+        # already validated fields)
+        normalized_document = document.model_copy(update={
+            'text_blocks': normalized_text_blocks,
+            'tables': normalized_tables,
+            'key_values': normalized_key_values
+        })
         
         return normalized_document
     
@@ -150,19 +183,20 @@ class DataNormalizer:
             normalized_text = self._clean_text(text_block.text)
             
             if not normalized_text.strip():
-                logger.debug(f"Empty text block after normalization from {method}")
+                logger.debug("Empty text block after normalization from %s", method.value)
                 return None
             
+            # Already clean: keep the original block
+            if normalized_text == text_block.text:
+                return text_block
+            
             # Create normalized text block
-            normalized_block = TextBlock(
-                text=normalized_text,
-                provenance=text_block.provenance
-            )
+            normalized_block = text_block.model_copy(update={'text': normalized_text})
             
             return normalized_block
         
         except Exception as e:
-            logger.warning(f"Failed to normalize text block from {method}: {e}")
+            logger.warning("Failed to normalize text block from %s: %s", method.value, e)
             self._quarantine_data(text_block.dict(), method, str(e))
             return None
     
@@ -175,60 +209,82 @@ class DataNormalizer:
         try:
             normalized_cells = []
             
-            for cell in table.cells:
-                normalized_cell = self._normalize_table_cell(cell, method)
+            # Clean every cell, then parse the numbers of cells that lack one
+            # in a single batched scan
+            texts = [self._clean_text(cell.raw_text) for cell in table.cells]
+            numbers = parse_numbers_batch([
+                text if cell.parsed_number is None else ''
+                for cell, text in zip(table.cells, texts)
+            ])
+            
+            for cell, text, number in zip(table.cells, texts, numbers):
+                normalized_cell = self._normalize_table_cell(cell, method, text, number)
                 if normalized_cell is not None:  # Allow empty cells
                     normalized_cells.append(normalized_cell)
             
             if not normalized_cells:
-                logger.debug(f"No valid cells in table {table.table_id} from {method}")
+                logger.debug("No valid cells in table %s from %s", table.table_id, method.value)
                 return None
             
             # Validate table structure
             if not self._validate_table_structure(normalized_cells):
-                logger.warning(f"Invalid table structure for {table.table_id} from {method}")
+                logger.warning("Invalid table structure for %s from %s", table.table_id, method.value)
                 self._quarantine_data(table.dict(), method, "Invalid table structure")
                 return None
             
-            normalized_table = Table(
-                cells=normalized_cells,
-                table_id=table.table_id,
-                caption=table.caption,
-                provenance=table.provenance
-            )
+            # Every cell was already clean: keep the original table
+            if len(normalized_cells) == len(table.cells) and all(
+                normalized is cell for normalized, cell in zip(normalized_cells, table.cells)
+            ):
+                return table
+            
+            normalized_table = table.model_copy(update={'cells': normalized_cells})
             
             return normalized_table
         
         except Exception as e:
-            logger.warning(f"Failed to normalize table {table.table_id} from {method}: {e}")
+            logger.warning("Failed to normalize table %s from %s: %s", table.table_id, method.value, e)
             self._quarantine_data(table.dict(), method, str(e))
             return None
     
     def _normalize_table_cell(
         self,
         cell: TableCell,
-        method: ExtractionMethod
+        method: ExtractionMethod,
+        normalized_text: str,
+        parsed_number: Optional[float]
     ) -> Optional[TableCell]:
-        """Normalize a table cell."""
+        """
+        Normalize a table cell.
+        
+        Args:
+            cell: Cell to normalize
+            method: Extraction method used
+            normalized_text: Cleaned cell text
+            parsed_number: Number parsed from the cleaned text, if any
+            
+        Returns:
+            Normalized cell (the original one if nothing changed), or None
+        """
         try:
-            # Clean up cell text
-            normalized_text = self._clean_text(cell.raw_text)
+            # Create normalized cell (allow empty cells), filling in the number
+            # derived from the cleaned text as TableCell's validator would
+            update = {}
+            if normalized_text != cell.raw_text:
+                update['raw_text'] = normalized_text
+            if cell.parsed_number is None and parsed_number is not None:
+                update['parsed_number'] = parsed_number
             
-            # Create normalized cell (allow empty cells)
-            normalized_cell = TableCell(
-                raw_text=normalized_text,
-                row_idx=cell.row_idx,
-                col_idx=cell.col_idx,
-                is_header=cell.is_header,
-                provenance=cell.provenance,
-                parsed_number=cell.parsed_number,
-                parsed_date=cell.parsed_date
-            )
+            # Already clean: keep the original cell
+            if not update:
+                return cell
+            
+            normalized_cell = cell.model_copy(update=update)
             
             return normalized_cell
         
         except Exception as e:
-            logger.warning(f"Failed to normalize cell ({cell.row_idx}, {cell.col_idx}) from {method}: {e}")
+            logger.warning("Failed to normalize cell (%d, %d) from %s: %s", cell.row_idx, cell.col_idx, method.value, e)
             return None
     
     def _normalize_key_value(
@@ -243,47 +299,43 @@ class DataNormalizer:
             normalized_value = self._clean_text(kv.value)
             
             if not normalized_key.strip():
-                logger.debug(f"Empty key after normalization from {method}")
+                logger.debug("Empty key after normalization from %s", method.value)
                 return None
             
-            normalized_kv = KeyValue(
-                key=normalized_key,
-                value=normalized_value,
-                provenance=kv.provenance
-            )
+            # Already clean: keep the original pair
+            if normalized_key == kv.key and normalized_value == kv.value:
+                return kv
+            
+            normalized_kv = kv.model_copy(update={'key': normalized_key, 'value': normalized_value})
             
             return normalized_kv
         
         except Exception as e:
-            logger.warning(f"Failed to normalize key-value pair from {method}: {e}")
+            logger.warning("Failed to normalize key-value pair from %s: %s", method.value, e)
             self._quarantine_data(kv.dict(), method, str(e))
             return None
     
-    def _clean_text(self, text: str) -> str:
+    @staticmethod
+    def _clean_text(text: str) -> str:
         """Clean and normalize text content."""
         if not text:
             return ""
         
-        # Remove excessive whitespace
-        cleaned = " ".join(text.split())
-        
-        # Remove control characters but keep newlines and tabs
-        cleaned = "".join(char for char in cleaned if ord(char) >= 32 or char in '\n\t')
-        
-        return cleaned.strip()
+        return _clean_text_cached(text)
     
     def _validate_table_structure(self, cells: List[TableCell]) -> bool:
         """Validate that table has a consistent structure."""
         if not cells:
             return False
         
-        # Check for consistent row/column indices
-        rows = set(cell.row_idx for cell in cells)
-        cols = set(cell.col_idx for cell in cells)
-        
         # Check for reasonable table dimensions
-        max_row = max(rows) if rows else 0
-        max_col = max(cols) if cols else 0
+        max_row = 0
+        max_col = 0
+        for cell in cells:
+            if cell.row_idx > max_row:
+                max_row = cell.row_idx
+            if cell.col_idx > max_col:
+                max_col = cell.col_idx
         
         # Table should not be too sparse
         expected_cells = (max_row + 1) * (max_col + 1)
@@ -291,7 +343,7 @@ class DataNormalizer:
         
         # Allow up to 50% sparsity
         if actual_cells < expected_cells * 0.5:
-            logger.debug(f"Table too sparse: {actual_cells}/{expected_cells} cells")
+            logger.debug("Table too sparse: %d/%d cells", actual_cells, expected_cells)
             return False
         
         return True
@@ -303,23 +355,41 @@ class DataNormalizer:
         reason: str
     ) -> None:
         """Add data to quarantine for later review."""
-        from datetime import datetime
+        if self._quarantine_timestamp is None:
+            self._quarantine_timestamp = _utc_timestamp()
         
         quarantine_entry = {
             'original_data': data,
             'method': method.value,
             'failure_reason': reason,
             'page': data.get('provenance', {}).get('page', 1),
-            'timestamp': datetime.utcnow().isoformat() + 'Z'
+            'timestamp': self._quarantine_timestamp
         }
         
-        self.quarantine_entries.append(quarantine_entry)
-        logger.debug(f"Data quarantined: {reason}")
+        if self._quarantine_file is not None:
+            self._quarantine_file.write(encode_jsonl_line(quarantine_entry))
+        else:
+            self.quarantine_entries.append(quarantine_entry)
+        logger.debug("Data quarantined: %s", reason)
     
     def get_quarantine_entries(self) -> List[Dict[str, Any]]:
-        """Get all quarantine entries."""
+        """Get all in-memory quarantine entries (empty when streaming to a file)."""
         return self.quarantine_entries.copy()
     
     def clear_quarantine(self) -> None:
-        """Clear quarantine entries."""
+        """Clear in-memory quarantine entries and flush the quarantine file."""
         self.quarantine_entries.clear()
+        if self._quarantine_file is not None:
+            self._quarantine_file.flush()
+    
+    def close(self) -> None:
+        """Close the quarantine file, if one is open."""
+        if self._quarantine_file is not None:
+            self._quarantine_file.close()
+            self._quarantine_file = None
+    
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
@@ -3,12 +3,33 @@ Provenance tracking utilities for PDFX-Bench.
 Attach page/bbox/method/confidence to all extracted data.
 """
 
+import functools
 import logging
-from typing import Dict, Any, Optional, List
+import math
+from typing import Callable, Dict, Any, Iterable, NamedTuple, Optional, List, Tuple
+import numpy as np
 from .schema import Provenance, BoundingBox, ExtractionMethod
 
 logger = logging.getLogger(__name__)
 
+# Whether create_provenance keeps extractor-specific raw_data (see set_keep_raw_data)
+_keep_raw_data = True
+
+
+def set_keep_raw_data(keep: bool) -> None:
+    """
+    Choose whether provenance records keep extractor-specific raw_data.
+    
+    raw_data is often the bulk of a result's memory and output size and is
+    only needed for debugging, so runs that do not need it can drop it at
+    creation time. Applies to the current process.
+    
+    Args:
+        keep: False to store None instead of raw_data
+    """
+    global _keep_raw_data
+    _keep_raw_data = keep
+
 
 def create_provenance(
     method: ExtractionMethod,
@@ -25,7 +46,8 @@ def create_provenance(
         page: Page number (1-based)
         bbox: Bounding box coordinates if available
         confidence: Confidence score if available
-        raw_data: Original extractor-specific data
+        raw_data: Original extractor-specific data (dropped when disabled
+            with set_keep_raw_data)
         
     Returns:
         Provenance record
@@ -35,7 +57,7 @@ def create_provenance(
         page=page,
         bbox=bbox,
         confidence=confidence,
-        raw_data=raw_data
+        raw_data=raw_data if _keep_raw_data else None
     )
 
 
@@ -66,27 +88,29 @@ def create_bbox_from_dict(bbox_dict: Dict[str, float]) -> Optional[BoundingBox]:
         BoundingBox instance or None if invalid
     """
     try:
-        # Handle different bbox formats
-        if all(key in bbox_dict for key in ['x0', 'y0', 'x1', 'y1']):
+        # Handle different bbox formats; probe one distinguishing key per format
+        if 'x0' in bbox_dict:
             return BoundingBox(
                 x0=bbox_dict['x0'],
                 y0=bbox_dict['y0'],
                 x1=bbox_dict['x1'],
                 y1=bbox_dict['y1']
             )
-        elif all(key in bbox_dict for key in ['left', 'top', 'right', 'bottom']):
+        elif 'left' in bbox_dict:
             return BoundingBox(
                 x0=bbox_dict['left'],
                 y0=bbox_dict['top'],
                 x1=bbox_dict['right'],
                 y1=bbox_dict['bottom']
             )
-        elif all(key in bbox_dict for key in ['x', 'y', 'width', 'height']):
+        elif 'width' in bbox_dict:
+            x = bbox_dict['x']
+            y = bbox_dict['y']
             return BoundingBox(
-                x0=bbox_dict['x'],
-                y0=bbox_dict['y'],
-                x1=bbox_dict['x'] + bbox_dict['width'],
-                y1=bbox_dict['y'] + bbox_dict['height']
+                x0=x,
+                y0=y,
+                x1=x + bbox_dict['width'],
+                y1=y + bbox_dict['height']
             )
         else:
             logger.warning(f"Unknown bbox format: {bbox_dict}")
@@ -96,6 +120,14 @@ def create_bbox_from_dict(bbox_dict: Dict[str, float]) -> Optional[BoundingBox]:
         return None
 
 
+# Extractors that report confidence on a 0-100 scale (everything else is
+# expected in 0-1, with 0-100 values accepted as percentages)
+PERCENT_CONFIDENCE_METHODS = frozenset({
+    ExtractionMethod.AMAZON_TEXTRACT_DETECT,
+    ExtractionMethod.AMAZON_TEXTRACT_ANALYZE
+})
+
+
 def normalize_confidence(confidence: Any, method: ExtractionMethod) -> Optional[float]:
     """
     Normalize confidence scores from different extractors to 0-1 range.
@@ -112,37 +144,60 @@ def normalize_confidence(confidence: Any, method: ExtractionMethod) -> Optional[
     
     try:
         conf_float = float(confidence)
-        
-        # Different extractors use different confidence ranges
-        if method == ExtractionMethod.AWS_TEXTRACT:
-            # Textract uses 0-100 range
-            if 0 <= conf_float <= 100:
-                return conf_float / 100.0
-        elif method in [ExtractionMethod.GOOGLE_DOCAI_OCR, ExtractionMethod.GOOGLE_DOCAI_FORM, ExtractionMethod.GOOGLE_DOCAI_LAYOUT]:
-            # Document AI uses 0-1 range
-            if 0 <= conf_float <= 1:
-                return conf_float
-        elif method in [ExtractionMethod.AZURE_READ, ExtractionMethod.AZURE_LAYOUT]:
-            # Azure uses 0-1 range
-            if 0 <= conf_float <= 1:
-                return conf_float
-        elif method == ExtractionMethod.ADOBE_EXTRACT:
-            # Adobe uses 0-1 range
-            if 0 <= conf_float <= 1:
-                return conf_float
-        
-        # For other methods or unknown ranges, assume 0-1
-        if 0 <= conf_float <= 1:
-            return conf_float
-        elif 0 <= conf_float <= 100:
-            return conf_float / 100.0
-        else:
-            logger.warning(f"Confidence score {conf_float} out of expected range for {method}")
-            return None
-            
     except (ValueError, TypeError) as e:
         logger.warning(f"Failed to normalize confidence {confidence}: {e}")
         return None
+    
+    if 0.0 <= conf_float <= 1.0 and method not in PERCENT_CONFIDENCE_METHODS:
+        return conf_float
+    if 0.0 <= conf_float <= 100.0:
+        return conf_float / 100.0
+    
+    logger.warning(f"Confidence score {conf_float} out of expected range for {method}")
+    return None
+
+
+def normalize_confidence_array(confidences: np.ndarray, method: ExtractionMethod) -> np.ndarray:
+    """
+    Vectorized normalize_confidence for an array of raw scores.
+    
+    Args:
+        confidences: Raw confidence values
+        method: Extraction method
+        
+    Returns:
+        float64 array of normalized scores, NaN where a score is out of range
+    """
+    confidences = np.asarray(confidences, dtype=np.float64)
+    in_range = (confidences >= 0.0) & (confidences <= 100.0)
+    if method in PERCENT_CONFIDENCE_METHODS:
+        scaled = confidences / 100.0
+    else:
+        scaled = np.where(confidences <= 1.0, confidences, confidences / 100.0)
+    return np.where(in_range, scaled, np.nan)
+
+
+def _item_confidence(item: Any, confidence_attr: str) -> float:
+    """Confidence of an item as a float, NaN if it has none or it is not numeric."""
+    provenance = getattr(item, 'provenance', None)
+    if provenance is not None and hasattr(provenance, 'confidence'):
+        confidence = provenance.confidence
+    else:
+        confidence = getattr(item, confidence_attr, None)
+    
+    if confidence is None:
+        return math.nan
+    try:
+        return float(confidence)
+    except (TypeError, ValueError):
+        return math.nan
+
+
+class FilterStats(NamedTuple):
+    """Summary of a confidence filter pass."""
+    kept: int
+    dropped: int
+    avg_confidence: Optional[float]
 
 
 def filter_by_confidence(
@@ -153,6 +208,8 @@ def filter_by_confidence(
     """
     Filter items by minimum confidence threshold.
     
+    Items without a (numeric) confidence score are kept.
+    
     Args:
         items: List of items with confidence scores
         min_confidence: Minimum confidence threshold (0-1)
@@ -161,32 +218,53 @@ def filter_by_confidence(
     Returns:
         Filtered list of items
     """
-    filtered_items = []
+    return filter_and_summarize(items, min_confidence, confidence_attr)[0]
+
+
+def filter_and_summarize(
+    items: List[Any],
+    min_confidence: float,
+    confidence_attr: str = 'confidence'
+) -> Tuple[List[Any], FilterStats]:
+    """
+    Filter items by minimum confidence and summarize the kept items.
     
-    for item in items:
-        try:
-            # Get confidence from item
-            if hasattr(item, 'provenance') and hasattr(item.provenance, 'confidence'):
-                confidence = item.provenance.confidence
-            elif hasattr(item, confidence_attr):
-                confidence = getattr(item, confidence_attr)
-            else:
-                # No confidence available, include item
-                filtered_items.append(item)
-                continue
-            
-            # Filter by confidence
-            if confidence is None or confidence >= min_confidence:
-                filtered_items.append(item)
-            else:
-                logger.debug(f"Filtered item with confidence {confidence} < {min_confidence}")
-                
-        except Exception as e:
-            logger.warning(f"Error checking confidence for item: {e}")
-            # Include item if we can't check confidence
-            filtered_items.append(item)
+    Uses the same confidence array for the filter and the statistics, so
+    callers that need an average confidence do not walk the items again.
+    
+    Args:
+        items: List of items with confidence scores
+        min_confidence: Minimum confidence threshold (0-1)
+        confidence_attr: Attribute name for confidence score
+        
+    Returns:
+        Tuple of (filtered items, FilterStats). avg_confidence is the mean over
+        kept items that have a score, None if none of them do
+    """
+    if not items:
+        return [], FilterStats(kept=0, dropped=0, avg_confidence=None)
+    
+    confidences = np.fromiter(
+        (_item_confidence(item, confidence_attr) for item in items),
+        dtype=np.float64,
+        count=len(items)
+    )
+    scored = ~np.isnan(confidences)
+    keep = ~scored | (confidences >= min_confidence)
+    filtered_items = [items[i] for i in np.flatnonzero(keep)]
+    
+    kept_scores = confidences[keep & scored]
+    stats = FilterStats(
+        kept=len(filtered_items),
+        dropped=len(items) - len(filtered_items),
+        avg_confidence=float(kept_scores.mean()) if kept_scores.size else None
+    )
     
-    return filtered_items
+    logger.debug(
+        "Filtered %d of %d items with confidence < %s",
+        stats.dropped, len(items), min_confidence
+    )
+    return filtered_items, stats
 
 
 def add_provenance_to_raw_data(
@@ -215,6 +293,140 @@ def add_provenance_to_raw_data(
     return enhanced_data
 
 
+def _polygon_bbox(points: Iterable[Tuple[float, float]]) -> BoundingBox:
+    """Bounding box of a non-empty sequence of (x, y) vertices, found in one pass."""
+    points = iter(points)
+    x0, y0 = x1, y1 = next(points)
+    for x, y in points:
+        if x < x0:
+            x0 = x
+        elif x > x1:
+            x1 = x
+        if y < y0:
+            y0 = y
+        elif y > y1:
+            y1 = y
+    return BoundingBox(x0=x0, y0=y0, x1=x1, y1=y1)
+
+
+def _bbox_pdfplumber(raw_data: Dict[str, Any]) -> Optional[BoundingBox]:
+    """pdfplumber uses a 'bbox' (x0, top, x1, bottom) sequence."""
+    bbox = raw_data.get('bbox')
+    if isinstance(bbox, (list, tuple)) and len(bbox) == 4:
+        return BoundingBox(x0=bbox[0], y0=bbox[1], x1=bbox[2], y1=bbox[3])
+    return None
+
+
+def _bbox_textract(raw_data: Dict[str, Any]) -> Optional[BoundingBox]:
+    """Textract uses 'Geometry' -> 'BoundingBox'."""
+    geometry = raw_data.get('Geometry')
+    if geometry and 'BoundingBox' in geometry:
+        return create_bbox_from_dict(geometry['BoundingBox'])
+    return None
+
+
+def _docai_points(raw_data: Dict[str, Any]) -> List[Tuple[float, float]]:
+    """Document AI uses 'boundingPoly' -> 'vertices'."""
+    bounding_poly = raw_data.get('boundingPoly')
+    if bounding_poly:
+        return [(v.get('x', 0), v.get('y', 0)) for v in bounding_poly.get('vertices', [])]
+    return []
+
+
+def _azure_points(raw_data: Dict[str, Any]) -> List[Tuple[float, float]]:
+    """Azure uses 'boundingRegions' (first region's polygon)."""
+    regions = raw_data.get('boundingRegions')
+    if regions and 'polygon' in regions[0]:
+        return [(p['x'], p['y']) for p in regions[0]['polygon']]
+    return []
+
+
+def _bbox_docai(raw_data: Dict[str, Any]) -> Optional[BoundingBox]:
+    points = _docai_points(raw_data)
+    return _polygon_bbox(points) if points else None
+
+
+def _bbox_azure(raw_data: Dict[str, Any]) -> Optional[BoundingBox]:
+    points = _azure_points(raw_data)
+    return _polygon_bbox(points) if points else None
+
+
+# Method-specific bbox extractors; get_bbox_extractor falls back to
+# generic key probing when a method has none or it finds nothing
+_BBOX_EXTRACTORS: Dict[ExtractionMethod, Callable[[Dict[str, Any]], Optional[BoundingBox]]] = {
+    ExtractionMethod.PDFPLUMBER: _bbox_pdfplumber,
+    ExtractionMethod.AMAZON_TEXTRACT_DETECT: _bbox_textract,
+    ExtractionMethod.AMAZON_TEXTRACT_ANALYZE: _bbox_textract,
+    ExtractionMethod.GOOGLE_DOCAI_OCR: _bbox_docai,
+    ExtractionMethod.GOOGLE_DOCAI_FORM: _bbox_docai,
+    ExtractionMethod.GOOGLE_DOCAI_LAYOUT: _bbox_docai,
+    ExtractionMethod.AZURE_READ: _bbox_azure,
+    ExtractionMethod.AZURE_LAYOUT: _bbox_azure,
+}
+
+# Polygon-based formats that extract_bboxes_batch reduces with NumPy
+_POLYGON_POINTS: Dict[ExtractionMethod, Callable[[Dict[str, Any]], List[Tuple[float, float]]]] = {
+    ExtractionMethod.GOOGLE_DOCAI_OCR: _docai_points,
+    ExtractionMethod.GOOGLE_DOCAI_FORM: _docai_points,
+    ExtractionMethod.GOOGLE_DOCAI_LAYOUT: _docai_points,
+    ExtractionMethod.AZURE_READ: _azure_points,
+    ExtractionMethod.AZURE_LAYOUT: _azure_points,
+}
+
+
+# Keys probed, in order, when no method-specific extractor finds a bbox
+GENERIC_BBOX_KEYS = ('bbox', 'bounding_box', 'boundingBox', 'geometry')
+
+
+def _bbox_generic(raw_data: Dict[str, Any]) -> Optional[BoundingBox]:
+    """Generic bbox extraction (create_bbox_from_dict handles bad values)."""
+    for bbox_key in GENERIC_BBOX_KEYS:
+        if bbox_key in raw_data:
+            return create_bbox_from_dict(raw_data[bbox_key])
+    return None
+
+
+def _with_generic_fallback(
+    extractor: Callable[[Dict[str, Any]], Optional[BoundingBox]]
+) -> Callable[[Dict[str, Any]], Optional[BoundingBox]]:
+    """Wrap a method-specific extractor so that it falls back to _bbox_generic."""
+    def extract(raw_data: Dict[str, Any]) -> Optional[BoundingBox]:
+        # Only malformed extractor payloads are expected to fail here
+        try:
+            bbox = extractor(raw_data)
+        except (KeyError, IndexError, TypeError, ValueError, AttributeError) as e:
+            logger.warning(f"Failed to extract bbox from raw data: {e}")
+            return None
+        if bbox is not None:
+            return bbox
+        return _bbox_generic(raw_data)
+    
+    return extract
+
+
+@functools.lru_cache(maxsize=None)
+def get_bbox_extractor(
+    method: ExtractionMethod
+) -> Callable[[Dict[str, Any]], Optional[BoundingBox]]:
+    """
+    Get the bbox extraction function for a method.
+    
+    Callers that extract many bboxes for one method can look the function up
+    once and call it per item instead of going through
+    extract_bbox_from_raw_data each time.
+    
+    Args:
+        method: Extraction method
+        
+    Returns:
+        Function mapping raw extractor data to a BoundingBox or None
+    """
+    extractor = _BBOX_EXTRACTORS.get(method)
+    if extractor is None:
+        return _bbox_generic
+    return _with_generic_fallback(extractor)
+
+
 def extract_bbox_from_raw_data(
     raw_data: Dict[str, Any],
     method: ExtractionMethod
@@ -229,53 +441,58 @@ def extract_bbox_from_raw_data(
     Returns:
         BoundingBox if found, None otherwise
     """
-    try:
-        if method == ExtractionMethod.PDFPLUMBER:
-            # pdfplumber uses 'bbox' key
-            if 'bbox' in raw_data:
-                bbox = raw_data['bbox']
-                if isinstance(bbox, (list, tuple)) and len(bbox) == 4:
-                    return BoundingBox(x0=bbox[0], y0=bbox[1], x1=bbox[2], y1=bbox[3])
-        
-        elif method == ExtractionMethod.AWS_TEXTRACT:
-            # Textract uses 'Geometry' -> 'BoundingBox'
-            if 'Geometry' in raw_data and 'BoundingBox' in raw_data['Geometry']:
-                bbox = raw_data['Geometry']['BoundingBox']
-                return create_bbox_from_dict(bbox)
-        
-        elif method in [ExtractionMethod.GOOGLE_DOCAI_OCR, ExtractionMethod.GOOGLE_DOCAI_FORM, ExtractionMethod.GOOGLE_DOCAI_LAYOUT]:
-            # Document AI uses 'boundingPoly' or 'boundingBox'
-            if 'boundingPoly' in raw_data:
-                # Convert polygon to bbox
-                vertices = raw_data['boundingPoly'].get('vertices', [])
-                if vertices:
-                    x_coords = [v.get('x', 0) for v in vertices]
-                    y_coords = [v.get('y', 0) for v in vertices]
-                    return BoundingBox(
-                        x0=min(x_coords), y0=min(y_coords),
-                        x1=max(x_coords), y1=max(y_coords)
-                    )
-        
-        elif method == ExtractionMethod.AZURE_DOCINTEL:
-            # Azure uses 'boundingRegions'
-            if 'boundingRegions' in raw_data and raw_data['boundingRegions']:
-                region = raw_data['boundingRegions'][0]  # Take first region
-                if 'polygon' in region:
-                    polygon = region['polygon']
-                    x_coords = [p['x'] for p in polygon]
-                    y_coords = [p['y'] for p in polygon]
-                    return BoundingBox(
-                        x0=min(x_coords), y0=min(y_coords),
-                        x1=max(x_coords), y1=max(y_coords)
-                    )
-        
-        # Generic bbox extraction
-        for bbox_key in ['bbox', 'bounding_box', 'boundingBox', 'geometry']:
-            if bbox_key in raw_data:
-                return create_bbox_from_dict(raw_data[bbox_key])
+    return get_bbox_extractor(method)(raw_data)
+
+
+def extract_bboxes_batch(
+    raw_items: List[Dict[str, Any]],
+    method: ExtractionMethod
+) -> np.ndarray:
+    """
+    Extract bounding boxes for many raw items at once.
+    
+    For Document AI and Azure the polygon vertices of all items are flattened
+    into one array and reduced per item with NumPy instead of walking each
+    polygon in Python. Other methods, and items without a polygon, go through
+    the method's get_bbox_extractor function.
+    
+    Args:
+        raw_items: Raw data from extractor, one dict per element
+        method: Extraction method
         
-        return None
+    Returns:
+        float64 array of shape (N, 4) holding (x0, y0, x1, y1) rows, NaN where
+        no bbox was found; build BoundingBox objects only for the rows needed
+    """
+    bboxes = np.full((len(raw_items), 4), np.nan)
+    points_fn = _POLYGON_POINTS.get(method)
+    
+    if points_fn is not None and raw_items:
+        points: List[Tuple[float, float]] = []
+        counts = np.empty(len(raw_items), dtype=np.intp)
+        for i, raw_data in enumerate(raw_items):
+            item_points = points_fn(raw_data)
+            counts[i] = len(item_points)
+            points.extend(item_points)
         
-    except Exception as e:
-        logger.warning(f"Failed to extract bbox from raw data: {e}")
-        return None
+        has_polygon = counts > 0
+        if points:
+            coords = np.asarray(points, dtype=np.float64)
+            # Empty polygons add no vertices, so the remaining starts are
+            # strictly increasing and reduceat sees one segment per item
+            starts = (np.cumsum(counts) - counts)[has_polygon]
+            bboxes[has_polygon, 0] = np.minimum.reduceat(coords[:, 0], starts)
+            bboxes[has_polygon, 1] = np.minimum.reduceat(coords[:, 1], starts)
+            bboxes[has_polygon, 2] = np.maximum.reduceat(coords[:, 0], starts)
+            bboxes[has_polygon, 3] = np.maximum.reduceat(coords[:, 1], starts)
+        remaining = np.flatnonzero(~has_polygon)
+    else:
+        remaining = range(len(raw_items))
+    
+    bbox_fn = get_bbox_extractor(method)
+    for i in remaining:
+        bbox = bbox_fn(raw_items[i])
+        if bbox is not None:
+            bboxes[i] = (bbox.x0, bbox.y0, bbox.x1, bbox.y1)
+    
+    return bboxes
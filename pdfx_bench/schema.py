@@ -3,12 +3,44 @@ Pydantic models for PDFX-Bench canonical schema.
 All extractors normalize their outputs to these models.
 """
 
-from typing import List, Optional, Dict, Any, Union
-from pydantic import BaseModel, Field, validator
+from typing import List, Optional, Dict, Any, Tuple, Union
+from pydantic import BaseModel, Field, PrivateAttr, validator, model_validator
 from enum import Enum
 import re
 
 
+# Number pattern for table cells (optional sign, thousands separators, decimals)
+_NUMBER = re.compile(r'[-+]?(?:\d{1,3}(?:,\d{3})*|\d+)(?:\.\d+)?')
+
+
+def parse_number_text(raw_text: str) -> Optional[float]:
+    """Extract the first number from cell text (currency/percent signs ignored)."""
+    if not raw_text:
+        return None
+        
+    # Try to extract number from text
+    match = _NUMBER.search(raw_text.replace('$', '').replace('%', ''))
+    if match:
+        try:
+            return float(match.group().replace(',', ''))
+        except ValueError:
+            pass
+    return None
+
+
+def parse_numbers_batch(texts: List[str]) -> List[Optional[float]]:
+    """
+    Parse the first number of each of many cell texts.
+    
+    Args:
+        texts: Cell texts
+        
+    Returns:
+        Parsed number (or None) for each text
+    """
+    return [parse_number_text(text) for text in texts]
+
+
 class ExtractionMethod(str, Enum):
     """Supported extraction methods."""
     PDFPLUMBER = "pdfplumber"
@@ -35,17 +67,15 @@ class BoundingBox(BaseModel):
     x1: float = Field(..., description="Right coordinate")
     y1: float = Field(..., description="Bottom coordinate")
     
-    @validator('x1')
-    def x1_greater_than_x0(cls, v, values):
-        if 'x0' in values and v <= values['x0']:
+    @model_validator(mode='after')
+    def check_extent(self):
+        # One post-validation check instead of two per-field validators;
+        # bounding boxes are built once per word/cell
+        if self.x1 <= self.x0:
             raise ValueError('x1 must be greater than x0')
-        return v
-    
-    @validator('y1')
-    def y1_greater_than_y0(cls, v, values):
-        if 'y0' in values and v <= values['y0']:
+        if self.y1 <= self.y0:
             raise ValueError('y1 must be greater than y0')
-        return v
+        return self
 
 
 class Provenance(BaseModel):
@@ -86,19 +116,62 @@ class TableCell(BaseModel):
         if v is not None:
             return v
         
-        raw_text = values.get('raw_text', '')
-        if not raw_text:
-            return None
-            
-        # Try to extract number from text
-        number_pattern = r'[-+]?(?:\d{1,3}(?:,\d{3})*|\d+)(?:\.\d+)?'
-        match = re.search(number_pattern, raw_text.replace('$', '').replace('%', ''))
-        if match:
-            try:
-                return float(match.group().replace(',', ''))
-            except ValueError:
-                pass
-        return None
+        return parse_number_text(values.get('raw_text', ''))
+    
+    @classmethod
+    def fast(
+        cls,
+        raw_text: str,
+        row_idx: int,
+        col_idx: int,
+        provenance: Provenance,
+        is_header: bool = False
+    ) -> 'TableCell':
+        """
+        Build a cell from already-valid values without running validation.
+        
+        For adapters whose indices come from enumerate() and whose text is
+        already a str. Untrusted input (LLM output, JSON ingest) must use the
+        constructor.
+        
+        The result equals ``cls(...)`` with the same arguments: parsed_number
+        stays None there too, since the validator does not run on an omitted
+        field. DataNormalizer fills it from the cleaned text, so cells built
+        here must go through the normalizer before scoring or export.
+        """
+        return cls.model_construct(
+            raw_text=raw_text,
+            row_idx=row_idx,
+            col_idx=col_idx,
+            is_header=is_header,
+            provenance=provenance
+        )
+
+
+class _CellIndex:
+    """
+    Derived cell lookups held by a Table: the (row, col) -> cell index and the
+    row/column counts.
+    
+    Compares equal to any other index so that building it never changes Table
+    equality, and pickles empty since it is rebuilt on demand.
+    """
+    __slots__ = ('index', 'rows', 'cols', 'source', 'size')
+    
+    def __init__(self):
+        self.index: Optional[Dict[Tuple[int, int], TableCell]] = None
+        self.rows = 0
+        self.cols = 0
+        self.source: Optional[List[TableCell]] = None
+        self.size = 0
+    
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _CellIndex)
+    
+    __hash__ = None
+    
+    def __reduce__(self):
+        return (_CellIndex, ())
 
 
 class Table(BaseModel):
@@ -108,22 +181,71 @@ class Table(BaseModel):
     caption: Optional[str] = Field(None, description="Table caption if available")
     provenance: Provenance = Field(..., description="Table-level provenance")
     
+    # rows/cols/get_cell cache; see _get_cell_cache for when it is refreshed
+    _cell_index: _CellIndex = PrivateAttr(default_factory=_CellIndex)
+    
+    def __copy__(self) -> 'Table':
+        # model_copy() shallow-copies private attributes; give the copy its own
+        # cache so it and the original do not keep invalidating a shared one
+        copied = super().__copy__()
+        copied._cell_index = _CellIndex()
+        return copied
+    
     @property
     def rows(self) -> int:
         """Number of rows in the table."""
-        return max((cell.row_idx for cell in self.cells), default=-1) + 1
+        return self._get_cell_cache().rows
     
     @property
     def cols(self) -> int:
         """Number of columns in the table."""
-        return max((cell.col_idx for cell in self.cells), default=-1) + 1
+        return self._get_cell_cache().cols
     
     def get_cell(self, row: int, col: int) -> Optional[TableCell]:
         """Get cell at specific row/column."""
-        for cell in self.cells:
-            if cell.row_idx == row and cell.col_idx == col:
-                return cell
-        return None
+        cache = self._get_cell_cache()
+        if cache.index is None:
+            index: Dict[Tuple[int, int], TableCell] = {}
+            for cell in self.cells:
+                index.setdefault((cell.row_idx, cell.col_idx), cell)
+            cache.index = index
+        return cache.index.get((row, col))
+    
+    def invalidate_cell_cache(self) -> None:
+        """
+        Drop the cached rows/cols and get_cell lookup.
+        
+        Call this after editing ``cells`` in place without changing its length
+        (e.g. ``table.cells[i] = other_cell``) or after changing a cell's
+        row_idx/col_idx; those edits cannot be detected automatically.
+        """
+        self._cell_index = _CellIndex()
+    
+    def _get_cell_cache(self) -> _CellIndex:
+        """
+        Row/column counts and (row, col) lookup, computed on first use.
+        
+        Recomputed automatically when ``cells`` is reassigned or changes
+        length (append/extend/del); other in-place edits need an explicit
+        invalidate_cell_cache(). The lookup is built lazily by get_cell and
+        keeps the first cell for duplicate positions, like the linear scan it
+        replaces.
+        """
+        cells = self.cells
+        cache = self._cell_index
+        if cache.source is not cells or cache.size != len(cells):
+            max_row = max_col = -1
+            for cell in cells:
+                if cell.row_idx > max_row:
+                    max_row = cell.row_idx
+                if cell.col_idx > max_col:
+                    max_col = cell.col_idx
+            cache.index = None
+            cache.rows = max_row + 1
+            cache.cols = max_col + 1
+            cache.source = cells
+            cache.size = len(cells)
+        return cache
 
 
 class KeyValue(BaseModel):
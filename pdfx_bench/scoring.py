@@ -5,8 +5,9 @@ Calculate quality metrics and heuristics for extracted data.
 
 import logging
 import re
+from itertools import chain
 from typing import Dict, Any, List, Optional, Tuple
-from collections import defaultdict
+import numpy as np
 from .schema import Document, Table, TableCell, ExtractionResult, ExtractionMethod
 from .utils.timers import time_operation
 
@@ -16,13 +17,29 @@ logger = logging.getLogger(__name__)
 class QualityScorer:
     """Calculate quality metrics for extraction results."""
     
-    def __init__(self):
-        self.currency_pattern = re.compile(r'[\$€£¥]?\s*\d{1,3}(?:,\d{3})*(?:\.\d{2})?')
-        self.date_patterns = [
-            re.compile(r'\d{1,2}[/-]\d{1,2}[/-]\d{2,4}'),
-            re.compile(r'\d{4}[/-]\d{1,2}[/-]\d{1,2}'),
-            re.compile(r'\b\d{1,2}\s+(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{2,4}\b', re.IGNORECASE)
-        ]
+    # Compiled once for the class; scorers keep no per-instance state
+    currency_pattern = re.compile(r'[\$€£¥]?\s*\d{1,3}(?:,\d{3})*(?:\.\d{2})?')
+    date_patterns = [
+        re.compile(r'\d{1,2}[/-]\d{1,2}[/-]\d{2,4}'),
+        re.compile(r'\d{4}[/-]\d{1,2}[/-]\d{1,2}'),
+        re.compile(r'\b\d{1,2}\s+(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{2,4}\b', re.IGNORECASE)
+    ]
+    # Any-date check in one search; date_patterns[0] and [1] still classify
+    # the format, since the MDY pattern also matches inside ISO dates
+    date_pattern = re.compile(
+        '|'.join(f'(?:{pattern.pattern})' for pattern in date_patterns),
+        re.IGNORECASE
+    )
+    # Numeric cell check: drop currency/grouping symbols, then match what
+    # float() accepts (digits with optional '_' separators, exponent, inf/nan)
+    _numeric_strip = re.compile(r'[\$€£¥,\s%]')
+    _numeric_shape = re.compile(
+        r'[-+]?(?:(?:\d(?:_?\d)*(?:\.(?:\d(?:_?\d)*)?)?|\.\d(?:_?\d)*)'
+        r'(?:[eE][-+]?\d(?:_?\d)*)?|inf(?:inity)?|nan)',
+        re.IGNORECASE
+    )
+    # ASCII bytes that are not letters, deleted to count letters in ASCII text
+    _ascii_non_alpha = bytes(c for c in range(128) if not chr(c).isalpha())
     
     def score_extraction_result(self, result: ExtractionResult) -> Dict[str, Any]:
         """
@@ -98,36 +115,37 @@ class QualityScorer:
         
         total_rows = 0
         total_cols = 0
-        header_cells = 0
-        total_cells = 0
-        numeric_cells = 0
-        parsed_numeric_cells = 0
-        all_cell_texts = []
-        
         for table in tables:
             if table.cells:
                 total_rows += table.rows
                 total_cols += table.cols
-                
-                for cell in table.cells:
-                    total_cells += 1
-                    all_cell_texts.append(cell.raw_text.strip().lower())
-                    
-                    if cell.is_header:
-                        header_cells += 1
-                    
-                    # Check if cell looks numeric
-                    if self._is_numeric_text(cell.raw_text):
-                        numeric_cells += 1
-                        if cell.parsed_number is not None:
-                            parsed_numeric_cells += 1
+        
+        # Flatten cells once and reduce per-cell flags as arrays
+        cells = [cell for table in tables for cell in table.cells]
+        total_cells = len(cells)
+        raw_texts = [cell.raw_text for cell in cells]
+        all_cell_texts = [text.strip().lower() for text in raw_texts]
+        
+        is_header = np.fromiter((cell.is_header for cell in cells), dtype=bool, count=total_cells)
+        has_number = np.fromiter(
+            (cell.parsed_number is not None for cell in cells), dtype=bool, count=total_cells
+        )
+        # Check if cell looks numeric (once per distinct text; tables repeat a lot)
+        numeric_texts = {text: self._is_numeric_text(text) for text in set(raw_texts)}
+        is_numeric = np.fromiter(
+            map(numeric_texts.__getitem__, raw_texts), dtype=bool, count=total_cells
+        )
+        
+        header_cells = int(np.count_nonzero(is_header))
+        numeric_cells = int(np.count_nonzero(is_numeric))
+        parsed_numeric_cells = int(np.count_nonzero(is_numeric & has_number))
         
         # Calculate duplicate rate
         unique_texts = set(all_cell_texts)
         duplicate_rate = 1 - (len(unique_texts) / max(len(all_cell_texts), 1))
         
         # Calculate completeness (non-empty cells)
-        non_empty_cells = sum(1 for text in all_cell_texts if text)
+        non_empty_cells = total_cells - all_cell_texts.count('')
         completeness_score = non_empty_cells / max(total_cells, 1)
         empty_cell_rate = 1 - completeness_score
 
@@ -197,10 +215,8 @@ class QualityScorer:
                     currency_values.append(text)
                 
                 # Check for date values
-                for pattern in self.date_patterns:
-                    if pattern.search(text):
-                        date_values.append(text)
-                        break
+                if self.date_pattern.search(text):
+                    date_values.append(text)
         
         # Calculate consistency scores
         if numeric_values:
@@ -222,11 +238,12 @@ class QualityScorer:
         
         if date_values:
             # Check date format consistency
+            mdy_pattern, ymd_pattern = self.date_patterns[0], self.date_patterns[1]
             formats = set()
             for value in date_values:
-                if re.search(r'\d{1,2}[/-]\d{1,2}[/-]\d{2,4}', value):
+                if mdy_pattern.search(value):
                     formats.add('MDY')
-                elif re.search(r'\d{4}[/-]\d{1,2}[/-]\d{1,2}', value):
+                elif ymd_pattern.search(value):
                     formats.add('YMD')
             metrics['date_format_consistency'] = 1.0 if len(formats) <= 1 else 0.5
         
@@ -237,25 +254,22 @@ class QualityScorer:
     
     def _calculate_confidence_metrics(self, result: ExtractionResult) -> Dict[str, Any]:
         """Calculate confidence-related metrics."""
-        confidences = []
-        
-        # Collect all confidence scores
-        for table in result.document.tables:
-            if table.provenance.confidence is not None:
-                confidences.append(table.provenance.confidence)
-            for cell in table.cells:
-                if cell.provenance.confidence is not None:
-                    confidences.append(cell.provenance.confidence)
-        
-        for text_block in result.document.text_blocks:
-            if text_block.provenance.confidence is not None:
-                confidences.append(text_block.provenance.confidence)
-        
-        for kv in result.document.key_values:
-            if kv.provenance.confidence is not None:
-                confidences.append(kv.provenance.confidence)
-        
-        if not confidences:
+        document = result.document
+        
+        # Collect all confidence scores into one array
+        provenances = chain(
+            (table.provenance for table in document.tables),
+            (cell.provenance for table in document.tables for cell in table.cells),
+            (text_block.provenance for text_block in document.text_blocks),
+            (kv.provenance for kv in document.key_values)
+        )
+        confidences = np.fromiter(
+            (provenance.confidence for provenance in provenances
+             if provenance.confidence is not None),
+            dtype=np.float64
+        )
+        
+        if not confidences.size:
             return {
                 'has_confidence_scores': False,
                 'avg_confidence': None,
@@ -264,17 +278,12 @@ class QualityScorer:
                 'low_confidence_rate': 0
             }
         
-        avg_conf = sum(confidences) / len(confidences)
-        min_conf = min(confidences)
-        max_conf = max(confidences)
-        low_conf_count = sum(1 for c in confidences if c < 0.8)
-        
         return {
             'has_confidence_scores': True,
-            'avg_confidence': avg_conf,
-            'min_confidence': min_conf,
-            'max_confidence': max_conf,
-            'low_confidence_rate': low_conf_count / len(confidences)
+            'avg_confidence': float(confidences.mean()),
+            'min_confidence': float(confidences.min()),
+            'max_confidence': float(confidences.max()),
+            'low_confidence_rate': np.count_nonzero(confidences < 0.8) / confidences.size
         }
     
     def _calculate_overall_score(
@@ -321,17 +330,9 @@ class QualityScorer:
     
     def _is_numeric_text(self, text: str) -> bool:
         """Check if text represents a numeric value."""
-        if not text.strip():
-            return False
-        
         # Remove common non-numeric characters
-        cleaned = re.sub(r'[\$€£¥,\s%]', '', text.strip())
-        
-        try:
-            float(cleaned)
-            return True
-        except ValueError:
-            return False
+        cleaned = self._numeric_strip.sub('', text)
+        return self._numeric_shape.fullmatch(cleaned) is not None
     
     def _is_readable_text(self, text: str) -> bool:
         """Check if text appears to be readable content."""
@@ -339,7 +340,10 @@ class QualityScorer:
             return False
         
         # Check for reasonable character distribution
-        letters = sum(1 for c in text if c.isalpha())
+        if text.isascii():
+            letters = len(text.encode('ascii').translate(None, self._ascii_non_alpha))
+        else:
+            letters = sum(map(str.isalpha, text))
         total_chars = len(text)
         
         # At least 50% letters for readable text
@@ -351,31 +355,34 @@ class QualityScorer:
             if table.rows < 3 or table.cols < 3:
                 continue  # Too small for sum validation
             
-            # Look for potential sum rows/columns
-            numeric_cells = defaultdict(list)
+            # Dense value matrix; present marks cells with a parsed number
+            numeric_cells = [cell for cell in table.cells if cell.parsed_number is not None]
+            if not numeric_cells:
+                continue
             
-            for cell in table.cells:
-                if cell.parsed_number is not None:
-                    numeric_cells[(cell.row_idx, cell.col_idx)] = cell.parsed_number
+            count = len(numeric_cells)
+            row_idx = np.fromiter((cell.row_idx for cell in numeric_cells), dtype=np.intp, count=count)
+            col_idx = np.fromiter((cell.col_idx for cell in numeric_cells), dtype=np.intp, count=count)
+            values = np.zeros((table.rows, table.cols))
+            present = np.zeros((table.rows, table.cols), dtype=bool)
+            values[row_idx, col_idx] = [cell.parsed_number for cell in numeric_cells]
+            present[row_idx, col_idx] = True
             
-            # Check last row for potential sums
-            last_row = table.rows - 1
-            for col in range(table.cols):
-                if (last_row, col) in numeric_cells:
-                    # Sum values in this column (excluding last row)
-                    column_sum = sum(
-                        numeric_cells.get((row, col), 0)
-                        for row in range(last_row)
-                    )
-                    last_value = numeric_cells[(last_row, col)]
-                    
-                    # Check if last value is approximately the sum
-                    if abs(column_sum - last_value) / max(abs(last_value), 1) < 0.1:
-                        return True
+            # Check last row for potential sums: is any last-row value
+            # approximately the sum of the values above it in its column?
+            column_sums = values[:-1].sum(axis=0)
+            last_values = values[-1]
+            close = np.abs(column_sums - last_values) / np.maximum(np.abs(last_values), 1) < 0.1
+            if np.any(close & present[-1]):
+                return True
         
         return False
 
 
+# Shared scorer for compare_extraction_results (stateless, so safe across threads)
+_DEFAULT_SCORER = QualityScorer()
+
+
 def compare_extraction_results(results: List[ExtractionResult]) -> Dict[str, Any]:
     """
     Compare multiple extraction results and identify the best performers.
@@ -389,7 +396,7 @@ def compare_extraction_results(results: List[ExtractionResult]) -> Dict[str, Any
     if not results:
         return {}
     
-    scorer = QualityScorer()
+    scorer = _DEFAULT_SCORER
     scored_results = []
     
     # Score each result
@@ -6,11 +6,41 @@ import os
 import json
 import csv
 from pathlib import Path
-from typing import List, Dict, Any, Union
+from typing import Iterable, List, Dict, Any, Union
 import logging
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+if ORJSON_AVAILABLE:
+    # Hand datetimes/dataclasses to json_default so output matches the json
+    # module; numpy values are written as plain numbers and lists
+    ORJSON_OPTIONS = (
+        orjson.OPT_NON_STR_KEYS
+        | orjson.OPT_PASSTHROUGH_DATETIME
+        | orjson.OPT_PASSTHROUGH_DATACLASS
+        | orjson.OPT_SERIALIZE_NUMPY
+    )
+
+
+def json_default(value: Any) -> Any:
+    """
+    ``default`` hook for the JSON encoders.
+    
+    numpy scalars and arrays (anything with ``tolist``) become native
+    numbers and lists, as orjson's OPT_SERIALIZE_NUMPY writes them; other
+    values fall back to ``str``.
+    """
+    tolist = getattr(value, 'tolist', None)
+    if callable(tolist):
+        return tolist()
+    return str(value)
+
 
 def ensure_dir(path: Union[str, Path]) -> Path:
     """Ensure directory exists, create if it doesn't."""
@@ -38,9 +68,7 @@ def find_pdf_files(input_path: Union[str, Path]) -> List[Path]:
             raise ValueError(f"File {input_path} is not a PDF")
     
     elif input_path.is_dir():
-        pdf_files = []
-        for pdf_file in input_path.rglob("*.pdf"):
-            pdf_files.append(pdf_file)
+        pdf_files = [Path(path) for path in _walk_pdf_paths(str(input_path))]
         
         if not pdf_files:
             logger.warning(f"No PDF files found in directory {input_path}")
@@ -51,26 +79,65 @@ def find_pdf_files(input_path: Union[str, Path]) -> List[Path]:
         raise FileNotFoundError(f"Path {input_path} does not exist")
 
 
+def _walk_pdf_paths(directory: str) -> List[str]:
+    """
+    Recursively collect .pdf paths (case-insensitive) below a directory.
+    
+    Uses os.scandir so file/directory checks come from the cached directory
+    entry and names are filtered by extension before any stat. Symlinked
+    directories are not followed, which also avoids cycles.
+    """
+    pdf_paths = []
+    pending = [directory]
+    
+    while pending:
+        try:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                    elif entry.name.lower().endswith('.pdf') and entry.is_file():
+                        pdf_paths.append(entry.path)
+        except OSError as e:
+            logger.warning(f"Cannot scan directory: {e}")
+    
+    return pdf_paths
+
+
 def save_json(data: Any, file_path: Union[str, Path], indent: int = 2) -> None:
-    """Save data as JSON file."""
+    """
+    Save data as JSON file.
+    
+    With orjson, non-finite floats (NaN, Infinity) are written as null; the
+    json module writes them as the non-standard NaN/Infinity literals.
+    """
     file_path = Path(file_path)
     ensure_dir(file_path.parent)
     
-    with open(file_path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=indent, ensure_ascii=False, default=str)
+    if ORJSON_AVAILABLE and indent == 2:
+        with open(file_path, 'wb') as f:
+            f.write(orjson.dumps(data, option=ORJSON_OPTIONS | orjson.OPT_INDENT_2, default=json_default))
+    else:
+        with open(file_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=indent, ensure_ascii=False, default=json_default)
     
     logger.debug(f"Saved JSON to {file_path}")
 
 
-def save_jsonl(data: List[Dict[str, Any]], file_path: Union[str, Path]) -> None:
-    """Save data as JSONL (JSON Lines) file."""
+def encode_jsonl_line(item: Any) -> bytes:
+    """Encode one record as a UTF-8 JSON line (newline included); NaN is null under orjson, as in save_json."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(item, option=ORJSON_OPTIONS | orjson.OPT_APPEND_NEWLINE, default=json_default)
+    return (json.dumps(item, ensure_ascii=False, default=json_default) + '\n').encode('utf-8')
+
+
+def save_jsonl(data: Iterable[Dict[str, Any]], file_path: Union[str, Path]) -> None:
+    """Save data as JSONL (JSON Lines) file; data may be a generator, encoded one record at a time."""
     file_path = Path(file_path)
     ensure_dir(file_path.parent)
     
-    with open(file_path, 'w', encoding='utf-8') as f:
-        for item in data:
-            json.dump(item, f, ensure_ascii=False, default=str)
-            f.write('\n')
+    with open(file_path, 'wb', buffering=1 << 20) as f:
+        f.writelines(encode_jsonl_line(item) for item in data)
     
     logger.debug(f"Saved JSONL to {file_path}")
 
@@ -94,6 +161,17 @@ def save_csv(data: List[Dict[str, Any]], file_path: Union[str, Path]) -> None:
     logger.debug(f"Saved CSV to {file_path}")
 
 
+def _loads(raw: bytes) -> Any:
+    """
+    Parse UTF-8 JSON with orjson, falling back to the json module for input
+    orjson rejects but json accepts (NaN/Infinity, which json.dump writes).
+    """
+    try:
+        return orjson.loads(raw)
+    except orjson.JSONDecodeError:
+        return json.loads(raw.decode('utf-8').strip())
+
+
 def load_json(file_path: Union[str, Path]) -> Any:
     """Load data from JSON file."""
     file_path = Path(file_path)
@@ -101,6 +179,10 @@ def load_json(file_path: Union[str, Path]) -> Any:
     if not file_path.exists():
         raise FileNotFoundError(f"JSON file {file_path} not found")
     
+    if ORJSON_AVAILABLE:
+        with open(file_path, 'rb') as f:
+            return _loads(f.read())
+    
     with open(file_path, 'r', encoding='utf-8') as f:
         return json.load(f)
 
@@ -113,6 +195,14 @@ def load_jsonl(file_path: Union[str, Path]) -> List[Dict[str, Any]]:
         raise FileNotFoundError(f"JSONL file {file_path} not found")
     
     data = []
+    if ORJSON_AVAILABLE:
+        with open(file_path, 'rb') as f:
+            for line in f:
+                line = line.strip()
+                if line:
+                    data.append(_loads(line))
+        return data
+    
     with open(file_path, 'r', encoding='utf-8') as f:
         for line in f:
             line = line.strip()
@@ -131,9 +221,12 @@ def get_file_hash(file_path: Union[str, Path]) -> str:
     """Get SHA-256 hash of file."""
     import hashlib
     
-    hash_sha256 = hashlib.sha256()
     with open(file_path, "rb") as f:
-        for chunk in iter(lambda: f.read(4096), b""):
+        if hasattr(hashlib, 'file_digest'):  # Python 3.11+
+            return hashlib.file_digest(f, 'sha256').hexdigest()
+        
+        hash_sha256 = hashlib.sha256()
+        for chunk in iter(lambda: f.read(1 << 20), b""):
             hash_sha256.update(chunk)
     
     return hash_sha256.hexdigest()
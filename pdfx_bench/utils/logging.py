@@ -5,17 +5,33 @@ Logging utilities for PDFX-Bench.
 import logging
 import json
 import sys
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Dict, Any, Optional
 from pathlib import Path
+from .io import ORJSON_AVAILABLE, json_default
+
+if ORJSON_AVAILABLE:
+    import orjson
+    from .io import ORJSON_OPTIONS
 
 
 class JSONFormatter(logging.Formatter):
     """JSON formatter for structured logging."""
     
+    # Standard LogRecord attributes; everything else is an extra field
+    RESERVED_ATTRS = frozenset({
+        'name', 'msg', 'args', 'levelname', 'levelno', 'pathname',
+        'filename', 'module', 'lineno', 'funcName', 'created',
+        'msecs', 'relativeCreated', 'thread', 'threadName',
+        'processName', 'process', 'getMessage', 'exc_info',
+        'exc_text', 'stack_info'
+    })
+    
     def format(self, record: logging.LogRecord) -> str:
+        # Use the record's creation time rather than reading the clock again
+        timestamp = datetime.fromtimestamp(record.created, timezone.utc).replace(tzinfo=None)
         log_entry = {
-            'timestamp': datetime.utcnow().isoformat() + 'Z',
+            'timestamp': timestamp.isoformat() + 'Z',
             'level': record.levelname,
             'logger': record.name,
             'message': record.getMessage(),
@@ -29,15 +45,22 @@ class JSONFormatter(logging.Formatter):
             log_entry['exception'] = self.formatException(record.exc_info)
         
         # Add extra fields
-        for key, value in record.__dict__.items():
-            if key not in ['name', 'msg', 'args', 'levelname', 'levelno', 'pathname',
-                          'filename', 'module', 'lineno', 'funcName', 'created',
-                          'msecs', 'relativeCreated', 'thread', 'threadName',
-                          'processName', 'process', 'getMessage', 'exc_info',
-                          'exc_text', 'stack_info']:
-                log_entry[key] = value
+        reserved = self.RESERVED_ATTRS
+        log_entry.update(
+            (key, value) for key, value in record.__dict__.items() if key not in reserved
+        )
         
-        return json.dumps(log_entry, default=str)
+        # orjson cannot escape non-ASCII text like json.dumps does, so lines
+        # that need it (and values orjson rejects, e.g. integers beyond 64
+        # bits) go through the json module to keep console output ASCII-safe
+        if ORJSON_AVAILABLE:
+            try:
+                encoded = orjson.dumps(log_entry, option=ORJSON_OPTIONS, default=json_default)
+            except orjson.JSONEncodeError:
+                encoded = None
+            if encoded is not None and encoded.isascii():
+                return encoded.decode('ascii')
+        return json.dumps(log_entry, default=json_default)
 
 
 def setup_logging(
@@ -102,9 +102,13 @@ class PerformanceTracker:
     
     def record(self, operation: str, duration: float) -> None:
         """Record a timing measurement."""
-        if operation not in self.metrics:
-            self.metrics[operation] = []
-        self.metrics[operation].append(duration)
+        # setdefault keeps this safe when methods run in parallel threads
+        self.metrics.setdefault(operation, []).append(duration)
+    
+    def merge(self, metrics: Dict[str, list]) -> None:
+        """Add measurements recorded by another tracker (e.g. in a worker process)."""
+        for operation, durations in metrics.items():
+            self.metrics.setdefault(operation, []).extend(durations)
     
     def get_stats(self, operation: str) -> Dict[str, float]:
         """Get statistics for an operation."""
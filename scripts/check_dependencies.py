@@ -16,8 +16,7 @@ class DependencyChecker:
         self.results = {
             'tesseract': {'available': False, 'version': None, 'path': None},
             'poppler': {'available': False, 'version': None, 'path': None},
-            'pytesseract': {'available': False, 'version': None},
-            'pdf2image': {'available': False, 'version': None}
+            'pytesseract': {'available': False, 'version': None}
         }
     
     def check_tesseract(self):
@@ -76,20 +75,6 @@ class DependencyChecker:
             self.results['pytesseract'] = {'available': False, 'version': None}
             return False
     
-    def check_pdf2image(self):
-        """Check if pdf2image Python package is available."""
-        try:
-            import pdf2image
-            version = getattr(pdf2image, '__version__', 'Unknown version')
-            self.results['pdf2image'] = {
-                'available': True,
-                'version': version
-            }
-            return True
-        except ImportError:
-            self.results['pdf2image'] = {'available': False, 'version': None}
-            return False
-    
     def check_all(self):
         """Check all dependencies."""
         print("Checking PDFX-Bench OCR dependencies...")
@@ -101,13 +86,12 @@ class DependencyChecker:
         
         # Check Python dependencies
         pytesseract_ok = self.check_pytesseract()
-        pdf2image_ok = self.check_pdf2image()
         
         # Print results
         self.print_results()
         
         # Return overall status
-        return all([tesseract_ok, poppler_ok, pytesseract_ok, pdf2image_ok])
+        return all([tesseract_ok, poppler_ok, pytesseract_ok])
     
     def print_results(self):
         """Print dependency check results."""
@@ -143,8 +127,6 @@ class DependencyChecker:
                 print("• Poppler: Required for PDF to image conversion")
             if 'pytesseract' in missing_deps:
                 print("• pytesseract: Python wrapper for Tesseract")
-            if 'pdf2image' in missing_deps:
-                print("• pdf2image: Python library for PDF to image conversion")
             
             print("\nInstallation Options:")
             print("-" * 20)
@@ -154,7 +136,7 @@ class DependencyChecker:
             print("2. Manual installation:")
             print("   - Tesseract: https://github.com/UB-Mannheim/tesseract/wiki")
             print("   - Poppler: https://github.com/oschwartz10612/poppler-windows/releases")
-            print("   - Python packages: pip install pytesseract pdf2image")
+            print("   - Python packages: pip install pytesseract")
         else:
             print("All dependencies are available!")
     
@@ -162,10 +144,8 @@ class DependencyChecker:
         """Get availability status for web interface."""
         return {
             'tesseract_available': self.results['tesseract']['available'] and
-                                 self.results['pytesseract']['available'] and
-                                 self.results['pdf2image']['available'],
-            'poppler_available': self.results['poppler']['available'] and
-                               self.results['pdf2image']['available'],
+                                 self.results['pytesseract']['available'],
+            'poppler_available': self.results['poppler']['available'],
             'details': self.results
         }
 
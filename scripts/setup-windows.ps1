@@ -155,7 +155,7 @@ if (-not $SkipPython) {
     Write-Host "`nInstalling Python dependencies..." -ForegroundColor Cyan
     
     try {
-        python -m pip install pytesseract pdf2image
+        python -m pip install pytesseract
         Write-Host "Python dependencies installed successfully" -ForegroundColor Green
     } catch {
         Write-Host "Failed to install Python dependencies: $($_.Exception.Message)" -ForegroundColor Red
@@ -199,15 +199,4 @@ try {
     Write-Host "pytesseract: Not available" -ForegroundColor Red
 }
 
-try {
-    python -c "import pdf2image; print('pdf2image: Available')" 2>$null
-    if ($LASTEXITCODE -eq 0) {
-        Write-Host "pdf2image: Available" -ForegroundColor Green
-    } else {
-        Write-Host "pdf2image: Not available" -ForegroundColor Red
-    }
-} catch {
-    Write-Host "pdf2image: Not available" -ForegroundColor Red
-}
-
 Write-Host "`nIf any components show as 'Not found' or 'Not available', please restart your terminal and try again." -ForegroundColor Yellow
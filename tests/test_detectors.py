@@ -0,0 +1,81 @@
+"""
+Tests for pdfx_bench.detectors.
+"""
+
+import fitz
+import pytest
+
+from pdfx_bench.detectors import _page_stats, parse_page_range, validate_pdf
+
+
+def test_page_stats_counts_default_text():
+    with fitz.open() as doc:
+        page = doc.new_page()
+        page.insert_text((72, 72), "ofﬁce   flow\t\tend   ")
+        page.insert_text((72, 100), "  second line")
+        doc.new_page()
+
+        assert _page_stats(doc, 0) == (len(doc[0].get_text().strip()), 0)
+        assert _page_stats(doc, 1) == (0, 0)
+
+
+def test_parse_page_range_all_pages():
+    assert parse_page_range(None, 3) == [1, 2, 3]
+    assert parse_page_range("", 2) == [1, 2]
+
+
+def test_parse_page_range_sorts_and_deduplicates():
+    assert parse_page_range("7, 2-4,3 , 1-1,4", 10) == [1, 2, 3, 4, 7]
+    assert parse_page_range("1-5", 5) == [1, 2, 3, 4, 5]
+
+
+@pytest.mark.parametrize("spec", ["0", "6", "3-2", "4-6", "0-1", "a", "1-"])
+def test_parse_page_range_rejects_invalid(spec):
+    with pytest.raises(ValueError):
+        parse_page_range(spec, 5)
+
+
+def make_pdf(path, pages=1):
+    with fitz.open() as doc:
+        for _ in range(pages):
+            doc.new_page()
+        doc.save(path)
+    return path
+
+
+def test_validate_pdf_accepts_real_pdf(tmp_path):
+    pdf_path = make_pdf(tmp_path / "doc.pdf")
+    assert validate_pdf(pdf_path)
+    assert validate_pdf(pdf_path, strict=True)
+
+
+def test_validate_pdf_finds_header_and_trailer_past_padding(tmp_path):
+    pdf_path = make_pdf(tmp_path / "doc.pdf")
+    padded = tmp_path / "padded.pdf"
+    # Junk before the header (within the first 1 KB) and after %%EOF
+    padded.write_bytes(b"\0" * 500 + pdf_path.read_bytes() + b"\n" * 500)
+    assert validate_pdf(padded)
+
+
+def test_validate_pdf_rejects_bad_files(tmp_path):
+    not_pdf = tmp_path / "text.pdf"
+    not_pdf.write_bytes(b"hello" * 1000)
+    assert not validate_pdf(not_pdf)
+
+    truncated = tmp_path / "truncated.pdf"
+    truncated.write_bytes(make_pdf(tmp_path / "doc.pdf").read_bytes()[:-20])
+    assert not validate_pdf(truncated)
+
+    late_header = tmp_path / "late.pdf"
+    late_header.write_bytes(b" " * 2048 + (tmp_path / "doc.pdf").read_bytes())
+    assert not validate_pdf(late_header)
+
+    assert not validate_pdf(tmp_path / "missing.pdf")
+
+
+def test_validate_pdf_strict_opens_the_document(tmp_path):
+    # Header and trailer present, but no readable document in between
+    broken = tmp_path / "broken.pdf"
+    broken.write_bytes(b"%PDF-1.7\ngarbage\n%%EOF\n")
+    assert validate_pdf(broken)
+    assert not validate_pdf(broken, strict=True)
@@ -0,0 +1,99 @@
+"""
+Tests for ResultExporter table output.
+"""
+
+import csv
+
+import pytest
+
+from pdfx_bench.exporters import ResultExporter
+from pdfx_bench.schema import (
+    BoundingBox, Document, ExtractionMethod, ExtractionResult, Provenance, Table, TableCell
+)
+from pdfx_bench.utils.io import save_csv
+
+
+def make_result():
+    bbox = BoundingBox(x0=10.0, y0=20.5, x1=30.0, y1=40.0)
+    cells = [
+        TableCell(
+            raw_text="Amount", row_idx=0, col_idx=0, is_header=True,
+            provenance=Provenance(method=ExtractionMethod.PDFPLUMBER, page=1, bbox=bbox, confidence=1.0)
+        ),
+        TableCell(
+            raw_text='1,000 "net", total', row_idx=1, col_idx=0, parsed_number=1000.0,
+            provenance=Provenance(method=ExtractionMethod.PDFPLUMBER, page=1)
+        ),
+    ]
+    table = Table(
+        cells=cells, table_id="t1",
+        provenance=Provenance(method=ExtractionMethod.PDFPLUMBER, page=1)
+    )
+    document = Document(id="doc", file_name="doc.pdf", page_count=1, tables=[table])
+    return ExtractionResult(
+        document=document, method=ExtractionMethod.PDFPLUMBER, success=True, processing_time=0.1
+    )
+
+
+def legacy_csv_rows(result):
+    """Per-cell row dicts, as the exporter built them before the columnar rewrite."""
+    rows = []
+    for table in result.document.tables:
+        for cell in table.cells:
+            bbox = cell.provenance.bbox
+            rows.append({
+                'table_id': table.table_id,
+                'row': cell.row_idx,
+                'col': cell.col_idx,
+                'text': cell.raw_text,
+                'is_header': cell.is_header,
+                'parsed_number': cell.parsed_number,
+                'parsed_date': cell.parsed_date,
+                'page': cell.provenance.page,
+                'confidence': cell.provenance.confidence,
+                'bbox_x0': bbox.x0 if bbox else None,
+                'bbox_y0': bbox.y0 if bbox else None,
+                'bbox_x1': bbox.x1 if bbox else None,
+                'bbox_y1': bbox.y1 if bbox else None
+            })
+    return rows
+
+
+def test_tables_csv_matches_save_csv(tmp_path):
+    result = make_result()
+    with ResultExporter(tmp_path / "out") as exporter:
+        exported = exporter.export_extraction_result(result, "doc")
+
+    expected_path = tmp_path / "expected.csv"
+    save_csv(legacy_csv_rows(result), expected_path)
+    assert exported['tables_csv'].read_bytes() == expected_path.read_bytes()
+
+    with open(exported['tables_csv'], newline='', encoding='utf-8') as f:
+        header, data = list(csv.DictReader(f))
+    assert header['is_header'] == 'True'
+    assert header['bbox_y0'] == '20.5'
+    assert data['text'] == '1,000 "net", total'
+    assert data['parsed_number'] == '1000.0'
+    assert data['confidence'] == ''
+
+
+def test_tables_parquet_keeps_values(tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    result = make_result()
+    with ResultExporter(tmp_path / "out") as exporter:
+        exported = exporter.export_extraction_result(result, "doc", table_format='parquet')
+
+    assert pq.read_table(exported['tables_parquet']).to_pylist() == legacy_csv_rows(result)
+
+
+def test_writer_pool_is_shared_and_closed(tmp_path):
+    result = make_result()
+    with ResultExporter(tmp_path / "out") as exporter:
+        pool = exporter._pool
+        first = exporter.export_extraction_result(result, "a")
+        second = exporter.export_extraction_result(result, "b")
+        assert exporter._pool is pool
+    assert all(path.exists() for path in [*first.values(), *second.values()])
+
+    with pytest.raises(RuntimeError):
+        pool.submit(print)
@@ -0,0 +1,98 @@
+"""
+Tests for pdfx_bench.utils.io.
+"""
+
+import json
+import math
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from pdfx_bench.utils import io
+
+
+RECORD = {
+    'text': 'Café total',
+    'page': np.int64(3),
+    'confidence': np.float64(0.5),
+    'values': np.array([1.5, 2.0]),
+    'raw': [[1, 'a', None]],
+    'created': datetime(2024, 1, 2, 3, 4, 5),
+    7: 'non-string key',
+}
+
+
+def write_both(tmp_path, monkeypatch, data):
+    """Write data with orjson and with the json module; return both files' bytes."""
+    fast_path = tmp_path / 'orjson.json'
+    io.save_json(data, fast_path)
+    monkeypatch.setattr(io, 'ORJSON_AVAILABLE', False)
+    slow_path = tmp_path / 'json.json'
+    io.save_json(data, slow_path)
+    return fast_path.read_bytes(), slow_path.read_bytes()
+
+
+@pytest.mark.skipif(not io.ORJSON_AVAILABLE, reason="orjson not installed")
+def test_save_json_matches_json_module(tmp_path, monkeypatch):
+    fast, slow = write_both(tmp_path, monkeypatch, RECORD)
+    assert json.loads(fast) == json.loads(slow)
+
+    loaded = json.loads(fast)
+    assert loaded['page'] == 3
+    assert loaded['values'] == [1.5, 2.0]
+    assert loaded['created'] == '2024-01-02 03:04:05'
+
+
+@pytest.mark.skipif(not io.ORJSON_AVAILABLE, reason="orjson not installed")
+def test_encode_jsonl_line_matches_json_module(monkeypatch):
+    fast = io.encode_jsonl_line(RECORD)
+    monkeypatch.setattr(io, 'ORJSON_AVAILABLE', False)
+    slow = io.encode_jsonl_line(RECORD)
+    assert fast.endswith(b'\n') and slow.endswith(b'\n')
+    assert json.loads(fast) == json.loads(slow)
+
+
+@pytest.mark.skipif(not io.ORJSON_AVAILABLE, reason="orjson not installed")
+def test_nan_is_written_as_null_by_orjson(tmp_path, monkeypatch):
+    fast, slow = write_both(tmp_path, monkeypatch, {'value': float('nan')})
+    assert json.loads(fast) == {'value': None}
+    assert b'NaN' in slow
+    # load_json still reads the json module's NaN literal
+    assert math.isnan(io.load_json(tmp_path / 'json.json')['value'])
+
+
+def test_find_pdf_files_matches_extension_case_insensitively(tmp_path):
+    (tmp_path / 'nested' / 'deeper').mkdir(parents=True)
+    (tmp_path / 'Folder.PDF').mkdir()
+    for name in ['a.pdf', 'B.PDF', 'nested/c.Pdf', 'nested/deeper/d.pdf',
+                 'notes.txt', 'archive.pdf.bak', 'Folder.PDF/e.pDF']:
+        (tmp_path / name).write_bytes(b'%PDF-1.7')
+
+    found = io.find_pdf_files(tmp_path)
+    assert found == sorted(found)
+    assert [path.relative_to(tmp_path).as_posix() for path in found] == [
+        'B.PDF', 'Folder.PDF/e.pDF', 'a.pdf', 'nested/c.Pdf', 'nested/deeper/d.pdf'
+    ]
+
+
+def test_find_pdf_files_single_file(tmp_path):
+    pdf_path = tmp_path / 'Report.PDF'
+    pdf_path.write_bytes(b'%PDF-1.7')
+    assert io.find_pdf_files(pdf_path) == [pdf_path]
+
+    text_path = tmp_path / 'report.txt'
+    text_path.write_text('x')
+    with pytest.raises(ValueError):
+        io.find_pdf_files(text_path)
+
+
+def test_walk_pdf_paths_does_not_follow_directory_symlinks(tmp_path):
+    (tmp_path / 'real').mkdir()
+    (tmp_path / 'real' / 'a.pdf').write_bytes(b'%PDF-1.7')
+    try:
+        (tmp_path / 'loop').symlink_to(tmp_path, target_is_directory=True)
+    except OSError:
+        pytest.skip("symlinks not supported")
+
+    assert io._walk_pdf_paths(str(tmp_path)) == [str(tmp_path / 'real' / 'a.pdf')]
@@ -0,0 +1,44 @@
+"""
+Tests for create_provenance and the --drop-raw-data switch.
+"""
+
+import pytest
+
+from pdfx_bench.adapters.amazon_textract_adapter import AmazonTextractAdapter
+from pdfx_bench.provenance import set_keep_raw_data
+from pdfx_bench.schema import ExtractionMethod
+
+LINE_BLOCK = {
+    'Id': 'line-1', 'BlockType': 'LINE', 'Text': 'Total', 'Confidence': 98.0, 'Page': 2,
+    'Geometry': {'BoundingBox': {'Left': 0.1, 'Top': 0.2, 'Width': 0.3, 'Height': 0.05}}
+}
+
+
+@pytest.fixture
+def textract():
+    # Skip __init__, which needs boto3 and AWS credentials
+    adapter = AmazonTextractAdapter.__new__(AmazonTextractAdapter)
+    adapter.method = ExtractionMethod.AMAZON_TEXTRACT_DETECT
+    return adapter
+
+
+@pytest.fixture
+def drop_raw_data():
+    set_keep_raw_data(False)
+    yield
+    set_keep_raw_data(True)
+
+
+def test_textract_line_provenance(textract):
+    (block,) = textract._extract_text_blocks([LINE_BLOCK])
+    provenance = block.provenance
+    assert provenance.method == ExtractionMethod.AMAZON_TEXTRACT_DETECT
+    assert provenance.page == 2
+    assert provenance.confidence == pytest.approx(0.98)
+    assert (provenance.bbox.x0, provenance.bbox.y1) == (0.1, pytest.approx(0.25))
+    assert provenance.raw_data == {'block_id': 'line-1', 'block_type': 'LINE'}
+
+
+def test_textract_respects_drop_raw_data(textract, drop_raw_data):
+    (block,) = textract._extract_text_blocks([LINE_BLOCK])
+    assert block.provenance.raw_data is None
@@ -0,0 +1,101 @@
+"""
+Tests for the schema models: TableCell.fast and the Table cell cache.
+"""
+
+import copy
+import pickle
+
+from pdfx_bench.normalize import DataNormalizer
+from pdfx_bench.schema import Document, ExtractionMethod, Provenance, Table, TableCell
+
+
+PROVENANCE = Provenance(method=ExtractionMethod.PDFPLUMBER, page=1)
+
+
+def make_cell(row, col, text="x"):
+    return TableCell(raw_text=text, row_idx=row, col_idx=col, provenance=PROVENANCE)
+
+
+def make_table(cells):
+    return Table(cells=cells, table_id="t", provenance=PROVENANCE)
+
+
+def test_rows_cols_and_get_cell():
+    table = make_table([make_cell(0, 0, "a"), make_cell(2, 1, "b"), make_cell(2, 1, "dup")])
+    assert (table.rows, table.cols) == (3, 2)
+    # Duplicate positions keep the first cell, like a linear scan
+    assert table.get_cell(2, 1).raw_text == "b"
+    assert table.get_cell(1, 1) is None
+
+
+def test_empty_table():
+    table = make_table([])
+    assert (table.rows, table.cols) == (0, 0)
+    assert table.get_cell(0, 0) is None
+
+
+def test_cache_follows_append_and_reassignment():
+    table = make_table([make_cell(0, 0)])
+    assert table.rows == 1
+
+    table.cells.append(make_cell(4, 3))
+    assert (table.rows, table.cols) == (5, 4)
+    assert table.get_cell(4, 3) is table.cells[-1]
+
+    table.cells = [make_cell(1, 7)]
+    assert (table.rows, table.cols) == (2, 8)
+    assert table.get_cell(0, 0) is None
+
+
+def test_in_place_replacement_needs_invalidate():
+    table = make_table([make_cell(0, 0), make_cell(1, 0), make_cell(2, 0)])
+    assert table.rows == 3
+    assert table.get_cell(0, 0) is table.cells[0]
+
+    table.cells[0] = make_cell(5, 0)
+    table.invalidate_cell_cache()
+    assert table.rows == 6
+    assert table.get_cell(0, 0) is None
+    assert table.get_cell(5, 0) is table.cells[0]
+
+
+def test_copies_do_not_share_the_cache():
+    table = make_table([make_cell(0, 0), make_cell(1, 1)])
+    assert table.rows == 2
+
+    shallow = table.model_copy()
+    updated = table.model_copy(update={"cells": [make_cell(9, 9)]})
+    deep = copy.deepcopy(table)
+    for other in (shallow, updated, deep):
+        assert other._cell_index is not table._cell_index
+
+    assert updated.rows == 10
+    assert table.rows == 2
+    assert shallow == table == deep
+
+
+def test_cache_does_not_affect_equality_or_pickling():
+    table = make_table([make_cell(0, 0), make_cell(1, 2)])
+    fresh = make_table([make_cell(0, 0), make_cell(1, 2)])
+    table.get_cell(1, 2)
+    assert table == fresh
+
+    restored = pickle.loads(pickle.dumps(table))
+    assert restored == table
+    assert (restored.rows, restored.cols) == (2, 3)
+
+
+def test_fast_cell_matches_constructor_and_is_filled_by_normalizer():
+    texts = ["$1,234.50", "12%", "-7", "n/a", ""]
+    fast_cells = []
+    for row, text in enumerate(texts):
+        fast = TableCell.fast(raw_text=text, row_idx=row, col_idx=0, provenance=PROVENANCE, is_header=True)
+        validated = TableCell(raw_text=text, row_idx=row, col_idx=0, provenance=PROVENANCE, is_header=True)
+        assert fast == validated
+        assert fast.parsed_number is None
+        fast_cells.append(fast)
+
+    document = Document(id="d", file_name="d.pdf", page_count=1, tables=[make_table(fast_cells)])
+    result = DataNormalizer().normalize_extraction_result(document, ExtractionMethod.PDFPLUMBER, 0.0)
+    numbers = [cell.parsed_number for cell in result.document.tables[0].cells]
+    assert numbers == [1234.5, 12.0, -7.0, None, None]
@@ -0,0 +1,79 @@
+"""
+Tests for grouping Tesseract image_to_data output into line text blocks.
+
+Runs on hand-built OCR data, so neither pytesseract nor the Tesseract
+binary is needed.
+"""
+
+import pytest
+
+from pdfx_bench.adapters.tesseract_ocr import TesseractOCRAdapter
+from pdfx_bench.schema import ExtractionMethod
+
+KEYS = ('level', 'block_num', 'par_num', 'line_num', 'left', 'top', 'width', 'height', 'conf', 'text')
+
+
+def ocr_data(*rows):
+    """Column-wise dict like pytesseract.image_to_data(output_type=DICT)."""
+    return {key: [row[i] for row in rows] for i, key in enumerate(KEYS)}
+
+
+def word(block, par, line, left, top, width, height, conf, text):
+    return (5, block, par, line, left, top, width, height, conf, text)
+
+
+def layout(level, block, par=0, line=0):
+    """Page/block/paragraph/line rows: no text and conf -1."""
+    return (level, block, par, line, 0, 0, 0, 0, '-1', '')
+
+
+@pytest.fixture
+def adapter():
+    # Skip __init__, which requires pytesseract and the tesseract binary
+    ocr_adapter = TesseractOCRAdapter.__new__(TesseractOCRAdapter)
+    ocr_adapter.method = ExtractionMethod.TESSERACT_OCR
+    return ocr_adapter
+
+
+def test_words_are_grouped_by_line(adapter):
+    data = ocr_data(
+        (1, 0, 0, 0, 0, 0, 600, 800, '-1', ''),
+        layout(2, 1), layout(3, 1, 1), layout(4, 1, 1, 1),
+        word(1, 1, 1, 10, 20, 40, 10, '90', 'Invoice'),
+        word(1, 1, 1, 55, 18, 30, 14, '96.5', ' total '),
+        word(1, 1, 1, 90, 20, 10, 10, '95', '   '),  # blank word, ignored
+        layout(4, 1, 1, 2),
+        word(1, 1, 2, 10, 40, 20, 10, '80', '$1,234'),
+        layout(2, 2), layout(3, 2, 1), layout(4, 2, 1, 1),
+        word(2, 1, 1, 10, 60, 20, 10, '70', 'Next'),
+        word(2, 1, 1, 35, 60, 20, 10, '-1', 'skipped'),  # no confidence
+    )
+
+    blocks = adapter._extract_text_blocks_from_ocr(data, page_num=2, image_size=(600, 800))
+
+    assert [block.text for block in blocks] == ['Invoice total', '$1,234', 'Next']
+    first = blocks[0].provenance
+    assert first.page == 2
+    assert first.method == ExtractionMethod.TESSERACT_OCR
+    assert (first.bbox.x0, first.bbox.y0, first.bbox.x1, first.bbox.y1) == (10, 18, 85, 32)
+    assert first.confidence == pytest.approx(0.9325)
+    assert first.raw_data == {'word_count': 2, 'avg_word_confidence': first.confidence}
+    assert blocks[2].provenance.raw_data['word_count'] == 1
+
+
+def test_low_confidence_lines_and_zero_area_boxes(adapter):
+    data = ocr_data(
+        word(1, 1, 1, 10, 10, 20, 10, '20', 'smudge'),
+        word(1, 1, 1, 40, 10, 20, 10, '35', 'noise'),  # line average 0.275 < 0.3
+        word(1, 1, 2, 10, 30, 0, 10, '99', 'thin'),  # zero width
+    )
+
+    blocks = adapter._extract_text_blocks_from_ocr(data, page_num=1, image_size=(100, 100))
+
+    assert [block.text for block in blocks] == ['thin']
+    assert blocks[0].provenance.bbox is None
+
+
+def test_no_words(adapter):
+    data = ocr_data((1, 0, 0, 0, 0, 0, 100, 100, '-1', ''), layout(2, 1))
+    assert adapter._extract_text_blocks_from_ocr(data, page_num=1, image_size=(100, 100)) == []
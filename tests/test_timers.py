@@ -0,0 +1,34 @@
+"""
+Tests for performance tracking, including timings from worker processes.
+"""
+
+from pdfx_bench import cli
+from pdfx_bench.utils.timers import PerformanceTracker, performance_tracker
+
+
+def test_merge_adds_durations():
+    tracker = PerformanceTracker()
+    tracker.record('extract_camelot', 1.0)
+    tracker.merge({'extract_camelot': [3.0], 'extract_tabula': [2.0]})
+
+    assert tracker.get_stats('extract_camelot') == {
+        'count': 2, 'total': 4.0, 'average': 2.0, 'min': 1.0, 'max': 3.0
+    }
+    assert tracker.get_stats('extract_tabula')['count'] == 1
+
+
+def test_worker_task_returns_its_own_timings(monkeypatch):
+    def fake_task(pdf_path, page_spec, options):
+        performance_tracker.record('extract_pdfplumber', 0.5)
+        return {'pdf_path': str(pdf_path)}
+
+    monkeypatch.setattr(cli, 'process_pdf_task', fake_task)
+    performance_tracker.clear()
+    try:
+        # Timings left over from an earlier task in the same worker are dropped
+        performance_tracker.record('extract_pdfplumber', 9.0)
+        summary, timings = cli.process_pdf_worker_task('a.pdf', None, {})
+        assert summary == {'pdf_path': 'a.pdf'}
+        assert timings == {'extract_pdfplumber': [0.5]}
+    finally:
+        performance_tracker.clear()
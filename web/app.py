@@ -144,7 +144,7 @@ def get_available_methods():
             elif method['id'] == 'poppler':
                 method['available'] = poppler_available
                 if not poppler_available:
-                    method['reason'] = 'Requires Poppler utilities and pdf2image installation'
+                    method['reason'] = 'Requires Poppler utilities installation'
 
     # Check Azure availability from environment variables
     azure_endpoint = os.getenv('AZURE_DOCUMENT_INTELLIGENCE_ENDPOINT')
@@ -264,28 +264,31 @@ def process_pdf_async(session_id: str, pdf_path: Path, methods: List[str], optio
         session_results_dir = RESULTS_FOLDER / session_id
         session_results_dir.mkdir(exist_ok=True)
 
-        exporter = ResultExporter(session_results_dir)
+        with ResultExporter(session_results_dir) as exporter:
+            # Export individual results
+            for method, result in results.items():
+                exporter.export_extraction_result(result, pdf_path.stem)
 
-        # Export individual results
-        for method, result in results.items():
-            exporter.export_extraction_result(result, pdf_path.stem)
-
-        # Export comparison if multiple methods
-        if len(results) > 1:
-            comparison_report_path = exporter.export_comparison_report(comparison, pdf_path.stem)
-            comparison_report = str(comparison_report_path)  # Convert Path to string for JSON serialization
-        else:
-            comparison_report = None
+            # Export comparison if multiple methods
+            if len(results) > 1:
+                comparison_report_path = exporter.export_comparison_report(comparison, pdf_path.stem)
+                comparison_report = str(comparison_report_path)  # Convert Path to string for JSON serialization
+            else:
+                comparison_report = None
 
-        # Calculate quality scores for each result
+        # Calculate quality scores for each result (reusing the comparison's
+        # scores when there is one instead of scoring every result again)
         from pdfx_bench.scoring import QualityScorer
         scorer = QualityScorer()
+        detailed_scores = comparison.get('detailed_scores', {})
 
         # Convert results to serializable format
         serializable_results = {}
         for method, result in results.items():
             # Calculate quality score for this result
-            quality_data = scorer.score_extraction_result(result)
+            quality_data = detailed_scores.get(result.method.value)
+            if quality_data is None:
+                quality_data = scorer.score_extraction_result(result)
             quality_score = quality_data.get('overall_score', 0.0)
 
             serializable_results[method] = {